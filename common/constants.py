@@ -27,6 +27,7 @@ TASK_FILE_FILTER = f"DrissionPage任务文件 (*{TASK_FILE_EXTENSION})"
 # 任务执行历史记录
 HISTORY_DIRECTORY = os.path.join(str(Path.home()), ".drission_gui_tool", "history")
 HISTORY_FILE_EXTENSION = ".dghist"  # DrissionPage GUI History
+MAX_HISTORY = 1000  # 每个任务保留的最大执行记录数
 
 # 数据文件类型
 CSV_FILE_FILTER = "CSV文件 (*.csv)"
@@ -12,6 +12,411 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Union, Tuple, Optional, Callable
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+
+
+# 导出CSV时的文件写缓冲区大小
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+
+# 模板占位符：{key} 或 {key|filter}
+_TEMPLATE_PLACEHOLDER_PATTERN = re.compile(r'{([^{}|]+)(?:\|([^{}]+))?}')
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template: str) -> Tuple[Tuple[str, Optional[str], Tuple[str, ...]], ...]:
+    """
+    将模板解析为 (前置文本, 键, 过滤器列表) 片段，同一模板只解析一次
+    
+    Args:
+        template: 包含占位符的模板字符串
+        
+    Returns:
+        片段元组，最后一个片段的键为None
+    """
+    segments = []
+    literal_start = 0
+    for match in _TEMPLATE_PLACEHOLDER_PATTERN.finditer(template):
+        key = match.group(1).strip()
+        filters = match.group(2).strip() if match.group(2) else None
+        
+        # 与替换文本不一致的占位符（如键两侧有空格）保持原样
+        placeholder = f"{{{key}}}" if not filters else f"{{{key}|{filters}}}"
+        if match.group(0) != placeholder:
+            continue
+        
+        filter_names = tuple(part.strip() for part in filters.split('|')) if filters else ()
+        segments.append((template[literal_start:match.start()], key, filter_names))
+        literal_start = match.end()
+    
+    segments.append((template[literal_start:], None, ()))
+    return tuple(segments)
+
+
+def _apply_template_filters(value: Any, filter_names: Tuple[str, ...]) -> Any:
+    """
+    依次对模板值应用过滤器
+    
+    Args:
+        value: 数据值
+        filter_names: 过滤器名称列表
+        
+    Returns:
+        过滤后的值
+    """
+    for filter_name in filter_names:
+        # 应用过滤器
+        if filter_name == 'upper':
+            value = str(value).upper()
+        elif filter_name == 'lower':
+            value = str(value).lower()
+        elif filter_name == 'capitalize':
+            value = str(value).capitalize()
+        elif filter_name == 'title':
+            value = str(value).title()
+        elif filter_name.startswith('default:'):
+            default_value = filter_name.split(':', 1)[1]
+            if value is None or value == '':
+                value = default_value
+        elif filter_name.startswith('date:'):
+            date_format = filter_name.split(':', 1)[1]
+            if isinstance(value, (datetime, str, int, float)):
+                try:
+                    if isinstance(value, str):
+                        # 尝试解析日期字符串
+                        value = datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+                    elif isinstance(value, (int, float)):
+                        # 尝试解析时间戳
+                        value = datetime.fromtimestamp(value)
+                    
+                    # 格式化日期
+                    value = value.strftime(date_format)
+                except Exception:
+                    value = f"无效的日期格式: {value}"
+        elif filter_name.startswith('slice:'):
+            slice_params = filter_name.split(':', 1)[1]
+            try:
+                params = slice_params.split(',')
+                if len(params) == 1:
+                    end = int(params[0])
+                    value = str(value)[:end]
+                elif len(params) == 2:
+                    start, end = int(params[0]), int(params[1])
+                    value = str(value)[start:end]
+            except Exception:
+                value = f"无效的切片参数: {slice_params}"
+    
+    return value
+
+
+# 清洗和验证规则中的正则表达式，按模式字符串缓存编译结果
+_RULE_PATTERN_CACHE: Dict[str, Any] = {}
+
+
+def _compile_rule_pattern(pattern: str) -> Any:
+    """
+    编译规则中的正则表达式，同一模式在多次执行和多个步骤之间只编译一次
+    
+    Args:
+        pattern: 正则表达式
+        
+    Returns:
+        编译后的正则对象，模式无效时抛出异常（不缓存）
+    """
+    compiled = _RULE_PATTERN_CACHE.get(pattern)
+    if compiled is None:
+        compiled = _RULE_PATTERN_CACHE[pattern] = re.compile(pattern)
+    return compiled
+
+
+def _make_string_cleaner(rule: Dict[str, Any], rule_type: str) -> Optional[Callable[[str], str]]:
+    """
+    生成字符串清洗函数，未知规则返回None
+    
+    Args:
+        rule: 清洗规则
+        rule_type: 小写的规则类型
+        
+    Returns:
+        作用于字符串值的清洗函数
+    """
+    if rule_type == "trim":
+        return str.strip
+    if rule_type == "replace":
+        from_str = rule.get("from", "")
+        to_str = rule.get("to", "")
+        return lambda value: value.replace(from_str, to_str)
+    if rule_type == "uppercase":
+        return str.upper
+    if rule_type == "lowercase":
+        return str.lower
+    if rule_type == "capitalize":
+        return str.capitalize
+    if rule_type == "regex_replace":
+        pattern = rule.get("pattern", "")
+        replacement = rule.get("replacement", "")
+        if not pattern:
+            return None
+        try:
+            compiled = _compile_rule_pattern(pattern)
+        except Exception:
+            return None
+        
+        def regex_replace(value: str) -> str:
+            try:
+                return compiled.sub(replacement, value)
+            except Exception:
+                return value
+        
+        return regex_replace
+    return None
+
+
+def _cast_to_int(value: Any) -> Any:
+    """转换为整数（先转为浮点数再取整），失败时保留原值"""
+    try:
+        return int(float(value))
+    except Exception:
+        return value
+
+
+def _cast_to_float(value: Any) -> Any:
+    """转换为浮点数，失败时保留原值"""
+    try:
+        return float(value)
+    except Exception:
+        return value
+
+
+def _cast_to_str(value: Any) -> Any:
+    """转换为字符串，失败时保留原值"""
+    try:
+        return str(value)
+    except Exception:
+        return value
+
+
+def _cast_to_bool(value: Any) -> Any:
+    """按清洗规则的约定转换布尔值，失败时保留原值"""
+    if isinstance(value, str):
+        return value.lower() in ("true", "1", "yes", "y")
+    try:
+        return bool(value)
+    except Exception:
+        return value
+
+
+# 类型转换规则：目标类型 -> 清洗函数
+# 每个值只经过一层函数调用，失败时在同一层保留原值
+_CAST_CLEANERS = {
+    "int": _cast_to_int,
+    "float": _cast_to_float,
+    "str": _cast_to_str,
+    "bool": _cast_to_bool
+}
+
+
+def _compile_cleaning_rule(rule: Dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+    """
+    将单条清洗规则编译为 值 -> 值 的函数，规则类型只解析一次
+    
+    Args:
+        rule: 清洗规则
+        
+    Returns:
+        清洗函数，规则不会改变值时返回None
+    """
+    rule_type = rule.get("type", "").lower()
+    
+    # 字符串处理规则只作用于字符串值
+    string_cleaner = _make_string_cleaner(rule, rule_type)
+    if string_cleaner is not None:
+        return lambda value: string_cleaner(value) if isinstance(value, str) else value
+    
+    # 类型转换规则，转换失败时保留原值
+    if rule_type == "cast":
+        return _CAST_CLEANERS.get(rule.get("to", ""))
+    
+    # 默认值规则
+    if rule_type == "default":
+        default_value = rule.get("value")
+        return lambda value: default_value if value is None or (isinstance(value, str) and not value) else value
+    
+    return None
+
+
+def _compile_cleaning_rules(cleaning_rules: Dict[str, List[Dict[str, Any]]]) -> List[Tuple[str, List[Callable[[Any], Any]]]]:
+    """
+    编译清洗规则，批量清洗时所有数据共用一份结果
+    
+    Args:
+        cleaning_rules: 清洗规则，格式为 {"字段名": [{"type": "规则类型", ...规则参数}]}
+        
+    Returns:
+        [(字段名, 按顺序执行的清洗函数列表)]
+    """
+    compiled = []
+    for field, rules in cleaning_rules.items():
+        cleaners = [cleaner for cleaner in map(_compile_cleaning_rule, rules) if cleaner is not None]
+        compiled.append((field, cleaners))
+    return compiled
+
+
+def _clean_with_compiled_rules(data: Dict[str, Any],
+                               compiled_rules: List[Tuple[str, List[Callable[[Any], Any]]]]) -> Dict[str, Any]:
+    """使用编译后的清洗规则清洗单条数据"""
+    result = data.copy()
+    
+    for field, cleaners in compiled_rules:
+        if field in result:
+            value = result[field]
+            for cleaner in cleaners:
+                value = cleaner(value)
+            result[field] = value
+    
+    return result
+
+
+def _is_empty_value(value: Any) -> bool:
+    """验证规则中的空值：None 或只包含空白的字符串"""
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+# 类型验证规则：期望类型 -> Python类型
+_TYPE_RULE_CLASSES = {
+    "string": str,
+    "number": (int, float),
+    "integer": int,
+    "boolean": bool,
+    "object": dict,
+    "array": list
+}
+
+
+def _compile_validation_rule(rule: Dict[str, Any], rule_type: str) -> Optional[Callable[[Any, Dict[str, Any]], bool]]:
+    """
+    将单条验证规则编译为 (值, 数据) -> 是否通过 的函数，只用于非空值
+    
+    Args:
+        rule: 验证规则
+        rule_type: 小写的规则类型
+        
+    Returns:
+        验证函数，规则对非空值不做检查时返回None
+    """
+    # 字符串长度规则
+    if rule_type == "min_length":
+        min_length = rule.get("value", 0)
+        return lambda value, data: not isinstance(value, str) or not len(value) < min_length
+    if rule_type == "max_length":
+        max_length = rule.get("value", float("inf"))
+        return lambda value, data: not isinstance(value, str) or not len(value) > max_length
+    if rule_type == "regex":
+        pattern = rule.get("pattern", "")
+        if not pattern:
+            return None
+        try:
+            compiled = _compile_rule_pattern(pattern)
+        except Exception:
+            # 无效的正则表达式对字符串值总是验证失败
+            return lambda value, data: not isinstance(value, str)
+        return lambda value, data: not isinstance(value, str) or bool(compiled.match(value))
+    
+    # 数值范围规则
+    if rule_type == "min":
+        min_value = rule.get("value", float("-inf"))
+        return lambda value, data: not isinstance(value, (int, float)) or not value < min_value
+    if rule_type == "max":
+        max_value = rule.get("value", float("inf"))
+        return lambda value, data: not isinstance(value, (int, float)) or not value > max_value
+    if rule_type == "range":
+        min_value = rule.get("min", float("-inf"))
+        max_value = rule.get("max", float("inf"))
+        return lambda value, data: not isinstance(value, (int, float)) or not (value < min_value or value > max_value)
+    
+    # 枚举验证规则
+    if rule_type == "enum":
+        allowed_values = rule.get("values", [])
+        return lambda value, data: value in allowed_values
+    
+    # 类型验证规则
+    if rule_type == "type":
+        expected_class = _TYPE_RULE_CLASSES.get(rule.get("value", ""))
+        if expected_class is None:
+            return lambda value, data: False
+        return lambda value, data: isinstance(value, expected_class)
+    
+    # 自定义验证规则，表达式只编译一次
+    if rule_type == "custom":
+        expression = rule.get("expression", "")
+        if not expression:
+            return None
+        try:
+            code = compile(expression, "<validation_rule>", "eval")
+        except Exception:
+            return lambda value, data: False
+        
+        def check_custom(value: Any, data: Dict[str, Any]) -> bool:
+            try:
+                # 构建安全的本地环境
+                return bool(eval(code, {"__builtins__": {}}, {"value": value, "data": data}))
+            except Exception:
+                return False
+        
+        return check_custom
+    
+    return None
+
+
+def _compile_validation_rules(validation_rules: Dict[str, List[Dict[str, Any]]]) -> List[Tuple[str, Optional[str], List[Tuple[Callable, str]]]]:
+    """
+    编译验证规则，批量验证时所有数据共用一份结果
+    
+    Args:
+        validation_rules: 验证规则，格式为 {"字段名": [{"type": "规则类型", ...规则参数}]}
+        
+    Returns:
+        [(字段名, 第一条必填规则的错误消息, [(验证函数, 错误消息)])]
+    """
+    compiled = []
+    for field, rules in validation_rules.items():
+        required_message = None
+        checks = []
+        for rule in rules:
+            rule_type = rule.get("type", "").lower()
+            error_message = rule.get("message", f"{field} 验证失败")
+            
+            if rule_type == "required":
+                if required_message is None:
+                    required_message = error_message
+                continue
+            
+            check = _compile_validation_rule(rule, rule_type)
+            if check is not None:
+                checks.append((check, error_message))
+        compiled.append((field, required_message, checks))
+    return compiled
+
+
+def _validate_with_compiled_rules(data: Dict[str, Any],
+                                  compiled_rules: List[Tuple[str, Optional[str], List[Tuple[Callable, str]]]]) -> Tuple[bool, List[str]]:
+    """使用编译后的验证规则验证单条数据"""
+    errors = []
+    
+    for field, required_message, checks in compiled_rules:
+        value = data.get(field)
+        
+        # 空值只检查必填规则，且只报告第一条必填规则的错误
+        if _is_empty_value(value):
+            if required_message is not None:
+                errors.append(required_message)
+            continue
+        
+        for check, error_message in checks:
+            if not check(value, data):
+                errors.append(error_message)
+    
+    return len(errors) == 0, errors
 
 
 class DataProcessor:
@@ -31,73 +436,23 @@ class DataProcessor:
         Returns:
             替换后的字符串
         """
-        result = template
-        
-        # 使用正则表达式查找 {key} 或 {key|filter} 格式的占位符
-        pattern = r'{([^{}|]+)(?:\|([^{}]+))?}'
-        
-        # 查找所有匹配项
-        matches = re.findall(pattern, template)
-        
-        for match in matches:
-            key = match[0].strip()
-            filters = match[1].strip() if len(match) > 1 and match[1] else None
+        # 模板按 (文本, 键, 过滤器) 片段预先解析并缓存，逐行应用时只做字典取值和拼接
+        parts = []
+        for literal, key, filter_names in _compile_template(template):
+            parts.append(literal)
+            if key is None:
+                continue
             
             # 获取数据值
             value = data.get(key)
             
             # 如果有过滤器，应用过滤器
-            if filters and value is not None:
-                filter_parts = filters.split('|')
-                for filter_part in filter_parts:
-                    filter_name = filter_part.strip()
-                    
-                    # 应用过滤器
-                    if filter_name == 'upper':
-                        value = str(value).upper()
-                    elif filter_name == 'lower':
-                        value = str(value).lower()
-                    elif filter_name == 'capitalize':
-                        value = str(value).capitalize()
-                    elif filter_name == 'title':
-                        value = str(value).title()
-                    elif filter_name.startswith('default:'):
-                        default_value = filter_name.split(':', 1)[1]
-                        if value is None or value == '':
-                            value = default_value
-                    elif filter_name.startswith('date:'):
-                        date_format = filter_name.split(':', 1)[1]
-                        if isinstance(value, (datetime, str, int, float)):
-                            try:
-                                if isinstance(value, str):
-                                    # 尝试解析日期字符串
-                                    value = datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
-                                elif isinstance(value, (int, float)):
-                                    # 尝试解析时间戳
-                                    value = datetime.fromtimestamp(value)
-                                
-                                # 格式化日期
-                                value = value.strftime(date_format)
-                            except Exception:
-                                value = f"无效的日期格式: {value}"
-                    elif filter_name.startswith('slice:'):
-                        slice_params = filter_name.split(':', 1)[1]
-                        try:
-                            params = slice_params.split(',')
-                            if len(params) == 1:
-                                end = int(params[0])
-                                value = str(value)[:end]
-                            elif len(params) == 2:
-                                start, end = int(params[0]), int(params[1])
-                                value = str(value)[start:end]
-                        except Exception:
-                            value = f"无效的切片参数: {slice_params}"
-            
-            # 替换占位符
-            placeholder = f"{{{key}}}" if not filters else f"{{{key}|{filters}}}"
-            result = result.replace(placeholder, str(value) if value is not None else '')
-            
-        return result
+            if filter_names and value is not None:
+                value = _apply_template_filters(value, filter_names)
+            
+            parts.append(str(value) if value is not None else '')
+        
+        return ''.join(parts)
     
     @staticmethod
     def clean_data(data: Dict[str, Any], cleaning_rules: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
@@ -111,66 +466,25 @@ class DataProcessor:
         Returns:
             清洗后的数据字典
         """
-        result = data.copy()
-        
-        for field, rules in cleaning_rules.items():
-            if field in result:
-                value = result[field]
-                
-                for rule in rules:
-                    rule_type = rule.get("type", "").lower()
-                    
-                    # 字符串处理规则
-                    if isinstance(value, str):
-                        if rule_type == "trim":
-                            value = value.strip()
-                        elif rule_type == "replace":
-                            from_str = rule.get("from", "")
-                            to_str = rule.get("to", "")
-                            value = value.replace(from_str, to_str)
-                        elif rule_type == "uppercase":
-                            value = value.upper()
-                        elif rule_type == "lowercase":
-                            value = value.lower()
-                        elif rule_type == "capitalize":
-                            value = value.capitalize()
-                        elif rule_type == "regex_replace":
-                            import re
-                            pattern = rule.get("pattern", "")
-                            replacement = rule.get("replacement", "")
-                            if pattern:
-                                try:
-                                    value = re.sub(pattern, replacement, value)
-                                except Exception:
-                                    pass
-                    
-                    # 类型转换规则
-                    if rule_type == "cast":
-                        cast_type = rule.get("to", "")
-                        try:
-                            if cast_type == "int":
-                                value = int(float(value))
-                            elif cast_type == "float":
-                                value = float(value)
-                            elif cast_type == "str":
-                                value = str(value)
-                            elif cast_type == "bool":
-                                if isinstance(value, str):
-                                    value = value.lower() in ("true", "1", "yes", "y")
-                                else:
-                                    value = bool(value)
-                        except Exception:
-                            pass
-                    
-                    # 默认值规则
-                    elif rule_type == "default":
-                        if value is None or (isinstance(value, str) and not value):
-                            value = rule.get("value")
-                
-                # 更新字段值
-                result[field] = value
+        return _clean_with_compiled_rules(data, _compile_cleaning_rules(cleaning_rules))
+    
+    @staticmethod
+    def clean_data_list(data_list: List[Any], cleaning_rules: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        使用同一套清洗规则批量清洗数据，规则只编译一次
         
-        return result
+        Args:
+            data_list: 数据列表，非字典项会被忽略
+            cleaning_rules: 清洗规则
+            
+        Returns:
+            清洗后的数据字典列表
+        """
+        compiled_rules = _compile_cleaning_rules(cleaning_rules)
+        return [
+            _clean_with_compiled_rules(item, compiled_rules)
+            for item in data_list if isinstance(item, dict)
+        ]
     
     @staticmethod
     def validate_data(data: Dict[str, Any], validation_rules: Dict[str, List[Dict[str, Any]]]) -> Tuple[bool, List[str]]:
@@ -184,110 +498,28 @@ class DataProcessor:
         Returns:
             (是否验证通过, 错误消息列表)
         """
-        errors = []
+        return _validate_with_compiled_rules(data, _compile_validation_rules(validation_rules))
+    
+    @staticmethod
+    def validate_data_list(data_list: List[Any],
+                           validation_rules: Dict[str, List[Dict[str, Any]]]) -> List[Tuple[int, Dict[str, Any], bool, List[str]]]:
+        """
+        使用同一套验证规则批量验证数据，规则只编译一次
         
-        for field, rules in validation_rules.items():
-            value = data.get(field)
+        Args:
+            data_list: 数据列表，非字典项会被忽略
+            validation_rules: 验证规则
             
-            for rule in rules:
-                rule_type = rule.get("type", "").lower()
-                error_message = rule.get("message", f"{field} 验证失败")
-                
-                # 必填规则
-                if rule_type == "required":
-                    if value is None or (isinstance(value, str) and not value.strip()):
-                        errors.append(error_message)
-                        break  # 如果必填验证失败，不再继续验证该字段的其他规则
-                
-                # 如果值为空且不是必填，则跳过其他验证
-                if value is None or (isinstance(value, str) and not value.strip()):
-                    continue
-                
-                # 字符串长度规则
-                if isinstance(value, str):
-                    if rule_type == "min_length":
-                        min_length = rule.get("value", 0)
-                        if len(value) < min_length:
-                            errors.append(error_message)
-                    
-                    elif rule_type == "max_length":
-                        max_length = rule.get("value", float("inf"))
-                        if len(value) > max_length:
-                            errors.append(error_message)
-                    
-                    elif rule_type == "regex":
-                        import re
-                        pattern = rule.get("pattern", "")
-                        if pattern:
-                            try:
-                                if not re.match(pattern, value):
-                                    errors.append(error_message)
-                            except Exception:
-                                errors.append(error_message)
-                
-                # 数值范围规则
-                if isinstance(value, (int, float)):
-                    if rule_type == "min":
-                        min_value = rule.get("value", float("-inf"))
-                        if value < min_value:
-                            errors.append(error_message)
-                    
-                    elif rule_type == "max":
-                        max_value = rule.get("value", float("inf"))
-                        if value > max_value:
-                            errors.append(error_message)
-                    
-                    elif rule_type == "range":
-                        min_value = rule.get("min", float("-inf"))
-                        max_value = rule.get("max", float("inf"))
-                        if value < min_value or value > max_value:
-                            errors.append(error_message)
-                
-                # 枚举验证规则
-                if rule_type == "enum":
-                    allowed_values = rule.get("values", [])
-                    if value not in allowed_values:
-                        errors.append(error_message)
-                
-                # 类型验证规则
-                elif rule_type == "type":
-                    expected_type = rule.get("value", "")
-                    valid = False
-                    
-                    if expected_type == "string" and isinstance(value, str):
-                        valid = True
-                    elif expected_type == "number" and isinstance(value, (int, float)):
-                        valid = True
-                    elif expected_type == "integer" and isinstance(value, int):
-                        valid = True
-                    elif expected_type == "boolean" and isinstance(value, bool):
-                        valid = True
-                    elif expected_type == "object" and isinstance(value, dict):
-                        valid = True
-                    elif expected_type == "array" and isinstance(value, list):
-                        valid = True
-                    
-                    if not valid:
-                        errors.append(error_message)
-                
-                # 自定义验证规则
-                elif rule_type == "custom":
-                    expression = rule.get("expression", "")
-                    if expression:
-                        try:
-                            # 构建安全的本地环境
-                            local_vars = {
-                                "value": value,
-                                "data": data
-                            }
-                            
-                            # 执行表达式
-                            if not eval(expression, {"__builtins__": {}}, local_vars):
-                                errors.append(error_message)
-                        except Exception:
-                            errors.append(error_message)
-        
-        return len(errors) == 0, errors
+        Returns:
+            [(数据在列表中的位置, 数据, 是否验证通过, 错误消息列表)]
+        """
+        compiled_rules = _compile_validation_rules(validation_rules)
+        results = []
+        for index, item in enumerate(data_list):
+            if isinstance(item, dict):
+                is_valid, errors = _validate_with_compiled_rules(item, compiled_rules)
+                results.append((index, item, is_valid, errors))
+        return results
     
     @staticmethod
     def batch_process(data_list: List[Dict[str, Any]], 
@@ -310,20 +542,24 @@ class DataProcessor:
         processed_invalid = []
         all_errors = []
         
+        # 清洗和验证规则对所有数据相同，只编译一次
+        compiled_cleaning_rules = _compile_cleaning_rules(cleaning_rules) if cleaning_rules else None
+        compiled_validation_rules = _compile_validation_rules(validation_rules) if validation_rules else None
+        
         for index, item in enumerate(data_list):
             # 深拷贝数据项
             processed_item = item.copy()
             
             # 应用清洗规则
-            if cleaning_rules:
-                processed_item = DataProcessor.clean_data(processed_item, cleaning_rules)
+            if compiled_cleaning_rules is not None:
+                processed_item = _clean_with_compiled_rules(processed_item, compiled_cleaning_rules)
             
             # 验证数据
             is_valid = True
             item_errors = []
             
-            if validation_rules:
-                is_valid, item_errors = DataProcessor.validate_data(processed_item, validation_rules)
+            if compiled_validation_rules is not None:
+                is_valid, item_errors = _validate_with_compiled_rules(processed_item, compiled_validation_rules)
                 
                 if not is_valid:
                     all_errors.append(f"第 {index + 1} 条数据验证失败: {'; '.join(item_errors)}")
@@ -372,11 +608,19 @@ class DataProcessor:
             
             fieldnames = sorted(list(all_fields))
             
-            # 写入CSV文件
-            with open(file_path, "w", newline="", encoding=encoding) as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(data)
+            # 字段列表是所有数据键的并集，直接按字段顺序取值，省去DictWriter逐行的字段校验；
+            # 所有数据字段齐全时用 itemgetter 在C层一次取出整行
+            field_count = len(fieldnames)
+            if field_count > 1 and all(len(item) == field_count for item in data):
+                rows = map(itemgetter(*fieldnames), data)
+            else:
+                rows = ([item.get(field, "") for field in fieldnames] for item in data)
+            
+            # 写入CSV文件，使用较大的写缓冲区
+            with open(file_path, "w", newline="", encoding=encoding, buffering=CSV_WRITE_BUFFER_SIZE) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(fieldnames)
+                writer.writerows(rows)
             
             return True, f"成功导出 {len(data)} 条数据到 {file_path}"
         
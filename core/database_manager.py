@@ -24,6 +24,7 @@ class DatabaseConnector:
         self.connection_params = connection_params
         self.connection = None
         self.is_connected = False
+        self.in_transaction = False  # 是否处于显式事务中，事务内的更新不自动提交
     
     def connect(self) -> Tuple[bool, str]:
         """
@@ -64,6 +65,94 @@ class DatabaseConnector:
         """
         raise NotImplementedError("子类必须实现此方法")
     
+    def execute_many(self, query: str, params_list: List[Any]) -> Tuple[bool, Union[int, str]]:
+        """
+        使用同一条语句批量执行更新操作（适用于DB-API兼容的SQL连接器）
+        
+        Args:
+            query: SQL更新语句
+            params_list: 每行的参数列表
+            
+        Returns:
+            (是否成功, 受影响行数或错误消息)
+        """
+        try:
+            if not self.is_connected:
+                success, message = self.connect()
+                if not success:
+                    return False, message
+            
+            cursor = self.connection.cursor()
+            cursor.executemany(query, params_list)
+            
+            if not self.in_transaction:
+                self.connection.commit()
+            affected_rows = cursor.rowcount
+            cursor.close()
+            
+            return True, affected_rows
+            
+        except Exception as e:
+            return False, f"批量执行更新失败: {str(e)}"
+    
+    def begin_transaction(self) -> Tuple[bool, str]:
+        """
+        开始显式事务，之后的更新在提交或回滚前不会自动提交
+        
+        Returns:
+            (是否成功, 消息)
+        """
+        try:
+            if not self.is_connected:
+                success, message = self.connect()
+                if not success:
+                    return False, message
+            
+            if self.in_transaction:
+                return False, "事务已开始，请先提交或回滚"
+            
+            self.in_transaction = True
+            return True, "事务已开始"
+            
+        except Exception as e:
+            return False, f"开始事务失败: {str(e)}"
+    
+    def commit(self) -> Tuple[bool, str]:
+        """
+        提交当前事务
+        
+        Returns:
+            (是否成功, 消息)
+        """
+        try:
+            if not self.is_connected:
+                return False, "数据库未连接"
+            
+            self.connection.commit()
+            self.in_transaction = False
+            return True, "事务已提交"
+            
+        except Exception as e:
+            return False, f"提交事务失败: {str(e)}"
+    
+    def rollback(self) -> Tuple[bool, str]:
+        """
+        回滚当前事务
+        
+        Returns:
+            (是否成功, 消息)
+        """
+        try:
+            if not self.is_connected:
+                return False, "数据库未连接"
+            
+            self.connection.rollback()
+            self.in_transaction = False
+            return True, "事务已回滚"
+            
+        except Exception as e:
+            return False, f"回滚事务失败: {str(e)}"
+    
     def test_connection(self) -> Tuple[bool, str]:
         """
         测试数据库连接
@@ -124,6 +213,7 @@ class MySQLConnector(DatabaseConnector):
         if self.connection and self.is_connected:
             self.connection.close()
             self.is_connected = False
+            self.in_transaction = False
     
     def execute_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> Tuple[bool, Union[List[Dict[str, Any]], str]]:
         """执行MySQL查询"""
@@ -163,7 +253,8 @@ class MySQLConnector(DatabaseConnector):
             else:
                 cursor.execute(query)
             
-            self.connection.commit()
+            if not self.in_transaction:
+                self.connection.commit()
             affected_rows = cursor.rowcount
             cursor.close()
             
@@ -177,6 +268,13 @@ class MySQLConnector(DatabaseConnector):
 class SQLiteConnector(DatabaseConnector):
     """SQLite数据库连接器"""
     
+    # 允许通过连接参数设置的日志模式和同步级别
+    JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+    SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+    
+    # 每个连接缓存的预编译语句数量，循环中重复执行的SQL直接复用
+    STATEMENT_CACHE_SIZE = 256
+    
     def connect(self) -> Tuple[bool, str]:
         """建立SQLite连接"""
         try:
@@ -186,9 +284,10 @@ class SQLiteConnector(DatabaseConnector):
             database_path = self.connection_params.get("database_path", ":memory:")
             
             # 建立连接
-            self.connection = sqlite3.connect(database_path)
+            self.connection = sqlite3.connect(database_path, cached_statements=self.STATEMENT_CACHE_SIZE)
             # 设置行工厂，返回字典格式结果
             self.connection.row_factory = sqlite3.Row
+            self._apply_pragmas()
             
             self.is_connected = True
             return True, "已成功连接到SQLite数据库"
@@ -198,11 +297,34 @@ class SQLiteConnector(DatabaseConnector):
         except Exception as e:
             return False, f"连接SQLite失败: {str(e)}"
     
+    def _apply_pragmas(self) -> None:
+        """
+        设置写入相关的PRAGMA
+        
+        默认使用 WAL 日志和 NORMAL 同步级别，循环写入时每次提交不再刷盘两次；
+        可通过连接参数 journal_mode、synchronous 调整，数据库不支持时保留原设置。
+        """
+        journal_mode = str(self.connection_params.get("journal_mode", "WAL")).upper()
+        synchronous = str(self.connection_params.get("synchronous", "NORMAL")).upper()
+        
+        pragmas = ["PRAGMA temp_store=MEMORY"]
+        if journal_mode in self.JOURNAL_MODES:
+            pragmas.append(f"PRAGMA journal_mode={journal_mode}")
+        if synchronous in self.SYNCHRONOUS_LEVELS:
+            pragmas.append(f"PRAGMA synchronous={synchronous}")
+        
+        for pragma in pragmas:
+            try:
+                self.connection.execute(pragma)
+            except Exception as e:
+                logging.getLogger("DatabaseManager").warning(f"设置 {pragma} 失败: {str(e)}")
+    
     def disconnect(self) -> None:
         """关闭SQLite连接"""
         if self.connection:
             self.connection.close()
             self.is_connected = False
+            self.in_transaction = False
     
     def execute_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> Tuple[bool, Union[List[Dict[str, Any]], str]]:
         """执行SQLite查询"""
@@ -250,7 +372,8 @@ class SQLiteConnector(DatabaseConnector):
             else:
                 cursor.execute(query)
             
-            self.connection.commit()
+            if not self.in_transaction:
+                self.connection.commit()
             affected_rows = cursor.rowcount
             cursor.close()
             
@@ -299,6 +422,7 @@ class PostgreSQLConnector(DatabaseConnector):
         if self.connection:
             self.connection.close()
             self.is_connected = False
+            self.in_transaction = False
     
     def execute_query(self, query: str, params: Optional[Dict[str, Any]] = None) -> Tuple[bool, Union[List[Dict[str, Any]], str]]:
         """执行PostgreSQL查询"""
@@ -339,7 +463,8 @@ class PostgreSQLConnector(DatabaseConnector):
             else:
                 cursor.execute(query)
             
-            self.connection.commit()
+            if not self.in_transaction:
+                self.connection.commit()
             affected_rows = cursor.rowcount
             cursor.close()
             
@@ -834,6 +959,88 @@ class DatabaseManager:
             # SQL数据库
             return connector.execute_update(query, params)
     
+    def execute_many(self, connection_id: str, query: str, params_list: List[Any]) -> Tuple[bool, Union[int, str]]:
+        """
+        使用同一条SQL语句批量执行更新
+        
+        Args:
+            connection_id: 连接标识
+            query: SQL更新语句
+            params_list: 每行的参数列表
+            
+        Returns:
+            (是否成功, 受影响行数或错误消息)
+        """
+        connector, message = self._get_sql_connector(connection_id)
+        if connector is None:
+            return False, message
+        
+        return connector.execute_many(query, params_list)
+    
+    def begin_transaction(self, connection_id: str) -> Tuple[bool, str]:
+        """
+        在指定连接上开始事务
+        
+        Args:
+            connection_id: 连接标识
+            
+        Returns:
+            (是否成功, 消息)
+        """
+        connector, message = self._get_sql_connector(connection_id)
+        if connector is None:
+            return False, message
+        
+        return connector.begin_transaction()
+    
+    def commit(self, connection_id: str) -> Tuple[bool, str]:
+        """
+        提交指定连接上的事务
+        
+        Args:
+            connection_id: 连接标识
+            
+        Returns:
+            (是否成功, 消息)
+        """
+        connector, message = self._get_sql_connector(connection_id)
+        if connector is None:
+            return False, message
+        
+        return connector.commit()
+    
+    def rollback(self, connection_id: str) -> Tuple[bool, str]:
+        """
+        回滚指定连接上的事务
+        
+        Args:
+            connection_id: 连接标识
+            
+        Returns:
+            (是否成功, 消息)
+        """
+        connector, message = self._get_sql_connector(connection_id)
+        if connector is None:
+            return False, message
+        
+        return connector.rollback()
+    
+    def _get_sql_connector(self, connection_id: str) -> Tuple[Optional[DatabaseConnector], str]:
+        """
+        获取SQL数据库连接器，MongoDB连接不支持事务和批量语句
+        
+        Returns:
+            (连接器或None, 错误消息)
+        """
+        if connection_id not in self.connectors:
+            return None, f"找不到连接: {connection_id}"
+        
+        conn_info = self.connectors[connection_id]
+        if conn_info["type"] == "mongodb":
+            return None, "MongoDB连接不支持此操作"
+        
+        return conn_info["connector"], ""
+    
     def build_select_query(self, table: str, fields: List[str] = None, where: Dict[str, Any] = None, 
                          order_by: List[str] = None, limit: int = None, offset: int = None) -> str:
         """构建SELECT查询"""
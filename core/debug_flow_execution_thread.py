@@ -73,12 +73,12 @@ class DebugFlowExecutionThread(QThread):
                 on_flow_complete=self._on_flow_complete
             )
         except Exception as e:
-            # 发送执行失败信号
+            # 记录异常并发送执行失败信号，界面收到信号后取出日志显示
+            self._flow_controller.record_log("ERROR", f"流程执行异常: {str(e)}")
             self.flow_completed.emit(False)
-            print(f"流程执行异常: {str(e)}")
         finally:
             # 确保流程控制器的执行状态被重置，无论执行成功还是失败
-            self._flow_controller._is_executing = False
+            self._flow_controller.finish_execution()
             # 结束调试模式
             self._debug_manager.stop_debugging()
     
@@ -6,9 +6,104 @@ DrissionPage 引擎模块，封装对 DrissionPage 库的操作。
 """
 
 from typing import Dict, Any, Optional, Union, Tuple, List
+from functools import lru_cache
+import json
 import time
 from DrissionPage import ChromiumPage, WebPage
 
+
+@lru_cache(maxsize=256)
+def _load_json_text(text: str) -> Any:
+    """解析JSON文本，同一文本只解析一次"""
+    return json.loads(text)
+
+
+def _parse_json_parameter(value: Any) -> Any:
+    """
+    解析步骤中JSON格式的参数（规则、条件、查询参数等）
+    
+    步骤参数在每次执行时内容相同，解析结果按原文本缓存，由多次执行共享，调用方不得修改；
+    已经是字典或列表的值直接返回。
+    
+    Args:
+        value: JSON文本或已解析的对象
+        
+    Returns:
+        解析后的对象
+    """
+    if isinstance(value, (dict, list)):
+        return value
+    return _load_json_text(value)
+
+
+# DB_BUILD_* 动作的成功消息和默认结果变量名
+_DB_BUILD_RESULTS = {
+    "DB_BUILD_SELECT": ("成功构建SELECT查询", "select_query"),
+    "DB_BUILD_INSERT": ("成功构建INSERT查询", "insert_query"),
+    "DB_BUILD_UPDATE": ("成功构建UPDATE查询", "update_query"),
+    "DB_BUILD_DELETE": ("成功构建DELETE查询", "delete_query"),
+}
+
+
+def compile_db_build_query(action_id: str, parameters: Dict[str, Any]) -> Optional[str]:
+    """
+    预先构建 DB_BUILD_* 步骤的SQL语句
+    
+    参数全部为字面量时每次执行构建出的语句都相同，可在添加步骤时构建一次。
+    解析规则与执行时一致；参数缺失或格式错误时返回None，留到执行时按原流程报告错误。
+    
+    Args:
+        action_id: 动作ID
+        parameters: 动作参数（不含变量模板）
+    
+    Returns:
+        SQL语句，不是 DB_BUILD_* 动作或无法预先构建时返回None
+    """
+    if action_id not in _DB_BUILD_RESULTS:
+        return None
+    
+    try:
+        from .database_manager import SQLQueryBuilder
+        
+        table = parameters.get("table", "")
+        if not table:
+            return None
+        
+        if action_id == "DB_BUILD_SELECT":
+            fields_str = parameters.get("fields", "")
+            where_condition_str = parameters.get("where_condition", "")
+            order_by_str = parameters.get("order_by", "")
+            limit_str = parameters.get("limit", "")
+            offset_str = parameters.get("offset", "")
+            
+            fields = [field.strip() for field in fields_str.split(",")] if fields_str else None
+            where_condition = _parse_json_parameter(where_condition_str) if where_condition_str else None
+            order_by = [item.strip() for item in order_by_str.split(",")] if order_by_str else None
+            limit = int(limit_str) if limit_str and limit_str.isdigit() else None
+            offset = int(offset_str) if offset_str and offset_str.isdigit() else None
+            return SQLQueryBuilder.select(table, fields, where_condition, order_by, limit, offset)
+        
+        if action_id == "DB_BUILD_DELETE":
+            where_condition_str = parameters.get("where_condition", "")
+            where_condition = _parse_json_parameter(where_condition_str) if where_condition_str else {}
+            return SQLQueryBuilder.delete(table, where_condition)
+        
+        data_str = parameters.get("data", "")
+        if not data_str:
+            return None
+        data = _parse_json_parameter(data_str)
+        
+        if action_id == "DB_BUILD_INSERT":
+            return SQLQueryBuilder.insert(table, data)
+        
+        where_condition_str = parameters.get("where_condition", "")
+        where_condition = _parse_json_parameter(where_condition_str) if where_condition_str else {}
+        return SQLQueryBuilder.update(table, data, where_condition)
+    
+    except Exception:
+        return None
+
+
 class DrissionEngine:
     """
     封装 DrissionPage 操作的引擎类，用于执行各种浏览器自动化任务。
@@ -177,6 +272,14 @@ class DrissionEngine:
             return self._execute_db_execute_query(parameters)
         elif action_id == "DB_EXECUTE_UPDATE":
             return self._execute_db_execute_update(parameters)
+        elif action_id == "DB_EXECUTE_MANY":
+            return self._execute_db_execute_many(parameters)
+        elif action_id == "DB_BEGIN_TRANSACTION":
+            return self._execute_db_begin_transaction(parameters)
+        elif action_id == "DB_COMMIT":
+            return self._execute_db_commit(parameters)
+        elif action_id == "DB_ROLLBACK":
+            return self._execute_db_rollback(parameters)
         elif action_id == "DB_BUILD_SELECT":
             return self._execute_db_build_select(parameters)
         elif action_id == "DB_BUILD_INSERT":
@@ -239,6 +342,34 @@ class DrissionEngine:
         else:
             return False, f"未知的动作: {action_id}"
     
+    def execute_precompiled_query(self, action_id: str, parameters: Dict[str, Any], query: str) -> Tuple[bool, Any]:
+        """
+        执行已预先构建好SQL语句的 DB_BUILD_* 动作，跳过参数解析和语句拼接
+        
+        Args:
+            action_id: 动作ID
+            parameters: 动作参数
+            query: compile_db_build_query 构建的SQL语句
+        
+        Returns:
+            (是否成功, 查询语句或错误信息)，与 execute_action 的结果一致
+        """
+        if not self._running:
+            return False, "DrissionPage 未初始化"
+        
+        if self._stop_requested:
+            return False, "执行已被用户停止"
+        
+        if not hasattr(self, '_db_manager'):
+            return False, "数据库管理器未初始化"
+        
+        message, default_variable = _DB_BUILD_RESULTS[action_id]
+        return True, {
+            "message": message,
+            "info": query,
+            "save_to_variable": parameters.get("save_to_variable", default_variable)
+        }
+    
     def _get_element(self, parameters: Dict[str, Any]) -> Tuple[bool, Union[Any, str]]:
         """
         根据参数查找元素。
@@ -2431,7 +2562,7 @@ class DrissionEngine:
             
             # 解析清洗规则
             try:
-                cleaning_rules = json.loads(cleaning_rules_str)
+                cleaning_rules = _parse_json_parameter(cleaning_rules_str)
             except Exception as json_error:
                 return False, f"清洗规则格式错误: {str(json_error)}"
             
@@ -2451,12 +2582,8 @@ class DrissionEngine:
                     "save_to_variable": save_to_variable
                 }
             elif isinstance(data, list):
-                # 数据列表
-                results = []
-                for item in data:
-                    if isinstance(item, dict):
-                        cleaned = DataProcessor.clean_data(item, cleaning_rules)
-                        results.append(cleaned)
+                # 数据列表，清洗规则只编译一次
+                results = DataProcessor.clean_data_list(data, cleaning_rules)
                 
                 return True, {
                     "message": f"成功清洗 {len(results)} 条数据",
@@ -2498,7 +2625,7 @@ class DrissionEngine:
             
             # 解析验证规则
             try:
-                validation_rules = json.loads(validation_rules_str)
+                validation_rules = _parse_json_parameter(validation_rules_str)
             except Exception as json_error:
                 return False, f"验证规则格式错误: {str(json_error)}"
             
@@ -2528,14 +2655,13 @@ class DrissionEngine:
                 invalid_items = []
                 all_errors = []
                 
-                for i, item in enumerate(data):
-                    if isinstance(item, dict):
-                        is_valid, errors = DataProcessor.validate_data(item, validation_rules)
-                        if is_valid:
-                            valid_items.append(item)
-                        else:
-                            invalid_items.append(item)
-                            all_errors.append(f"第 {i+1} 条数据验证失败: {'; '.join(errors)}")
+                # 验证规则只编译一次
+                for i, item, is_valid, errors in DataProcessor.validate_data_list(data, validation_rules):
+                    if is_valid:
+                        valid_items.append(item)
+                    else:
+                        invalid_items.append(item)
+                        all_errors.append(f"第 {i+1} 条数据验证失败: {'; '.join(errors)}")
                 
                 result = {
                     "is_valid": len(invalid_items) == 0,
@@ -2728,6 +2854,10 @@ class DrissionEngine:
             if db_type.lower() == "sqlite":
                 # SQLite参数
                 connection_params["database_path"] = parameters.get("database_path", "database.db")
+                # 可选的日志模式和同步级别，未提供时使用连接器默认的 WAL + NORMAL
+                for pragma_name in ("journal_mode", "synchronous"):
+                    if parameters.get(pragma_name):
+                        connection_params[pragma_name] = parameters[pragma_name]
             else:
                 # MySQL, PostgreSQL, MongoDB通用参数
                 connection_params["host"] = parameters.get("host", "localhost")
@@ -2802,7 +2932,7 @@ class DrissionEngine:
             params = None
             if params_str:
                 try:
-                    params = json.loads(params_str)
+                    params = _parse_json_parameter(params_str)
                 except Exception as json_error:
                     return False, f"查询参数格式错误: {str(json_error)}"
             
@@ -2855,7 +2985,7 @@ class DrissionEngine:
             params = None
             if params_str:
                 try:
-                    params = json.loads(params_str)
+                    params = _parse_json_parameter(params_str)
                 except Exception as json_error:
                     return False, f"更新参数格式错误: {str(json_error)}"
             
@@ -2874,6 +3004,128 @@ class DrissionEngine:
         except Exception as e:
             return False, f"执行数据库更新失败: {str(e)}"
     
+    def _execute_db_execute_many(self, parameters: Dict[str, Any]) -> Tuple[bool, Any]:
+        """
+        执行数据库批量更新操作，同一条语句绑定多行参数一次执行
+        
+        Args:
+            parameters: 包含操作参数的字典
+                - connection_id: 连接标识
+                - query: SQL更新
+                - parameters: 行参数列表，或JSON数组文本
+                - rows_variable: 保存行参数列表的变量名，由流程控制器取出变量值填入 parameters
+                - save_to_variable: 保存结果的变量名
+                
+        Returns:
+            (是否成功, 更新结果或错误信息)
+        """
+        try:
+            import json
+            
+            # 检查数据库管理器是否存在
+            if not hasattr(self, '_db_manager'):
+                return False, "数据库管理器未初始化"
+            
+            connection_id = parameters.get("connection_id", "default")
+            query = parameters.get("query", "")
+            rows = parameters.get("parameters", "")
+            save_to_variable = parameters.get("save_to_variable", "affected_rows")
+            
+            # 检查参数
+            if not query:
+                return False, "未提供更新语句"
+            
+            # 手动填写的行参数为JSON数组文本
+            if isinstance(rows, str):
+                try:
+                    rows = json.loads(rows)
+                except ValueError as parse_error:
+                    return False, f"批量参数格式错误: {str(parse_error)}"
+            
+            if not isinstance(rows, (list, tuple)):
+                return False, "批量参数必须是列表"
+            
+            # 执行批量更新
+            success, affected_rows = self._db_manager.execute_many(connection_id, query, rows)
+            
+            if success:
+                return True, {
+                    "message": f"批量更新成功，共 {len(rows)} 行参数，影响了 {affected_rows} 行",
+                    "info": affected_rows,
+                    "save_to_variable": save_to_variable
+                }
+            else:
+                return False, affected_rows
+        
+        except Exception as e:
+            return False, f"执行数据库批量更新失败: {str(e)}"
+    
+    def _execute_db_begin_transaction(self, parameters: Dict[str, Any]) -> Tuple[bool, str]:
+        """
+        执行开始数据库事务操作
+        
+        Args:
+            parameters: 包含操作参数的字典
+                - connection_id: 连接标识
+                
+        Returns:
+            (是否成功, 结果消息)
+        """
+        try:
+            # 检查数据库管理器是否存在
+            if not hasattr(self, '_db_manager'):
+                return False, "数据库管理器未初始化"
+            
+            connection_id = parameters.get("connection_id", "default")
+            return self._db_manager.begin_transaction(connection_id)
+        
+        except Exception as e:
+            return False, f"开始数据库事务失败: {str(e)}"
+    
+    def _execute_db_commit(self, parameters: Dict[str, Any]) -> Tuple[bool, str]:
+        """
+        执行提交数据库事务操作
+        
+        Args:
+            parameters: 包含操作参数的字典
+                - connection_id: 连接标识
+                
+        Returns:
+            (是否成功, 结果消息)
+        """
+        try:
+            # 检查数据库管理器是否存在
+            if not hasattr(self, '_db_manager'):
+                return False, "数据库管理器未初始化"
+            
+            connection_id = parameters.get("connection_id", "default")
+            return self._db_manager.commit(connection_id)
+        
+        except Exception as e:
+            return False, f"提交数据库事务失败: {str(e)}"
+    
+    def _execute_db_rollback(self, parameters: Dict[str, Any]) -> Tuple[bool, str]:
+        """
+        执行回滚数据库事务操作
+        
+        Args:
+            parameters: 包含操作参数的字典
+                - connection_id: 连接标识
+                
+        Returns:
+            (是否成功, 结果消息)
+        """
+        try:
+            # 检查数据库管理器是否存在
+            if not hasattr(self, '_db_manager'):
+                return False, "数据库管理器未初始化"
+            
+            connection_id = parameters.get("connection_id", "default")
+            return self._db_manager.rollback(connection_id)
+        
+        except Exception as e:
+            return False, f"回滚数据库事务失败: {str(e)}"
+    
     def _execute_db_build_select(self, parameters: Dict[str, Any]) -> Tuple[bool, Any]:
         """
         执行构建SELECT查询操作
@@ -2919,7 +3171,7 @@ class DrissionEngine:
             where_condition = None
             if where_condition_str:
                 try:
-                    where_condition = json.loads(where_condition_str)
+                    where_condition = _parse_json_parameter(where_condition_str)
                 except Exception as json_error:
                     return False, f"WHERE条件格式错误: {str(json_error)}"
             
@@ -2976,7 +3228,7 @@ class DrissionEngine:
             
             # 解析插入数据
             try:
-                data = json.loads(data_str)
+                data = _parse_json_parameter(data_str)
             except Exception as json_error:
                 return False, f"插入数据格式错误: {str(json_error)}"
             
@@ -3026,7 +3278,7 @@ class DrissionEngine:
             
             # 解析更新数据
             try:
-                data = json.loads(data_str)
+                data = _parse_json_parameter(data_str)
             except Exception as json_error:
                 return False, f"更新数据格式错误: {str(json_error)}"
             
@@ -3034,7 +3286,7 @@ class DrissionEngine:
             where_condition = {}
             if where_condition_str:
                 try:
-                    where_condition = json.loads(where_condition_str)
+                    where_condition = _parse_json_parameter(where_condition_str)
                 except Exception as json_error:
                     return False, f"WHERE条件格式错误: {str(json_error)}"
             
@@ -3082,7 +3334,7 @@ class DrissionEngine:
             where_condition = {}
             if where_condition_str:
                 try:
-                    where_condition = json.loads(where_condition_str)
+                    where_condition = _parse_json_parameter(where_condition_str)
                 except Exception as json_error:
                     return False, f"WHERE条件格式错误: {str(json_error)}"
             
@@ -218,6 +218,11 @@ class TryCatchBlock:
     表示一个Try-Catch代码块，用于在流程中实现异常处理。
     """
     
+    __slots__ = (
+        "try_steps", "catch_steps", "finally_steps", "exception",
+        "catch_executed", "finally_executed", "outer_open_block"
+    )
+    
     def __init__(self, try_steps: List[int], catch_steps: List[int], finally_steps: List[int]):
         """
         初始化Try-Catch代码块
@@ -232,4 +237,5 @@ class TryCatchBlock:
         self.finally_steps = finally_steps
         self.exception = None  # 捕获的异常
         self.catch_executed = False  # 是否已执行catch块
-        self.finally_executed = False  # 是否已执行finally块 
\ No newline at end of file
+        self.finally_executed = False  # 是否已执行finally块 
+        self.outer_open_block = None  # 进入本块时最内层仍可捕获异常的 try 块
\ No newline at end of file
@@ -5,10 +5,15 @@
 流程控制器模块，负责管理自动化流程的步骤。
 """
 
-from typing import List, Dict, Any, Optional, Tuple, Callable
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterable
+from collections import deque
 import copy
+import re
+import sys
+import threading
+import time
 
-from .drission_engine import DrissionEngine
+from .drission_engine import DrissionEngine, compile_db_build_query
 from .variable_manager import VariableManager, VariableScope
 from .condition_evaluator import ConditionEvaluator
 from .error_handler import ErrorHandler, ErrorStrategy, TryCatchBlock
@@ -55,6 +60,10 @@ STEP_TYPES = [
     "LOG_MESSAGE",
 ]
 
+# 步骤回调立即调用；调用方按批转发事件时，事件数量达到上限或距上次转发超过间隔（秒）时通知一次
+EVENT_FLUSH_SIZE = 64
+EVENT_FLUSH_INTERVAL = 0.05
+
 # 步骤描述
 STEP_DESCRIPTIONS = {
     "OPEN_BROWSER": "打开浏览器",
@@ -80,10 +89,833 @@ STEP_DESCRIPTIONS = {
     "LOG_MESSAGE": "记录日志",
 }
 
+# DrissionPage.ChromiumOptions 类，首次准备浏览器配置时导入
+_ChromiumOptions = None
+
+
+def _get_chromium_options_cls():
+    """获取 ChromiumOptions 类，仅在第一次调用时执行导入"""
+    global _ChromiumOptions
+    if _ChromiumOptions is None:
+        from DrissionPage import ChromiumOptions
+        _ChromiumOptions = ChromiumOptions
+    return _ChromiumOptions
+
+
+# 逗号分隔的参数列表，分隔符两侧的空白一并去除
+_ARG_SPLIT_RE = re.compile(r'\s*,\s*')
+
+# JSON 形式参数中无需复制的不可变标量类型
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+
+def _fast_clone(value: Any) -> Any:
+    """
+    深复制 JSON 形式的参数（字典、列表及标量）
+    
+    比 copy.deepcopy 少了备忘字典和 __deepcopy__ 探测，其他类型回退到 copy.deepcopy。
+    
+    Args:
+        value: 要复制的值
+        
+    Returns:
+        复制后的值
+    """
+    value_type = type(value)
+    if value_type in _PRIMITIVE_TYPES:
+        return value
+    if value_type is dict:
+        return {key: _fast_clone(item) for key, item in value.items()}
+    if value_type is list:
+        return [_fast_clone(item) for item in value]
+    return copy.deepcopy(value)
+
+
+def _collect_template_paths(value: Any, path: Tuple = ()) -> List[Tuple]:
+    """
+    扫描参数树，收集包含 ${...} 模板的字符串所在路径
+    
+    Args:
+        value: 参数值（字典、列表或标量）
+        path: 当前值所在路径
+        
+    Returns:
+        模板字符串路径列表，不含模板的子树不会出现在结果中
+    """
+    if isinstance(value, str):
+        return [path] if "${" in value else []
+    
+    paths = []
+    if isinstance(value, dict):
+        for key, item in value.items():
+            paths.extend(_collect_template_paths(item, path + (key,)))
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            paths.extend(_collect_template_paths(item, path + (index,)))
+    return paths
+
+
+# 步骤参数中不超过该长度的字符串值会被驻留，重复的短字符串共用一个对象
+_INTERN_MAX_LENGTH = 64
+
+# 取值范围有限的参数，无论长度都驻留
+_CATEGORICAL_PARAM_KEYS = frozenset([
+    "level", "connection_id", "db_type", "encoding", "save_to_variable"
+])
+
+# 共享参数字典缓存的最大条目数
+_SHARED_PARAMETERS_LIMIT = 512
+
+# 执行日志环形缓冲区容量，超出后丢弃最早的记录
+_LOG_RING_SIZE = 1024
+
+# 字典取值时区分“键不存在”与值为None
+_MISSING = object()
+
+# 会改写变量的控制流步骤：动作ID -> ((参数名, 默认变量名), ...)
+_VARIABLE_WRITER_PARAMS = {
+    "SET_VARIABLE": (("variable_name", ""),),
+    "DELETE_VARIABLE": (("variable_name", ""),),
+    "FOR_LOOP": (("loop_variable", "i"),),
+    "FOREACH_LOOP": (("item_variable", "item"), ("index_variable", None)),
+    "CATCH_BLOCK": ()
+}
+
+# CATCH 块写入的异常信息变量
+_CATCH_BLOCK_VARIABLES = ("error_type", "error_message")
+
+# 会整体清空变量的步骤，出现时不做参数预解析
+_VARIABLE_RESET_ACTIONS = frozenset(["CLEAR_VARIABLES", "DELETE_FLOW"])
+
+# 按变量名直接传入变量值的动作：动作ID -> (变量名参数, 接收变量值的参数)
+_VARIABLE_VALUE_PARAMS = {
+    "DB_EXECUTE_MANY": ("rows_variable", "parameters")
+}
+
+
+class _FlowAbort(Exception):
+    """流程提前终止信号，args[0] 为终止时的流程成功标志"""
+
+
+def _dict_has_template(value: Any) -> bool:
+    """
+    判断参数树中是否存在包含 ${...} 模板的字符串，找到第一个即返回
+    
+    Args:
+        value: 参数值（字典、列表或标量）
+        
+    Returns:
+        是否包含模板
+    """
+    if isinstance(value, str):
+        return "${" in value
+    if isinstance(value, dict):
+        return any(_dict_has_template(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_dict_has_template(item) for item in value)
+    return False
+
+
+class _LoopFrame:
+    """
+    FOREACH 循环栈帧，使用 __slots__ 固定字段，出栈后放回复用池
+    """
+    
+    __slots__ = (
+        "type", "item_variable", "collection_variable", "index_variable",
+        "loop_start", "collection", "current_index", "length", "items",
+        "set_item", "set_index"
+    )
+    
+    def __init__(self):
+        self.type = "foreach"
+        self.items = None
+        self.set_item = None
+        self.set_index = None
+    
+    def __getitem__(self, key: str) -> Any:
+        """兼容其他控制流处理函数对栈帧的字典式读取，如 frame["type"]"""
+        return getattr(self, key)
+
+
+def _foreach_next_sequence(loop_frame: _LoopFrame, new_index: int) -> bool:
+    """
+    将列表、元组或字符串的下一个元素写入循环变量
+    
+    Returns:
+        是否还有元素，遍历结束时返回False
+    """
+    if new_index >= loop_frame.length:
+        return False
+    
+    loop_frame.set_item(loop_frame.collection[new_index])
+    set_index = loop_frame.set_index
+    if set_index is not None:
+        set_index(new_index)
+    return True
+
+
+def _foreach_next_dict(loop_frame: _LoopFrame, new_index: int) -> bool:
+    """
+    将字典的下一个值（及键）写入循环变量
+    
+    Returns:
+        是否还有元素，遍历结束时返回False
+    """
+    if new_index >= loop_frame.length:
+        return False
+    
+    key, value = loop_frame.items[new_index]
+    loop_frame.set_item(value)
+    set_index = loop_frame.set_index
+    if set_index is not None:
+        set_index(key)
+    return True
+
+
+# FOREACH 迭代函数，按集合的具体类型查表
+_FOREACH_DISPATCH = {
+    list: _foreach_next_sequence,
+    tuple: _foreach_next_sequence,
+    str: _foreach_next_sequence,
+    dict: _foreach_next_dict,
+}
+
+
+def _resolve_foreach_handler(collection: Any) -> Optional[Callable]:
+    """为内置集合类型的子类查找迭代函数"""
+    if isinstance(collection, (list, tuple, str)):
+        return _foreach_next_sequence
+    if isinstance(collection, dict):
+        return _foreach_next_dict
+    return None
+
+
+# 高级页面交互演示流程
+_ADVANCED_INTERACTIONS_DEMO_STEPS = (
+    # 步骤1: 打开浏览器访问百度
+    ("OPEN_BROWSER", {
+        "url": "https://www.baidu.com",
+        "browser_type": "Chrome",
+        "headless": "否",
+        "window_size": "1280,720"
+    }),
+    
+    # 步骤2: 输入搜索关键词（使用变量）
+    ("ELEMENT_INPUT", {
+        "locator_strategy": "ID",
+        "locator_value": "kw",
+        "text_to_input": "${search_term}",  # 使用变量
+        "timeout": 10
+    }),
+    
+    # 步骤3: 点击搜索按钮
+    ("ELEMENT_CLICK", {
+        "locator_strategy": "ID",
+        "locator_value": "su",
+        "timeout": 10
+    }),
+    
+    # 等待搜索加载
+    ("LOG_MESSAGE", {
+        "message": "等待搜索 '${search_term}' 的结果加载中..."
+    }),
+    
+    # 步骤4: 等待搜索结果加载
+    ("WAIT_FOR_ELEMENT", {
+        "locator_strategy": "css",
+        "locator_value": "#content_left",
+        "timeout": 15
+    }),
+    
+    # 添加短暂等待，确保页面渲染完成
+    ("LOG_MESSAGE", {
+        "message": "等待页面渲染完成..."
+    }),
+    
+    # 步骤5: 滚动页面（使用变量）
+    ("SCROLL_PAGE", {
+        "direction": "down",
+        "distance": "${scroll_distance}"  # 使用变量
+    }),
+    
+    # 步骤6: 截图保存搜索结果（使用变量构建路径）
+    ("TAKE_SCREENSHOT", {
+        "save_path": "${screenshot_dir}/search_results.png",  # 使用变量构建路径
+        "save_full_page": "是"
+    }),
+    
+    # 步骤7: 滚动回顶部（使用变量）
+    ("SCROLL_PAGE", {
+        "direction": "up",
+        "distance": "${scroll_distance}"  # 使用变量
+    }),
+    
+    # 步骤8: 鼠标悬停在百度Logo上
+    ("MOUSE_HOVER", {
+        "locator_strategy": "ID",
+        "locator_value": "s_lg_img",
+        "duration": 1.0
+    }),
+    
+    # 创建一个临时变量来存储当前搜索词
+    ("SET_VARIABLE", {
+        "variable_name": "current_search",
+        "variable_value": "${search_term2}",
+        "variable_scope": VariableScope.TEMPORARY
+    }),
+    
+    # 步骤9: 再次搜索不同关键词（使用临时变量）
+    ("ELEMENT_INPUT", {
+        "locator_strategy": "ID",
+        "locator_value": "kw",
+        "text_to_input": "${current_search}",  # 使用临时变量
+        "timeout": 10
+    }),
+    
+    # 步骤10: 点击搜索按钮
+    ("ELEMENT_CLICK", {
+        "locator_strategy": "ID",
+        "locator_value": "su",
+        "timeout": 10
+    }),
+    
+    # 记录搜索内容
+    ("LOG_MESSAGE", {
+        "message": "已完成两次搜索：'${search_term}' 和 '${current_search}'"
+    }),
+)
+
+# 基本演示流程
+_BASIC_DEMO_STEPS = (
+    # 步骤1: 打开浏览器访问百度
+    ("OPEN_BROWSER", {
+        "url": "https://www.baidu.com",
+        "browser_type": "Chrome",
+        "headless": "否",
+        "window_size": "1280,720"
+    }),
+    
+    # 步骤2: 输入搜索关键词
+    ("ELEMENT_INPUT", {
+        "locator_strategy": "ID",
+        "locator_value": "kw",
+        "text_to_input": "Python 编程"
+    }),
+    
+    # 步骤3: 点击搜索按钮
+    ("ELEMENT_CLICK", {
+        "locator_strategy": "ID",
+        "locator_value": "su"
+    }),
+    
+    # 步骤4: 等待结果加载
+    ("LOG_MESSAGE", {
+        "message": "等待搜索结果加载..."
+    }),
+    
+    # 步骤5: 截图保存结果
+    ("TAKE_SCREENSHOT", {
+        "save_path": "screenshots/search_results.png"
+    }),
+    
+    # 步骤6: 记录完成日志
+    ("LOG_MESSAGE", {
+        "message": "基础演示完成"
+    }),
+)
+
+# JavaScript演示流程
+_JAVASCRIPT_DEMO_STEPS = (
+    # 步骤1: 打开浏览器访问百度
+    ("OPEN_BROWSER", {
+        "url": "https://www.baidu.com",
+        "browser_type": "Chrome",
+        "headless": "否",
+        "window_size": "1280,720"
+    }),
+    
+    # 步骤2: 执行JS修改页面标题
+    ("EXECUTE_JAVASCRIPT", {
+        "js_code": "document.title = 'DrissionPage自动化工具 - 修改的标题'; return document.title;"
+    }),
+    
+    # 步骤3: 记录日志
+    ("LOG_MESSAGE", {
+        "message": "已通过JavaScript修改页面标题"
+    }),
+    
+    # 步骤4: 使用JS输入搜索关键词
+    ("EXECUTE_JAVASCRIPT", {
+        "js_code": "document.getElementById('kw').value = 'DrissionPage JavaScript自动化'; return true;"
+    }),
+    
+    # 步骤5: 使用JS点击搜索按钮
+    ("EXECUTE_JAVASCRIPT", {
+        "js_code": "document.getElementById('su').click(); return true;"
+    }),
+    
+    # 步骤6: 等待搜索结果加载
+    ("WAIT_SECONDS", {
+        "seconds": "3"
+    }),
+    
+    # 步骤7: 使用JS获取搜索结果数量
+    ("EXECUTE_JAVASCRIPT", {
+        "js_code": "let results = document.querySelectorAll('#content_left .c-container'); return `找到 ${results.length} 个搜索结果`;"
+    }),
+    
+    # 步骤8: 截图保存结果
+    ("TAKE_SCREENSHOT", {
+        "save_path": "screenshots/js_modified_page.png"
+    }),
+    
+    # 步骤9: 使用JS修改页面样式
+    ("EXECUTE_JAVASCRIPT", {
+        "js_code": "document.body.style.backgroundColor = '#f0f8ff'; document.querySelectorAll('#content_left .c-container').forEach(item => { item.style.border = '2px solid #4682b4'; item.style.margin = '10px'; item.style.padding = '10px'; item.style.borderRadius = '8px'; item.style.backgroundColor = 'white'; }); return 'CSS样式已修改';"
+    }),
+    
+    # 步骤10: 记录完成日志
+    ("LOG_MESSAGE", {
+        "message": "JavaScript演示完成"
+    }),
+    
+    # 步骤11: 截图保存修改后的页面
+    ("TAKE_SCREENSHOT", {
+        "save_path": "screenshots/js_styled_page.png"
+    }),
+)
+
+# 高级鼠标操作演示流程
+_ADVANCED_MOUSE_DEMO_STEPS = (
+    # 步骤1: 打开浏览器访问拖放测试页面
+    ("OPEN_BROWSER", {
+        "url": "${test_url}",
+        "browser_type": "Chrome",
+        "headless": "否",
+        "window_size": "1280,720"
+    }),
+    
+    # 步骤2: 等待元素加载
+    ("WAIT_FOR_ELEMENT", {
+        "locator_strategy": "id",
+        "locator_value": "div1",
+        "timeout": 10
+    }),
+    
+    # 记录日志
+    ("LOG_MESSAGE", {
+        "message": "准备演示拖放操作..."
+    }),
+    
+    # 步骤3: 拖放操作
+    ("MOUSE_DRAG_DROP", {
+        "source_locator_strategy": "id",
+        "source_locator_value": "drag1",
+        "target_locator_strategy": "id",
+        "target_locator_value": "div2",
+        "smooth": "是",
+        "duration": 1.0
+    }),
+    
+    # 记录日志
+    ("LOG_MESSAGE", {
+        "message": "拖放操作完成，准备进行双击操作"
+    }),
+    
+    # 等待一下
+    ("WAIT_SECONDS", {
+        "seconds": "2"
+    }),
+    
+    # 步骤4: 右键点击操作
+    ("MOUSE_RIGHT_CLICK", {
+        "locator_strategy": "id",
+        "locator_value": "div1",
+        "timeout": 10
+    }),
+    
+    # 记录日志
+    ("LOG_MESSAGE", {
+        "message": "右键点击完成，准备演示鼠标轨迹移动"
+    }),
+    
+    # 步骤5: 鼠标轨迹移动
+    ("MOUSE_MOVE_PATH", {
+        "path_points": "50,50;200,100;100,150;300,50",
+        "duration": 1.5,
+        "relative_to_element": "是",
+        "locator_strategy": "id",
+        "locator_value": "div1"
+    }),
+    
+    # 记录日志
+    ("LOG_MESSAGE", {
+        "message": "鼠标轨迹移动完成，演示双击操作"
+    }),
+    
+    # 等待一下
+    ("WAIT_SECONDS", {
+        "seconds": "1"
+    }),
+    
+    # 步骤6: 双击操作
+    ("MOUSE_DOUBLE_CLICK", {
+        "locator_strategy": "id",
+        "locator_value": "div2",
+        "timeout": 10
+    }),
+    
+    # 记录日志
+    ("LOG_MESSAGE", {
+        "message": "高级鼠标操作演示完成！"
+    }),
+)
+
+# 控制台监听演示流程
+_CONSOLE_DEMO_STEPS = (
+    # 步骤1: 打开浏览器访问百度
+    ("OPEN_BROWSER", {
+        "url": "https://www.baidu.com",
+        "browser_type": "Chrome",
+        "headless": "否",
+        "window_size": "1280,720"
+    }),
+    
+    # 步骤2: 启动控制台监听
+    ("GET_CONSOLE_LOGS", {
+        "mode": "start",
+        "save_to_variable": "console_logs"
+    }),
+    
+    # 步骤3: 执行JavaScript输出到控制台
+    ("EXECUTE_JAVASCRIPT", {
+        "js_code": """
+console.log('控制台日志测试');
+console.warn('这是一条警告信息');
+console.error('这是一条错误信息');
+console.log('${log_content}');  // 使用变量
+return "JavaScript执行完成";
+"""
+    }),
+    
+    # 步骤4: 等待一下确保日志输出
+    ("WAIT_SECONDS", {
+        "seconds": "1"
+    }),
+    
+    # 步骤5: 获取所有控制台日志
+    ("GET_CONSOLE_LOGS", {
+        "mode": "all",
+        "save_to_variable": "all_console_logs"
+    }),
+    
+    # 步骤6: 记录获取到的日志
+    ("LOG_MESSAGE", {
+        "message": "成功获取控制台日志: ${all_console_logs}",
+        "level": "INFO"
+    }),
+    
+    # 步骤7: 清空控制台缓存
+    ("CLEAR_CONSOLE", {}),
+    
+    # 步骤8: 使用组合方法执行JS并获取控制台输出
+    ("EXECUTE_JS_WITH_CONSOLE", {
+        "js_code": """
+// 输出多种类型的信息
+console.log('普通日志');
+console.info('信息日志');
+console.warn('警告日志');
+console.error('错误日志');
+console.log('包含变量: ' + 'DrissionPage');
+console.log({name: 'DrissionPage', type: 'Browser Automation'});
+return "组合方法执行完成";
+""",
+        "wait_timeout": "3",
+        "save_to_variable": "combined_output"
+    }),
+    
+    # 步骤9: 记录组合方法的结果
+    ("LOG_MESSAGE", {
+        "message": "JS执行结果: {combined_output.info.js_result}, 控制台日志数量: {combined_output.info.logs_count}",
+        "level": "INFO"
+    }),
+    
+    # 步骤10: 停止控制台监听
+    ("GET_CONSOLE_LOGS", {
+        "mode": "stop"
+    }),
+    
+    # 步骤11: 记录完成
+    ("LOG_MESSAGE", {
+        "message": "控制台监听演示完成",
+        "level": "SUCCESS"
+    }),
+)
+
+# 数据处理演示流程
+_DATA_PROCESSING_DEMO_STEPS = (
+    # 步骤1: 记录原始数据
+    ("LOG_MESSAGE", {
+        "message": "原始数据: {sample_data}",
+        "level": "INFO"
+    }),
+    
+    # 步骤2: 数据清洗
+    ("CLEAN_DATA", {
+        "data_variable": "sample_data",
+        "cleaning_rules": """
+                {
+                    "name": [
+                        {"type": "trim"}
+                    ],
+                    "age": [
+                        {"type": "trim"},
+                        {"type": "cast", "to": "int"}
+                    ],
+                    "email": [
+                        {"type": "trim"},
+                        {"type": "lowercase"}
+                    ],
+                    "active": [
+                        {"type": "cast", "to": "bool"}
+                    ]
+                }
+                """,
+        "save_to_variable": "cleaned_data"
+    }),
+    
+    # 步骤3: 记录清洗后的数据
+    ("LOG_MESSAGE", {
+        "message": "清洗后的数据: {cleaned_data}",
+        "level": "INFO"
+    }),
+    
+    # 步骤4: 验证数据
+    ("VALIDATE_DATA", {
+        "data_variable": "cleaned_data",
+        "validation_rules": """
+                {
+                    "name": [
+                        {"type": "required", "message": "姓名是必填项"}
+                    ],
+                    "age": [
+                        {"type": "required", "message": "年龄是必填项"},
+                        {"type": "range", "min": 18, "max": 100, "message": "年龄必须在18-100之间"}
+                    ],
+                    "email": [
+                        {"type": "required", "message": "邮箱是必填项"},
+                        {"type": "regex", "pattern": "^[\\w.-]+@[\\w.-]+\\.[a-zA-Z]{2,}$", "message": "邮箱格式不正确"}
+                    ]
+                }
+                """,
+        "save_result_to_variable": "validation_result"
+    }),
+    
+    # 步骤5: 记录验证结果
+    ("LOG_MESSAGE", {
+        "message": "验证结果: {validation_result}",
+        "level": "INFO"
+    }),
+    
+    # 步骤6: 应用模板
+    ("APPLY_DATA_TEMPLATE", {
+        "data_variable": "cleaned_data",
+        "template": "姓名:{name}, 年龄:{age}岁, 邮箱:{email}, 是否活跃:{active}",
+        "save_to_variable": "formatted_data"
+    }),
+    
+    # 步骤7: 记录格式化后的数据
+    ("LOG_MESSAGE", {
+        "message": "格式化后的数据: {formatted_data}",
+        "level": "INFO"
+    }),
+    
+    # 步骤8: 生成数据统计
+    ("GENERATE_DATA_STATS", {
+        "data_variable": "cleaned_data",
+        "fields": "name,age,email,active",
+        "save_to_variable": "data_stats"
+    }),
+    
+    # 步骤9: 记录统计结果
+    ("LOG_MESSAGE", {
+        "message": "数据统计: {data_stats}",
+        "level": "INFO"
+    }),
+    
+    # 步骤10: 导出CSV
+    ("EXPORT_TO_CSV", {
+        "data_variable": "cleaned_data",
+        "file_path": "data_export.csv",
+        "encoding": "utf-8"
+    }),
+)
+
+# 数据库操作演示流程
+_DATABASE_DEMO_STEPS = (
+    # 步骤1: 连接SQLite数据库
+    ("DB_CONNECT", {
+        "connection_id": "sqlite_demo",
+        "db_type": "sqlite",
+        "database_path": "demo_database.db"
+    }),
+    
+    # 步骤2: 创建表
+    ("DB_EXECUTE_UPDATE", {
+        "connection_id": "sqlite_demo",
+        "query": """
+                CREATE TABLE IF NOT EXISTS users (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    age INTEGER,
+                    email TEXT
+                )
+                """,
+        "save_to_variable": "create_table_result"
+    }),
+    
+    # 步骤3: 记录创建表结果
+    ("LOG_MESSAGE", {
+        "message": "创建表结果: {create_table_result}",
+        "level": "INFO"
+    }),
+    
+    # 步骤4: 清空表数据
+    ("DB_EXECUTE_UPDATE", {
+        "connection_id": "sqlite_demo",
+        "query": "DELETE FROM users",
+        "save_to_variable": "clear_table_result"
+    }),
+    
+    # 步骤5: 构建插入查询
+    ("DB_BUILD_INSERT", {
+        "table": "users",
+        "data": "{\"name\": \"张三\", \"age\": 25, \"email\": \"user1@example.com\"}",
+        "save_to_variable": "insert_query"
+    }),
+    
+    # 步骤6: 记录构建的插入查询
+    ("LOG_MESSAGE", {
+        "message": "构建的插入查询: {insert_query}",
+        "level": "INFO"
+    }),
+    
+    # 步骤7: 开始事务，批量插入只提交一次
+    ("DB_BEGIN_TRANSACTION", {
+        "connection_id": "sqlite_demo"
+    }),
+    
+    # 步骤8: 批量插入数据，同一条语句绑定所有用户数据
+    ("DB_EXECUTE_MANY", {
+        "connection_id": "sqlite_demo",
+        "query": "INSERT INTO users (name, age, email) VALUES (:name, :age, :email)",
+        "rows_variable": "user_data",
+        "save_to_variable": "insert_result"
+    }),
+    
+    # 步骤9: 提交事务
+    ("DB_COMMIT", {
+        "connection_id": "sqlite_demo"
+    }),
+    
+    # 步骤10: 记录插入结果
+    ("LOG_MESSAGE", {
+        "message": "批量插入数据结果: {insert_result}",
+        "level": "INFO"
+    }),
+    
+    # 步骤11: 构建查询
+    ("DB_BUILD_SELECT", {
+        "table": "users",
+        "fields": "id,name,age,email",
+        "where_condition": "{\"age\": 25}",
+        "save_to_variable": "select_query"
+    }),
+    
+    # 步骤12: 记录构建的查询
+    ("LOG_MESSAGE", {
+        "message": "构建的查询: {select_query}",
+        "level": "INFO"
+    }),
+    
+    # 步骤13: 执行查询
+    ("DB_EXECUTE_QUERY", {
+        "connection_id": "sqlite_demo",
+        "query": "SELECT * FROM users",
+        "save_to_variable": "query_results"
+    }),
+    
+    # 步骤14: 记录查询结果
+    ("LOG_MESSAGE", {
+        "message": "查询结果: {query_results}",
+        "level": "INFO"
+    }),
+    
+    # 步骤15: 构建更新查询
+    ("DB_BUILD_UPDATE", {
+        "table": "users",
+        "data": "{\"age\": 26}",
+        "where_condition": "{\"name\": \"张三\"}",
+        "save_to_variable": "update_query"
+    }),
+    
+    # 步骤16: 记录构建的更新查询
+    ("LOG_MESSAGE", {
+        "message": "构建的更新查询: {update_query}",
+        "level": "INFO"
+    }),
+    
+    # 步骤17: 执行更新
+    ("DB_EXECUTE_UPDATE", {
+        "connection_id": "sqlite_demo",
+        "query": "UPDATE users SET age = :age WHERE name = :name",
+        "parameters": "{\"age\": 26, \"name\": \"张三\"}",
+        "save_to_variable": "update_result"
+    }),
+    
+    # 步骤18: 记录更新结果
+    ("LOG_MESSAGE", {
+        "message": "更新结果: {update_result}",
+        "level": "INFO"
+    }),
+    
+    # 步骤19: 再次查询结果
+    ("DB_EXECUTE_QUERY", {
+        "connection_id": "sqlite_demo",
+        "query": "SELECT * FROM users",
+        "save_to_variable": "updated_results"
+    }),
+    
+    # 步骤20: 记录更新后的查询结果
+    ("LOG_MESSAGE", {
+        "message": "更新后的数据: {updated_results}",
+        "level": "INFO"
+    }),
+    
+    # 步骤21: 导出结果到CSV
+    ("EXPORT_TO_CSV", {
+        "data_variable": "updated_results",
+        "file_path": "database_export.csv",
+        "encoding": "utf-8"
+    }),
+    
+    # 步骤22: 断开数据库连接
+    ("DB_DISCONNECT", {
+        "connection_id": "sqlite_demo"
+    }),
+)
+
+
 class FlowController:
     """
     管理自动化流程步骤的控制器类。
     """
+    # 表示浏览器连接已断开的错误信息
+    _CONNECTION_LOST_RE = re.compile(
+        "连接已断开|Connection lost|Target closed|Page crashed|Session closed|WebSocketClosed"
+    )
+    
     def __init__(self):
         """初始化流程控制器"""
         self._steps = []  # 存储流程步骤
@@ -91,6 +923,10 @@ class FlowController:
         self._current_step_index = -1  # 当前执行步骤索引
         self._engine = DrissionEngine()  # DrissionPage 引擎实例
         self._is_executing = False  # 是否正在执行
+        self._execution_lock = threading.Lock()  # 保护执行状态的检查和设置
+        
+        # 执行线程产生的日志 (级别, 时间戳, 消息)，由界面在流程结束后取出显示
+        self._log_ring = deque(maxlen=_LOG_RING_SIZE)
         
         # 初始化变量管理器
         self._variable_manager = VariableManager()
@@ -106,15 +942,42 @@ class FlowController:
         # 当前活动的 try-catch 块列表
         self._active_try_blocks = []
         
+        # 最内层尚未捕获异常的 try 块
+        self._innermost_open_try = None
+        
         # 挂起的删除流程操作
         self._pending_delete_flow = False
         self._pending_clear_variables = False
+        
+        # 控制流步骤的重试次数，键为 "步骤索引_动作ID"
+        self._retry_counts = {}
+        
+        # 已释放的 FOREACH 循环帧及字典键值对列表，供嵌套循环复用
+        self._loop_frame_pool = []
+        self._item_list_pool = []
+        
+        # 内容相同的步骤参数共用的字典，键为参数项集合
+        self._shared_parameters = {}
+        
+        # 参数不含模板的步骤，键为 id(步骤)，值为步骤本身；不写入步骤字典，避免随流程文件保存
+        self._template_free_steps = {}
+        
+        # 添加时已构建好SQL的 DB_BUILD_* 步骤，键为 id(步骤)，值为 (步骤, SQL语句)
+        self._compiled_queries = {}
+        
+        # 上次通知调用方转发后已调用的步骤回调数
+        self._pending_event_count = 0
+        self._last_event_flush = 0.0
+        self._on_events_flushed = None
     
     def create_new_flow(self, flow_name: str = "新建流程") -> None:
         """创建新的流程，清空现有步骤"""
         self._steps = []
         self._flow_name = flow_name
         self._current_step_index = -1
+        self._shared_parameters.clear()
+        self._template_free_steps.clear()
+        self._compiled_queries.clear()
         
         # 清空变量（仅保留全局变量）
         self._variable_manager.clear_scope(VariableScope.LOCAL)
@@ -125,6 +988,7 @@ class FlowController:
         
         # 清空活动的 try-catch 块
         self._active_try_blocks = []
+        self._innermost_open_try = None
     
     def add_step(self, action_id: str, parameters: Dict[str, Any], 
                  at_index: Optional[int] = None, 
@@ -141,12 +1005,14 @@ class FlowController:
         Returns:
             新步骤的索引
         """
+        parameters = self._share_parameters(parameters)
         step_data = {
             "action_id": action_id,
             "parameters": parameters,
             "enabled": True,  # 默认启用
             "error_handler": error_handler or {}  # 错误处理配置
         }
+        self._track_step(step_data)
         
         if at_index is None or at_index >= len(self._steps):
             self._steps.append(step_data)
@@ -155,13 +1021,101 @@ class FlowController:
             self._steps.insert(at_index, step_data)
             return at_index
     
+    def _share_parameters(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        驻留参数中的短字符串，并让内容相同的参数字典在步骤间共用一个对象
+        
+        只处理值全部可哈希的参数字典；共享的字典在流程中视为只读，编辑步骤时会整体替换参数。
+        
+        Args:
+            parameters: 动作参数
+            
+        Returns:
+            驻留后的参数字典，可能是之前添加的步骤使用的同一个对象
+        """
+        for key, value in parameters.items():
+            if type(value) is str and (len(value) <= _INTERN_MAX_LENGTH or key in _CATEGORICAL_PARAM_KEYS):
+                parameters[key] = sys.intern(value)
+        
+        # 键中包含值的类型，避免 1 与 True、1.0 被视为相同的参数
+        try:
+            cache_key = frozenset((key, type(value), value) for key, value in parameters.items())
+        except TypeError:
+            # 含列表、字典等不可哈希的值
+            return parameters
+        
+        shared = self._shared_parameters.get(cache_key)
+        if shared is not None:
+            return shared
+        
+        if len(self._shared_parameters) >= _SHARED_PARAMETERS_LIMIT:
+            self._shared_parameters.clear()
+        self._shared_parameters[cache_key] = parameters
+        return parameters
+    
+    def extend_steps(self, steps_def: Iterable[Tuple[str, Dict[str, Any]]]) -> Tuple[int, int]:
+        """
+        批量追加步骤到流程末尾，一次扩展步骤列表
+        
+        与逐个调用 add_step 的结果相同，适合加载流程文件和构建演示流程。
+        
+        Args:
+            steps_def: (动作ID, 参数) 元组序列，参数会被复制，避免运行时修改影响调用方的数据
+            
+        Returns:
+            新增步骤的索引范围 (起始索引, 结束索引)，不含结束索引
+        """
+        steps = [
+            {
+                "action_id": action_id,
+                "parameters": self._share_parameters(_fast_clone(parameters)),
+                "enabled": True,
+                "error_handler": {}
+            }
+            for action_id, parameters in steps_def
+        ]
+        for step_data in steps:
+            self._track_step(step_data)
+        
+        start = len(self._steps)
+        self._steps.extend(steps)
+        return start, len(self._steps)
+    
     def remove_step(self, index: int) -> bool:
         """删除步骤"""
         if 0 <= index < len(self._steps):
-            del self._steps[index]
+            step = self._steps.pop(index)
+            self._template_free_steps.pop(id(step), None)
+            self._compiled_queries.pop(id(step), None)
             return True
         return False
     
+    def _track_step(self, step_data: Dict[str, Any]) -> None:
+        """
+        记录新建步骤的参数是否不含模板，不含模板的步骤执行期可直接使用原参数，
+        其中的 DB_BUILD_* 步骤在此构建一次SQL语句
+        
+        Args:
+            step_data: 新建的步骤数据
+        """
+        if not _dict_has_template(step_data["parameters"]):
+            self._template_free_steps[id(step_data)] = step_data
+            compiled_sql = compile_db_build_query(step_data["action_id"], step_data["parameters"])
+            if compiled_sql is not None:
+                self._compiled_queries[id(step_data)] = (step_data, compiled_sql)
+    
+    def _is_template_free(self, step: Dict[str, Any]) -> bool:
+        """
+        判断步骤是否为添加时记录的无模板步骤；界面替换后的步骤字典不在记录中，按含模板处理
+        
+        Args:
+            step: 步骤数据
+            
+        Returns:
+            是否可直接使用原参数
+        """
+        return self._template_free_steps.get(id(step)) is step
+    
     def get_steps(self) -> List[Dict[str, Any]]:
         """获取所有步骤"""
         return self._steps
@@ -176,7 +1130,8 @@ class FlowController:
     
     def execute_flow(self, on_step_start: Optional[Callable[[int, Dict[str, Any]], None]] = None,
                     on_step_complete: Optional[Callable[[int, bool, str], None]] = None,
-                    on_flow_complete: Optional[Callable[[bool], None]] = None) -> None:
+                    on_flow_complete: Optional[Callable[[bool], None]] = None,
+                    on_events_flushed: Optional[Callable[[], None]] = None) -> None:
         """
         执行当前流程。
         
@@ -184,14 +1139,21 @@ class FlowController:
             on_step_start: 开始执行步骤时的回调函数 (step_index, step_data) -> None
             on_step_complete: 步骤执行完成时的回调函数 (step_index, success, message) -> None
             on_flow_complete: 流程执行完成时的回调函数 (success) -> None
+            on_events_flushed: 每调用一批步骤回调后调用，便于调用方按批转发事件；
+                步骤回调本身总是在步骤执行前后同步调用，调试断点和单步执行依赖这一点
         """
-        if self._is_executing:
+        # 检查并设置执行状态是一个原子操作，避免两个线程同时开始执行
+        with self._execution_lock:
+            already_executing = self._is_executing
+            self._is_executing = True
+        if already_executing:
             if on_flow_complete:
                 on_flow_complete(False)
             return
         
         # 检查流程是否为空
         if not self._steps:
+            self._is_executing = False
             if on_flow_complete:
                 on_flow_complete(False)
             return
@@ -211,6 +1173,7 @@ class FlowController:
                 success = self._engine.initialize(page_type='chromium')
                 
             if not success:
+                self._is_executing = False
                 if on_flow_complete:
                     on_flow_complete(False)
                 return
@@ -218,7 +1181,7 @@ class FlowController:
             # 浏览器已初始化，检查连接是否仍然有效
             if not self._engine.check_connection():
                 # 连接已断开，重新初始化浏览器
-                print("检测到浏览器连接已断开，将重新初始化")
+                self.record_log("WARNING", "检测到浏览器连接已断开，将重新初始化")
                 
                 # 先关闭旧的连接
                 self._engine.close()
@@ -240,12 +1203,14 @@ class FlowController:
                     success = self._engine.initialize(page_type='chromium')
                 
                 if not success:
+                    self._is_executing = False
                     if on_flow_complete:
                         on_flow_complete(False)
                     return
         
-        self._is_executing = True
         self._current_step_index = -1
+        self._pending_event_count = 0
+        self._on_events_flushed = on_events_flushed
         
         # 执行流程中的每个步骤
         flow_success = True
@@ -260,592 +1225,144 @@ class FlowController:
         self._variable_manager.clear_scope(VariableScope.TEMPORARY)
         
         # 初始化错误追踪
-        retry_counts = {}  # 记录每个步骤的重试次数
+        self._retry_counts = {}  # 记录每个步骤的重试次数
         
-        while execution_pointer < len(self._steps) and not self._engine.should_stop() and self._is_executing:
-            self._current_step_index = execution_pointer
-            step = self._steps[execution_pointer]
-            
-            # 初始化/获取当前步骤的重试计数
-            step_key = f"{execution_pointer}_{step.get('action_id')}"
-            retry_counts.setdefault(step_key, 0)
-            
-            # 检查步骤是否启用
-            if not step.get("enabled", True):
-                if on_step_complete:
-                    on_step_complete(execution_pointer, True, "步骤已禁用，已跳过")
-                execution_pointer += 1
-                continue
-            
-            action_id = step.get("action_id")
-            parameters = step.get("parameters", {})
-            
-            # 如果有变量管理器，处理参数中的变量引用
-            processed_parameters = self._process_parameters(parameters)
-            
-            # 通知步骤开始
-            if on_step_start:
-                on_step_start(execution_pointer, step)
-            
-            # 处理特殊控制流步骤
-            if action_id == "IF_CONDITION":
-                # 评估条件
-                try:
-                    condition_result, condition_message = self._evaluate_condition(processed_parameters)
-                    
-                    # 通知步骤完成
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, True, f"条件判断: {condition_message}")
-                    
-                    # 将条件结果和当前位置压入栈
-                    execution_stack.append({
-                        "type": "if",
-                        "condition_result": condition_result,
-                        "if_pointer": execution_pointer,
-                        "in_else_branch": False
-                    })
-                except Exception as e:
-                    flow_success = False
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, False, f"条件评估错误: {str(e)}")
-                    # 根据错误处理策略决定下一步操作
-                    strategy, jump_to = self._handle_error(e, step, retry_counts[step_key], 3)
-                    retry_counts[step_key] += 1
-                    
-                    if strategy == ErrorStrategy.STOP:
-                        break
-                    elif strategy == ErrorStrategy.RETRY:
-                        continue  # 重试当前步骤
-                    elif strategy == ErrorStrategy.JUMP:
-                        execution_pointer = jump_to
-                        continue
-                    # 其他情况（如CONTINUE），跳过当前步骤继续执行
-                
-                execution_pointer += 1
-            
-            elif action_id == "ELSE_CONDITION":
-                # 检查栈顶是否为 IF
-                if execution_stack and execution_stack[-1]["type"] == "if":
-                    stack_frame = execution_stack[-1]
-                    
-                    # 如果条件为真，则跳过 ELSE 块
-                    if stack_frame["condition_result"]:
-                        # 寻找对应的 END_IF_CONDITION
-                        nesting_level = 1
-                        temp_pointer = execution_pointer + 1
-                        
-                        while temp_pointer < len(self._steps) and nesting_level > 0:
-                            temp_step = self._steps[temp_pointer]
-                            temp_action_id = temp_step.get("action_id")
-                            
-                            if temp_action_id == "IF_CONDITION":
-                                nesting_level += 1
-                            elif temp_action_id == "END_IF_CONDITION":
-                                nesting_level -= 1
-                            
-                            temp_pointer += 1
-                        
-                        if nesting_level == 0:
-                            # 找到了 END_IF_CONDITION，跳到那里
-                            execution_pointer = temp_pointer
-                            # 更新栈帧，表示现在在 ELSE 分支
-                            stack_frame["in_else_branch"] = True
-                        else:
-                            # 没找到匹配的 END_IF_CONDITION
-                            if on_step_complete:
-                                on_step_complete(execution_pointer, False, "找不到匹配的 END_IF_CONDITION")
-                            flow_success = False
-                            break
-                    else:
-                        # 条件为假，继续执行 ELSE 块
-                        stack_frame["in_else_branch"] = True
-                        execution_pointer += 1
-                else:
-                    # 栈为空或栈顶不是 IF
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, False, "ELSE 没有匹配的 IF")
-                    flow_success = False
-                    break
+        # 预解析只依赖流程外变量的步骤参数
+        resolved_parameters, resolved_dependents = self._preresolve_parameters()
+        
+        # 循环中频繁使用的对象绑定为局部变量
+        variable_manager = self._variable_manager
+        execute_action = self._engine.execute_action
+        process_parameters = self._process_parameters
+        template_free_steps = self._template_free_steps
+        compiled_queries = self._compiled_queries
+        emit = self._emit
+        
+        try:
+            while execution_pointer < len(self._steps) and not self._engine.should_stop() and self._is_executing:
+                self._current_step_index = execution_pointer
+                step = self._steps[execution_pointer]
                 
-                # 通知步骤完成
-                if on_step_complete:
-                    on_step_complete(execution_pointer, True, "ELSE 条件处理完成")
-            
-            elif action_id == "END_IF_CONDITION":
-                # 检查栈顶是否为 IF
-                if execution_stack and execution_stack[-1]["type"] == "if":
-                    # 弹出栈顶 IF
-                    execution_stack.pop()
+                # 检查步骤是否启用
+                if not step.get("enabled", True):
+                    emit(on_step_complete, execution_pointer, True, "步骤已禁用，已跳过")
                     execution_pointer += 1
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, True, "IF 块结束")
-                else:
-                    # 栈为空或栈顶不是 IF
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, False, "END_IF 没有匹配的 IF")
-                    flow_success = False
-                    break
-            
-            # Try-Catch-Finally 控制流
-            elif action_id == "TRY_BLOCK":
-                # 创建新的 try 块
-                try_block = TryCatchBlock(
-                    try_steps=[],  # 将在执行过程中填充
-                    catch_steps=processed_parameters.get("catch_steps", []),
-                    finally_steps=processed_parameters.get("finally_steps", [])
-                )
-                self._active_try_blocks.append(try_block)
-                execution_pointer += 1
-                if on_step_complete:
-                    on_step_complete(execution_pointer, True, "进入 TRY 块")
-            
-            elif action_id == "CATCH_BLOCK":
-                # 如果没有活动的try块，或未捕获异常，则跳过catch块
-                if not self._active_try_blocks or not self._active_try_blocks[-1].exception:
-                    # 寻找对应的 END_CATCH_BLOCK 或 FINALLY_BLOCK
-                    nesting_level = 1
-                    temp_pointer = execution_pointer + 1
-                    
-                    while temp_pointer < len(self._steps) and nesting_level > 0:
-                        temp_step = self._steps[temp_pointer]
-                        temp_action_id = temp_step.get("action_id")
-                        
-                        if temp_action_id in ["FINALLY_BLOCK", "END_TRY_BLOCK"]:
-                            break
-                        
-                        temp_pointer += 1
-                    
-                    execution_pointer = temp_pointer
-                else:
-                    # 有捕获的异常，执行catch块
-                    self._active_try_blocks[-1].catch_executed = True
-                    # 将异常信息存储为变量
-                    if self._active_try_blocks[-1].exception:
-                        error_type = type(self._active_try_blocks[-1].exception).__name__
-                        error_message = str(self._active_try_blocks[-1].exception)
-                        
-                        self._variable_manager.create_variable(
-                            "error_type", error_type, "string", VariableScope.TEMPORARY
-                        )
-                        self._variable_manager.create_variable(
-                            "error_message", error_message, "string", VariableScope.TEMPORARY
-                        )
-                    
-                    execution_pointer += 1
-                
-                if on_step_complete:
-                    on_step_complete(execution_pointer, True, "CATCH 块处理")
-            
-            elif action_id == "FINALLY_BLOCK":
-                # 标记finally块已执行
-                if self._active_try_blocks:
-                    self._active_try_blocks[-1].finally_executed = True
+                    continue
                 
-                execution_pointer += 1
-                if on_step_complete:
-                    on_step_complete(execution_pointer, True, "进入 FINALLY 块")
-            
-            elif action_id == "END_TRY_BLOCK":
-                # 结束try-catch-finally块
-                if self._active_try_blocks:
-                    # 如果有finally块但未执行，应执行finally
-                    try_block = self._active_try_blocks[-1]
-                    if try_block.finally_steps and not try_block.finally_executed:
-                        # 执行finally块
-                        # 这里需要流程控制器支持跳转到指定步骤列表
-                        # 暂时简化处理，实际实现需要更复杂的逻辑
-                        pass
-                    
-                    # 弹出当前try块
-                    self._active_try_blocks.pop()
-                
-                execution_pointer += 1
-                if on_step_complete:
-                    on_step_complete(execution_pointer, True, "TRY-CATCH-FINALLY 块结束")
-            
-            # 变量操作步骤
-            elif action_id == "SET_VARIABLE":
-                try:
-                    var_name = processed_parameters.get("variable_name", "")
-                    var_value = processed_parameters.get("variable_value")
-                    var_type = processed_parameters.get("variable_type")
-                    var_scope = processed_parameters.get("variable_scope", VariableScope.GLOBAL)
-                    var_description = processed_parameters.get("variable_description", "")
-                    
-                    # 检查变量是否已存在
-                    existing_var = self._variable_manager.get_variable(var_name)
-                    if existing_var is not None:
-                        # 更新变量
-                        success, message = self._variable_manager.set_variable(var_name, var_value)
-                    else:
-                        # 创建新变量
-                        success, message = self._variable_manager.create_variable(
-                            var_name, var_value, var_type, var_scope, var_description
-                        )
-                    
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, success, message)
-                    
-                    if not success:
-                        flow_success = False
-                except Exception as e:
-                    flow_success = False
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, False, f"设置变量错误: {str(e)}")
+                action_id = step.get("action_id")
+                parameters = step.get("parameters", {})
                 
-                execution_pointer += 1
-            
-            elif action_id == "DELETE_VARIABLE":
-                try:
-                    var_name = processed_parameters.get("variable_name", "")
-                    var_scope = processed_parameters.get("variable_scope")
-                    
-                    success, message = self._variable_manager.delete_variable(var_name, var_scope)
-                    
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, success, message)
-                    
-                    if not success:
-                        flow_success = False
-                except Exception as e:
-                    flow_success = False
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, False, f"删除变量错误: {str(e)}")
-                
-                execution_pointer += 1
-            
-            elif action_id == "DELETE_FLOW":
-                try:
-                    confirm = processed_parameters.get("confirm", "否")
-                    clear_variables = processed_parameters.get("clear_variables", "否")
-                    
-                    if confirm == "是":
-                        # 记录操作，但实际删除操作将在流程执行完成后进行
-                        self._pending_delete_flow = True
-                        self._pending_clear_variables = (clear_variables == "是")
-                        
-                        if on_step_complete:
-                            on_step_complete(execution_pointer, True, "流程将在执行完成后删除")
+                # 如果有变量管理器，处理参数中的变量引用；无模板的步骤直接使用原参数（执行期视为只读）
+                if template_free_steps.get(id(step)) is step:
+                    processed_parameters = parameters
+                else:
+                    resolved_entry = resolved_parameters.get(execution_pointer)
+                    if resolved_entry is not None and resolved_entry[0] is step:
+                        processed_parameters = resolved_entry[1]
                     else:
-                        if on_step_complete:
-                            on_step_complete(execution_pointer, True, "流程删除操作已取消")
-                except Exception as e:
-                    flow_success = False
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, False, f"删除流程错误: {str(e)}")
+                        processed_parameters = process_parameters(parameters)
                 
-                execution_pointer += 1
-            
-            elif action_id == "CLEAR_VARIABLES":
-                try:
-                    var_scope = processed_parameters.get("variable_scope", VariableScope.TEMPORARY)
-                    
-                    self._variable_manager.clear_scope(var_scope)
-                    
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, True, f"已清空作用域 {var_scope} 的所有变量")
-                except Exception as e:
-                    flow_success = False
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, False, f"清空变量错误: {str(e)}")
+                # 通知步骤开始
+                emit(on_step_start, execution_pointer, step)
                 
-                execution_pointer += 1
-            
-            # 循环控制
-            elif action_id == "FOR_LOOP":
-                # 循环参数
-                loop_variable = processed_parameters.get("loop_variable", "i")
-                start_value = processed_parameters.get("start_value", 0)
-                end_value = processed_parameters.get("end_value", 10)
-                step_value = processed_parameters.get("step_value", 1)
-                
-                # 创建或更新循环变量
-                if isinstance(start_value, str):
-                    try:
-                        start_value = int(start_value)
-                    except ValueError:
-                        if on_step_complete:
-                            on_step_complete(execution_pointer, False, f"无效的循环起始值: {start_value}")
+                # 处理特殊控制流步骤
+                handler = self._CONTROL_FLOW_HANDLERS.get(action_id)
+                if handler is not None:
+                    next_pointer, step_success = handler(
+                        self, execution_pointer, step, processed_parameters, execution_stack, on_step_complete
+                    )
+                    if not step_success:
                         flow_success = False
-                        break
-                
-                self._variable_manager.create_variable(
-                    loop_variable, start_value, "integer", VariableScope.LOCAL
-                )
-                
-                # 将循环状态压入栈
-                execution_stack.append({
-                    "type": "for_loop",
-                    "loop_variable": loop_variable,
-                    "current_value": start_value,
-                    "end_value": end_value,
-                    "step_value": step_value,
-                    "loop_start": execution_pointer
-                })
+                    if next_pointer is None:
+                        raise _FlowAbort(flow_success)
+                    execution_pointer = next_pointer
                 
-                execution_pointer += 1
-                if on_step_complete:
-                    on_step_complete(execution_pointer, True, 
-                                    f"开始循环: {loop_variable}={start_value} 到 {end_value}, 步长={step_value}")
-            
-            elif action_id == "END_FOR_LOOP":
-                # 检查栈顶是否为 FOR_LOOP
-                if execution_stack and execution_stack[-1]["type"] == "for_loop":
-                    loop_frame = execution_stack[-1]
-                    
-                    # 更新循环变量
-                    new_value = loop_frame["current_value"] + loop_frame["step_value"]
-                    self._variable_manager.set_variable(
-                        loop_frame["loop_variable"], new_value, VariableScope.LOCAL
-                    )
-                    loop_frame["current_value"] = new_value
-                    
-                    # 检查循环是否结束
-                    step_is_positive = loop_frame["step_value"] > 0
-                    if (step_is_positive and new_value <= loop_frame["end_value"]) or \
-                       (not step_is_positive and new_value >= loop_frame["end_value"]):
-                        # 继续循环，跳回循环开始处
-                        execution_pointer = loop_frame["loop_start"] + 1
-                    else:
-                        # 循环结束，弹出栈帧
-                        execution_stack.pop()
-                        execution_pointer += 1
-                    
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, True, 
-                                        f"循环迭代: {loop_frame['loop_variable']}={new_value}")
+                # 常规动作
                 else:
-                    # 栈为空或栈顶不是 FOR_LOOP
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, False, "END_FOR_LOOP 没有匹配的 FOR_LOOP")
-                    flow_success = False
-                    break
-            
-            elif action_id == "FOREACH_LOOP":
-                # 遍历集合的循环
-                item_variable = processed_parameters.get("item_variable", "item")
-                collection_variable = processed_parameters.get("collection_variable", "")
-                index_variable = processed_parameters.get("index_variable")
-                
-                # 获取要遍历的集合
-                collection = self._variable_manager.get_variable(collection_variable)
-                if collection is None:
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, False, f"集合变量不存在: {collection_variable}")
-                    flow_success = False
-                    break
-                
-                if not isinstance(collection, (list, tuple, dict, str)):
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, False, 
-                                        f"变量 {collection_variable} 不是可遍历的集合")
-                    flow_success = False
-                    break
-                
-                # 创建循环框架并直接加入栈中
-                loop_frame = {
-                    "type": "foreach",  # 直接使用foreach类型，不用pending状态
-                    "item_variable": item_variable,
-                    "collection_variable": collection_variable,
-                    "index_variable": index_variable,
-                    "loop_start": execution_pointer,
-                    "collection": collection,
-                    "current_index": 0
-                }
-                execution_stack.append(loop_frame)
-                
-                # 设置第一个项目
-                if isinstance(collection, (list, tuple, str)):
-                    if collection:  # 集合非空
-                        self._variable_manager.create_variable(
-                            item_variable, collection[0], None, VariableScope.LOCAL
-                        )
-                        if index_variable:
-                            self._variable_manager.create_variable(
-                                index_variable, 0, "integer", VariableScope.LOCAL
+                    # 浏览器动作耗时较长，执行前先通知调用方把已累积的事件转发给界面
+                    self._flush_events()
+                    try:
+                        # 执行动作，添加步骤时已构建好SQL的 DB_BUILD_* 步骤直接使用构建结果
+                        if action_id in _VARIABLE_VALUE_PARAMS:
+                            processed_parameters = self._bind_variable_value(action_id, processed_parameters)
+                        compiled_entry = compiled_queries.get(id(step))
+                        if compiled_entry is not None and compiled_entry[0] is step:
+                            success, message = self._engine.execute_precompiled_query(
+                                action_id, processed_parameters, compiled_entry[1]
                             )
-                    else:  # 空集合，跳过循环体
-                        # 寻找对应的 END_FOREACH_LOOP
-                        nesting_level = 1
-                        temp_pointer = execution_pointer + 1
-                        
-                        while temp_pointer < len(self._steps) and nesting_level > 0:
-                            temp_step = self._steps[temp_pointer]
-                            temp_action_id = temp_step.get("action_id")
-                            
-                            if temp_action_id == "FOREACH_LOOP":
-                                nesting_level += 1
-                            elif temp_action_id == "END_FOREACH_LOOP":
-                                nesting_level -= 1
-                            
-                            temp_pointer += 1
+                        else:
+                            success, message = execute_action(action_id, processed_parameters)
                         
-                        if nesting_level == 0:
-                            execution_stack.pop()  # 移除循环帧
-                            execution_pointer = temp_pointer
-                            if on_step_complete:
-                                on_step_complete(execution_pointer, True, "跳过空集合的循环")
-                            continue
-                elif isinstance(collection, dict):
-                    keys = list(collection.keys())
-                    if keys:  # 字典非空
-                        first_key = keys[0]
-                        self._variable_manager.create_variable(
-                            item_variable, collection[first_key], None, VariableScope.LOCAL
-                        )
-                        if index_variable:
-                            self._variable_manager.create_variable(
-                                index_variable, first_key, None, VariableScope.LOCAL
-                            )
-                    else:  # 空字典，跳过循环体
-                        # 寻找对应的 END_FOREACH_LOOP
-                        nesting_level = 1
-                        temp_pointer = execution_pointer + 1
+                        # 检查是否为信息获取操作，如果是则保存结果到变量
+                        if success and isinstance(message, dict):
+                            variable_name = message.get("save_to_variable", _MISSING)
+                            info = _MISSING if variable_name is _MISSING else message.get("info", _MISSING)
+                            if info is not _MISSING:
+                                variable_manager.set_variable(variable_name, info)
+                                # 依赖该变量的预解析参数失效，改为执行时解析
+                                for index in resolved_dependents.pop(variable_name, ()):
+                                    resolved_parameters.pop(index, None)
+                                # 更新消息为更友好的提示
+                                friendly_message = message.get("message", _MISSING)
+                                message = (f"信息已保存到变量: {variable_name}"
+                                           if friendly_message is _MISSING else friendly_message)
                         
-                        while temp_pointer < len(self._steps) and nesting_level > 0:
-                            temp_step = self._steps[temp_pointer]
-                            temp_action_id = temp_step.get("action_id")
-                            
-                            if temp_action_id == "FOREACH_LOOP":
-                                nesting_level += 1
-                            elif temp_action_id == "END_FOREACH_LOOP":
-                                nesting_level -= 1
-                            
-                            temp_pointer += 1
+                        # 通知步骤完成
+                        emit(on_step_complete, execution_pointer, success, message)
                         
-                        if nesting_level == 0:
-                            execution_stack.pop()  # 移除循环帧
-                            execution_pointer = temp_pointer
-                            if on_step_complete:
-                                on_step_complete(execution_pointer, True, "跳过空字典的循环")
-                            continue
-                
-                execution_pointer += 1
-                if on_step_complete:
-                    on_step_complete(execution_pointer, True, f"开始遍历: {collection_variable}")
-            
-            elif action_id == "END_FOREACH_LOOP":
-                # 检查栈顶是否为 FOREACH
-                if execution_stack and execution_stack[-1]["type"] == "foreach":
-                    loop_frame = execution_stack[-1]
-                    collection = loop_frame["collection"]
-                    
-                    # 增加索引
-                    new_index = loop_frame["current_index"] + 1
-                    
-                    # 检查是否已遍历完所有元素
-                    if isinstance(collection, (list, tuple, str)) and new_index < len(collection):
-                        # 更新项目变量和索引变量
-                        self._variable_manager.set_variable(
-                            loop_frame["item_variable"], collection[new_index], VariableScope.LOCAL
-                        )
-                        if loop_frame["index_variable"]:
-                            self._variable_manager.set_variable(
-                                loop_frame["index_variable"], new_index, VariableScope.LOCAL
-                            )
+                        if not success:
+                            flow_success = False
                         
-                        loop_frame["current_index"] = new_index
-                        execution_pointer = loop_frame["loop_start"] + 1
-                    elif isinstance(collection, dict):
-                        keys = list(collection.keys())
-                        if new_index < len(keys):
-                            key = keys[new_index]
-                            self._variable_manager.set_variable(
-                                loop_frame["item_variable"], collection[key], VariableScope.LOCAL
-                            )
-                            if loop_frame["index_variable"]:
-                                self._variable_manager.set_variable(
-                                    loop_frame["index_variable"], key, VariableScope.LOCAL
-                                )
-                            
-                            loop_frame["current_index"] = new_index
-                            execution_pointer = loop_frame["loop_start"] + 1
-                        else:
-                            # 遍历完成，弹出栈帧
-                            execution_stack.pop()
-                            execution_pointer += 1
-                    else:
-                        # 列表、元组或字符串遍历结束，弹出栈帧
-                        execution_stack.pop()
+                        # 处理try-catch
                         execution_pointer += 1
-                    
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, True, "FOREACH 循环迭代")
-                else:
-                    # 栈为空或栈顶不是 FOREACH
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, False, "END_FOREACH_LOOP 没有匹配的 FOREACH_LOOP")
-                    flow_success = False
-                    break
-            
-            # 常规动作
-            else:
-                try:
-                    # 执行动作
-                    success, message = self._engine.execute_action(action_id, processed_parameters)
-                    
-                    # 检查是否为信息获取操作，如果是则保存结果到变量
-                    if success and isinstance(message, dict) and "save_to_variable" in message:
-                        variable_name = message["save_to_variable"]
-                        if "info" in message:
-                            self._variable_manager.set_variable(variable_name, message["info"])
-                            # 更新消息为更友好的提示
-                            message = message.get("message", f"信息已保存到变量: {variable_name}")
-                    
-                    # 通知步骤完成
-                    if on_step_complete:
-                        on_step_complete(execution_pointer, success, message)
-                    
-                    if not success:
+                        
+                    except Exception as e:
+                        # 错误处理
                         flow_success = False
-                    
-                    # 处理try-catch
-                    execution_pointer += 1
-                    
-                except Exception as e:
-                    # 错误处理
-                    flow_success = False
-                    
-                    # 检查是否是连接断开的错误，如果是则重新初始化浏览器
-                    error_str = str(e)
-                    connection_lost = any(msg in error_str for msg in [
-                        "连接已断开", "Connection lost", "Target closed", 
-                        "Page crashed", "Session closed", "WebSocketClosed"
-                    ])
-                    
-                    if connection_lost:
-                        if on_step_complete:
-                            on_step_complete(execution_pointer, False, f"浏览器连接已断开，尝试重新初始化")
                         
-                        # 关闭现有连接
-                        self._engine.close()
+                        # 检查是否是连接断开的错误，如果是则重新初始化浏览器
+                        error_str = str(e)
+                        connection_lost = self._CONNECTION_LOST_RE.search(error_str) is not None
                         
-                        # 重新初始化浏览器
-                        success = self._engine.initialize(page_type='chromium')
+                        if connection_lost:
+                            emit(on_step_complete, execution_pointer, False, "浏览器连接已断开，尝试重新初始化")
+                            
+                            # 关闭现有连接
+                            self._engine.close()
+                            
+                            # 重新初始化浏览器
+                            success = self._engine.initialize(page_type='chromium')
+                            
+                            if success:
+                                emit(on_step_complete, execution_pointer, True, "浏览器已成功重新初始化，继续执行")
+                                continue  # 重试当前步骤
+                            else:
+                                emit(on_step_complete, execution_pointer, False, "浏览器重新初始化失败，停止执行")
+                                raise _FlowAbort(False)  # 停止执行
                         
-                        if success:
-                            if on_step_complete:
-                                on_step_complete(execution_pointer, True, "浏览器已成功重新初始化，继续执行")
-                            continue  # 重试当前步骤
-                        else:
-                            if on_step_complete:
-                                on_step_complete(execution_pointer, False, "浏览器重新初始化失败，停止执行")
-                            break  # 停止执行
-                    
-                    # 检查是否在try块中
-                    in_try_block = False
-                    for try_block in reversed(self._active_try_blocks):
-                        if not try_block.catch_executed and not try_block.exception:
+                        # 检查是否在try块中，异常交给最内层尚未捕获异常的 try 块
+                        in_try_block = False
+                        try_block = self._innermost_open_try
+                        if try_block is not None:
                             try_block.exception = e
+                            self._innermost_open_try = try_block.outer_open_block
                             in_try_block = True
-                            break
-                    
-                    if in_try_block:
-                        # 如果在try块中发生异常，记录异常但不中断执行
-                        self._error_handler.record_error(execution_pointer, action_id, str(e))
-                        return False, f"步骤执行错误: {str(e)}"
-                    else:
-                        raise  # 否则向上传递异常
+                        
+                        if in_try_block:
+                            # 如果在try块中发生异常，记录异常但不中断执行
+                            self._flush_events()
+                            self._error_handler.record_error(execution_pointer, action_id, str(e))
+                            return False, f"步骤执行错误: {str(e)}"
+                        else:
+                            self._flush_events()
+                            raise  # 否则向上传递异常
+        except _FlowAbort as abort:
+            # 控制流结束或浏览器无法恢复时提前退出循环
+            flow_success = abort.args[0]
+        
+        # 派发剩余的步骤事件
+        self._flush_events()
+        self._on_events_flushed = None
         
         # 流程执行完成
         self._is_executing = False
@@ -862,6 +1379,637 @@ class FlowController:
         if on_flow_complete:
             on_flow_complete(flow_success)
     
+    def _handle_if_condition(self, execution_pointer: int, step: Dict[str, Any],
+                             processed_parameters: Dict[str, Any], execution_stack: List[Dict[str, Any]],
+                             on_step_complete: Optional[Callable]) -> Tuple[Optional[int], bool]:
+        """处理 IF_CONDITION：评估条件并压入 IF 栈帧"""
+        step_success = True
+        
+        # 评估条件
+        try:
+            condition_result, condition_message = self._evaluate_condition(processed_parameters)
+            
+            # 通知步骤完成
+            self._emit_format(on_step_complete, execution_pointer, True, "条件判断: %s", condition_message)
+            
+            # 将条件结果和当前位置压入栈
+            execution_stack.append({
+                "type": "if",
+                "condition_result": condition_result,
+                "if_pointer": execution_pointer,
+                "in_else_branch": False
+            })
+        except Exception as e:
+            step_success = False
+            self._emit_format(on_step_complete, execution_pointer, False, "条件评估错误: %s", e)
+            # 根据错误处理策略决定下一步操作
+            step_key = f"{execution_pointer}_{step.get('action_id')}"
+            retry_count = self._retry_counts.get(step_key, 0)
+            strategy, jump_to = self._handle_error(e, step, retry_count, 3)
+            self._retry_counts[step_key] = retry_count + 1
+            
+            if strategy == ErrorStrategy.STOP:
+                return None, False
+            elif strategy == ErrorStrategy.RETRY:
+                return execution_pointer, step_success
+            elif strategy == ErrorStrategy.JUMP:
+                execution_pointer = jump_to
+                return execution_pointer, step_success
+            # 其他情况（如CONTINUE），跳过当前步骤继续执行
+        
+        execution_pointer += 1
+        
+        return execution_pointer, step_success
+    
+    def _handle_else_condition(self, execution_pointer: int, step: Dict[str, Any],
+                               processed_parameters: Dict[str, Any], execution_stack: List[Dict[str, Any]],
+                               on_step_complete: Optional[Callable]) -> Tuple[Optional[int], bool]:
+        """处理 ELSE_CONDITION：条件为真时跳过 ELSE 分支"""
+        step_success = True
+        
+        # 检查栈顶是否为 IF
+        if execution_stack and execution_stack[-1]["type"] == "if":
+            stack_frame = execution_stack[-1]
+            
+            # 如果条件为真，则跳过 ELSE 块
+            if stack_frame["condition_result"]:
+                # 寻找对应的 END_IF_CONDITION
+                nesting_level = 1
+                temp_pointer = execution_pointer + 1
+                
+                while temp_pointer < len(self._steps) and nesting_level > 0:
+                    temp_step = self._steps[temp_pointer]
+                    temp_action_id = temp_step.get("action_id")
+                    
+                    if temp_action_id == "IF_CONDITION":
+                        nesting_level += 1
+                    elif temp_action_id == "END_IF_CONDITION":
+                        nesting_level -= 1
+                    
+                    temp_pointer += 1
+                
+                if nesting_level == 0:
+                    # 找到了 END_IF_CONDITION，跳到那里
+                    execution_pointer = temp_pointer
+                    # 更新栈帧，表示现在在 ELSE 分支
+                    stack_frame["in_else_branch"] = True
+                else:
+                    # 没找到匹配的 END_IF_CONDITION
+                    self._emit(on_step_complete, execution_pointer, False, "找不到匹配的 END_IF_CONDITION")
+                    return None, False
+            else:
+                # 条件为假，继续执行 ELSE 块
+                stack_frame["in_else_branch"] = True
+                execution_pointer += 1
+        else:
+            # 栈为空或栈顶不是 IF
+            self._emit(on_step_complete, execution_pointer, False, "ELSE 没有匹配的 IF")
+            return None, False
+        
+        # 通知步骤完成
+        self._emit(on_step_complete, execution_pointer, True, "ELSE 条件处理完成")
+        
+        return execution_pointer, step_success
+    
+    def _handle_end_if_condition(self, execution_pointer: int, step: Dict[str, Any],
+                                 processed_parameters: Dict[str, Any], execution_stack: List[Dict[str, Any]],
+                                 on_step_complete: Optional[Callable]) -> Tuple[Optional[int], bool]:
+        """处理 END_IF_CONDITION：弹出 IF 栈帧"""
+        step_success = True
+        
+        # 检查栈顶是否为 IF
+        if execution_stack and execution_stack[-1]["type"] == "if":
+            # 弹出栈顶 IF
+            execution_stack.pop()
+            execution_pointer += 1
+            self._emit(on_step_complete, execution_pointer, True, "IF 块结束")
+        else:
+            # 栈为空或栈顶不是 IF
+            self._emit(on_step_complete, execution_pointer, False, "END_IF 没有匹配的 IF")
+            return None, False
+        
+        return execution_pointer, step_success
+    
+    def _handle_try_block(self, execution_pointer: int, step: Dict[str, Any],
+                          processed_parameters: Dict[str, Any], execution_stack: List[Dict[str, Any]],
+                          on_step_complete: Optional[Callable]) -> Tuple[Optional[int], bool]:
+        """处理 TRY_BLOCK：进入新的 try 块"""
+        step_success = True
+        
+        # 创建新的 try 块
+        try_block = TryCatchBlock(
+            try_steps=[],  # 将在执行过程中填充
+            catch_steps=processed_parameters.get("catch_steps", []),
+            finally_steps=processed_parameters.get("finally_steps", [])
+        )
+        try_block.outer_open_block = self._innermost_open_try
+        self._innermost_open_try = try_block
+        self._active_try_blocks.append(try_block)
+        execution_pointer += 1
+        self._emit(on_step_complete, execution_pointer, True, "进入 TRY 块")
+        
+        return execution_pointer, step_success
+    
+    def _handle_catch_block(self, execution_pointer: int, step: Dict[str, Any],
+                            processed_parameters: Dict[str, Any], execution_stack: List[Dict[str, Any]],
+                            on_step_complete: Optional[Callable]) -> Tuple[Optional[int], bool]:
+        """处理 CATCH_BLOCK：有捕获的异常时执行 catch 块，否则跳过"""
+        step_success = True
+        
+        # 如果没有活动的try块，或未捕获异常，则跳过catch块
+        if not self._active_try_blocks or not self._active_try_blocks[-1].exception:
+            # 寻找对应的 END_CATCH_BLOCK 或 FINALLY_BLOCK
+            nesting_level = 1
+            temp_pointer = execution_pointer + 1
+            
+            while temp_pointer < len(self._steps) and nesting_level > 0:
+                temp_step = self._steps[temp_pointer]
+                temp_action_id = temp_step.get("action_id")
+                
+                if temp_action_id in ["FINALLY_BLOCK", "END_TRY_BLOCK"]:
+                    break
+                
+                temp_pointer += 1
+            
+            execution_pointer = temp_pointer
+        else:
+            # 有捕获的异常，执行catch块
+            self._active_try_blocks[-1].catch_executed = True
+            # 将异常信息存储为变量
+            if self._active_try_blocks[-1].exception:
+                error_type = type(self._active_try_blocks[-1].exception).__name__
+                error_message = str(self._active_try_blocks[-1].exception)
+                
+                self._variable_manager.create_variable(
+                    "error_type", error_type, "string", VariableScope.TEMPORARY
+                )
+                self._variable_manager.create_variable(
+                    "error_message", error_message, "string", VariableScope.TEMPORARY
+                )
+            
+            execution_pointer += 1
+        
+        self._emit(on_step_complete, execution_pointer, True, "CATCH 块处理")
+        
+        return execution_pointer, step_success
+    
+    def _handle_finally_block(self, execution_pointer: int, step: Dict[str, Any],
+                              processed_parameters: Dict[str, Any], execution_stack: List[Dict[str, Any]],
+                              on_step_complete: Optional[Callable]) -> Tuple[Optional[int], bool]:
+        """处理 FINALLY_BLOCK：标记 finally 块已执行"""
+        step_success = True
+        
+        # 标记finally块已执行
+        if self._active_try_blocks:
+            self._active_try_blocks[-1].finally_executed = True
+        
+        execution_pointer += 1
+        self._emit(on_step_complete, execution_pointer, True, "进入 FINALLY 块")
+        
+        return execution_pointer, step_success
+    
+    def _handle_end_try_block(self, execution_pointer: int, step: Dict[str, Any],
+                              processed_parameters: Dict[str, Any], execution_stack: List[Dict[str, Any]],
+                              on_step_complete: Optional[Callable]) -> Tuple[Optional[int], bool]:
+        """处理 END_TRY_BLOCK：结束并弹出当前 try 块"""
+        step_success = True
+        
+        # 结束try-catch-finally块
+        if self._active_try_blocks:
+            # 如果有finally块但未执行，应执行finally
+            try_block = self._active_try_blocks[-1]
+            if try_block.finally_steps and not try_block.finally_executed:
+                # 执行finally块
+                # 这里需要流程控制器支持跳转到指定步骤列表
+                # 暂时简化处理，实际实现需要更复杂的逻辑
+                pass
+            
+            # 弹出当前try块
+            if self._innermost_open_try is try_block:
+                self._innermost_open_try = try_block.outer_open_block
+            self._active_try_blocks.pop()
+        
+        execution_pointer += 1
+        self._emit(on_step_complete, execution_pointer, True, "TRY-CATCH-FINALLY 块结束")
+        
+        return execution_pointer, step_success
+    
+    def _handle_set_variable(self, execution_pointer: int, step: Dict[str, Any],
+                             processed_parameters: Dict[str, Any], execution_stack: List[Dict[str, Any]],
+                             on_step_complete: Optional[Callable]) -> Tuple[Optional[int], bool]:
+        """处理 SET_VARIABLE：更新或创建变量"""
+        step_success = True
+        
+        try:
+            var_name = processed_parameters.get("variable_name", "")
+            var_value = processed_parameters.get("variable_value")
+            var_type = processed_parameters.get("variable_type")
+            var_scope = processed_parameters.get("variable_scope", VariableScope.GLOBAL)
+            var_description = processed_parameters.get("variable_description", "")
+            
+            # 检查变量是否已存在
+            existing_var = self._variable_manager.get_variable(var_name)
+            if existing_var is not None:
+                # 更新变量
+                success, message = self._variable_manager.set_variable(var_name, var_value)
+            else:
+                # 创建新变量
+                success, message = self._variable_manager.create_variable(
+                    var_name, var_value, var_type, var_scope, var_description
+                )
+            
+            self._emit(on_step_complete, execution_pointer, success, message)
+            
+            if not success:
+                step_success = False
+        except Exception as e:
+            step_success = False
+            self._emit_format(on_step_complete, execution_pointer, False, "设置变量错误: %s", e)
+        
+        execution_pointer += 1
+        
+        return execution_pointer, step_success
+    
+    def _handle_delete_variable(self, execution_pointer: int, step: Dict[str, Any],
+                                processed_parameters: Dict[str, Any], execution_stack: List[Dict[str, Any]],
+                                on_step_complete: Optional[Callable]) -> Tuple[Optional[int], bool]:
+        """处理 DELETE_VARIABLE：删除变量"""
+        step_success = True
+        
+        try:
+            var_name = processed_parameters.get("variable_name", "")
+            var_scope = processed_parameters.get("variable_scope")
+            
+            success, message = self._variable_manager.delete_variable(var_name, var_scope)
+            
+            self._emit(on_step_complete, execution_pointer, success, message)
+            
+            if not success:
+                step_success = False
+        except Exception as e:
+            step_success = False
+            self._emit_format(on_step_complete, execution_pointer, False, "删除变量错误: %s", e)
+        
+        execution_pointer += 1
+        
+        return execution_pointer, step_success
+    
+    def _handle_delete_flow(self, execution_pointer: int, step: Dict[str, Any],
+                            processed_parameters: Dict[str, Any], execution_stack: List[Dict[str, Any]],
+                            on_step_complete: Optional[Callable]) -> Tuple[Optional[int], bool]:
+        """处理 DELETE_FLOW：登记流程执行完成后的删除操作"""
+        step_success = True
+        
+        try:
+            confirm = processed_parameters.get("confirm", "否")
+            clear_variables = processed_parameters.get("clear_variables", "否")
+            
+            if confirm == "是":
+                # 记录操作，但实际删除操作将在流程执行完成后进行
+                self._pending_delete_flow = True
+                self._pending_clear_variables = (clear_variables == "是")
+                
+                self._emit(on_step_complete, execution_pointer, True, "流程将在执行完成后删除")
+            else:
+                self._emit(on_step_complete, execution_pointer, True, "流程删除操作已取消")
+        except Exception as e:
+            step_success = False
+            self._emit_format(on_step_complete, execution_pointer, False, "删除流程错误: %s", e)
+        
+        execution_pointer += 1
+        
+        return execution_pointer, step_success
+    
+    def _handle_clear_variables(self, execution_pointer: int, step: Dict[str, Any],
+                                processed_parameters: Dict[str, Any], execution_stack: List[Dict[str, Any]],
+                                on_step_complete: Optional[Callable]) -> Tuple[Optional[int], bool]:
+        """处理 CLEAR_VARIABLES：清空指定作用域的变量"""
+        step_success = True
+        
+        try:
+            var_scope = processed_parameters.get("variable_scope", VariableScope.TEMPORARY)
+            
+            self._variable_manager.clear_scope(var_scope)
+            
+            self._emit_format(on_step_complete, execution_pointer, True, "已清空作用域 %s 的所有变量", var_scope)
+        except Exception as e:
+            step_success = False
+            self._emit_format(on_step_complete, execution_pointer, False, "清空变量错误: %s", e)
+        
+        execution_pointer += 1
+        
+        return execution_pointer, step_success
+    
+    def _handle_for_loop(self, execution_pointer: int, step: Dict[str, Any],
+                         processed_parameters: Dict[str, Any], execution_stack: List[Dict[str, Any]],
+                         on_step_complete: Optional[Callable]) -> Tuple[Optional[int], bool]:
+        """处理 FOR_LOOP：创建循环变量并压入循环栈帧"""
+        step_success = True
+        
+        # 循环参数
+        loop_variable = processed_parameters.get("loop_variable", "i")
+        start_value = processed_parameters.get("start_value", 0)
+        end_value = processed_parameters.get("end_value", 10)
+        step_value = processed_parameters.get("step_value", 1)
+        
+        # 创建或更新循环变量
+        if isinstance(start_value, str):
+            try:
+                start_value = int(start_value)
+            except ValueError:
+                self._emit_format(on_step_complete, execution_pointer, False, "无效的循环起始值: %s", start_value)
+                return None, False
+        
+        self._variable_manager.create_variable(
+            loop_variable, start_value, "integer", VariableScope.LOCAL
+        )
+        
+        # 将循环状态压入栈
+        execution_stack.append({
+            "type": "for_loop",
+            "loop_variable": loop_variable,
+            "current_value": start_value,
+            "end_value": end_value,
+            "step_value": step_value,
+            "loop_start": execution_pointer
+        })
+        
+        execution_pointer += 1
+        self._emit_format(on_step_complete, execution_pointer, True,
+                          "开始循环: %s=%s 到 %s, 步长=%s", loop_variable, start_value, end_value, step_value)
+        
+        return execution_pointer, step_success
+    
+    def _handle_end_for_loop(self, execution_pointer: int, step: Dict[str, Any],
+                             processed_parameters: Dict[str, Any], execution_stack: List[Dict[str, Any]],
+                             on_step_complete: Optional[Callable]) -> Tuple[Optional[int], bool]:
+        """处理 END_FOR_LOOP：更新循环变量，未结束时跳回循环开始处"""
+        step_success = True
+        
+        # 检查栈顶是否为 FOR_LOOP
+        if execution_stack and execution_stack[-1]["type"] == "for_loop":
+            loop_frame = execution_stack[-1]
+            
+            # 更新循环变量
+            new_value = loop_frame["current_value"] + loop_frame["step_value"]
+            self._variable_manager.set_variable(
+                loop_frame["loop_variable"], new_value, VariableScope.LOCAL
+            )
+            loop_frame["current_value"] = new_value
+            
+            # 检查循环是否结束
+            step_is_positive = loop_frame["step_value"] > 0
+            if (step_is_positive and new_value <= loop_frame["end_value"]) or \
+               (not step_is_positive and new_value >= loop_frame["end_value"]):
+                # 继续循环，跳回循环开始处
+                execution_pointer = loop_frame["loop_start"] + 1
+            else:
+                # 循环结束，弹出栈帧
+                execution_stack.pop()
+                execution_pointer += 1
+            
+            self._emit_format(on_step_complete, execution_pointer, True,
+                              "循环迭代: %s=%s", loop_frame['loop_variable'], new_value)
+        else:
+            # 栈为空或栈顶不是 FOR_LOOP
+            self._emit(on_step_complete, execution_pointer, False, "END_FOR_LOOP 没有匹配的 FOR_LOOP")
+            return None, False
+        
+        return execution_pointer, step_success
+    
+    def _handle_foreach_loop(self, execution_pointer: int, step: Dict[str, Any],
+                             processed_parameters: Dict[str, Any], execution_stack: List[Dict[str, Any]],
+                             on_step_complete: Optional[Callable]) -> Tuple[Optional[int], bool]:
+        """处理 FOREACH_LOOP：设置第一个元素并压入循环栈帧，空集合时跳过循环体"""
+        step_success = True
+        
+        # 遍历集合的循环
+        item_variable = processed_parameters.get("item_variable", "item")
+        collection_variable = processed_parameters.get("collection_variable", "")
+        index_variable = processed_parameters.get("index_variable")
+        
+        # 获取要遍历的集合
+        collection = self._variable_manager.get_variable(collection_variable)
+        if collection is None:
+            self._emit_format(on_step_complete, execution_pointer, False, "集合变量不存在: %s", collection_variable)
+            return None, False
+        
+        if not isinstance(collection, (list, tuple, dict, str)):
+            self._emit_format(on_step_complete, execution_pointer, False,
+                              "变量 %s 不是可遍历的集合", collection_variable)
+            return None, False
+        
+        # 创建循环框架（优先复用已释放的帧）并直接加入栈中
+        loop_frame = self._loop_frame_pool.pop() if self._loop_frame_pool else _LoopFrame()
+        loop_frame.item_variable = item_variable
+        loop_frame.collection_variable = collection_variable
+        loop_frame.index_variable = index_variable
+        loop_frame.loop_start = execution_pointer
+        loop_frame.collection = collection
+        loop_frame.current_index = 0
+        loop_frame.length = len(collection)
+        if isinstance(collection, dict):
+            # 字典的键值对在进入循环时按顺序展开一次，迭代时按位置读取
+            items = self._item_list_pool.pop() if self._item_list_pool else []
+            items.extend(collection.items())
+            loop_frame.items = items
+        execution_stack.append(loop_frame)
+        
+        # 设置第一个项目
+        if isinstance(collection, (list, tuple, str)):
+            if collection:  # 集合非空
+                self._variable_manager.create_variable(
+                    item_variable, collection[0], None, VariableScope.LOCAL
+                )
+                if index_variable:
+                    self._variable_manager.create_variable(
+                        index_variable, 0, "integer", VariableScope.LOCAL
+                    )
+            else:  # 空集合，跳过循环体
+                # 寻找对应的 END_FOREACH_LOOP
+                nesting_level = 1
+                temp_pointer = execution_pointer + 1
+                
+                while temp_pointer < len(self._steps) and nesting_level > 0:
+                    temp_step = self._steps[temp_pointer]
+                    temp_action_id = temp_step.get("action_id")
+                    
+                    if temp_action_id == "FOREACH_LOOP":
+                        nesting_level += 1
+                    elif temp_action_id == "END_FOREACH_LOOP":
+                        nesting_level -= 1
+                    
+                    temp_pointer += 1
+                
+                if nesting_level == 0:
+                    self._release_loop_frame(execution_stack.pop())  # 移除循环帧
+                    execution_pointer = temp_pointer
+                    self._emit(on_step_complete, execution_pointer, True, "跳过空集合的循环")
+                    return execution_pointer, step_success
+        elif isinstance(collection, dict):
+            items = loop_frame.items
+            if items:  # 字典非空
+                first_key, first_value = items[0]
+                self._variable_manager.create_variable(
+                    item_variable, first_value, None, VariableScope.LOCAL
+                )
+                if index_variable:
+                    self._variable_manager.create_variable(
+                        index_variable, first_key, None, VariableScope.LOCAL
+                    )
+            else:  # 空字典，跳过循环体
+                # 寻找对应的 END_FOREACH_LOOP
+                nesting_level = 1
+                temp_pointer = execution_pointer + 1
+                
+                while temp_pointer < len(self._steps) and nesting_level > 0:
+                    temp_step = self._steps[temp_pointer]
+                    temp_action_id = temp_step.get("action_id")
+                    
+                    if temp_action_id == "FOREACH_LOOP":
+                        nesting_level += 1
+                    elif temp_action_id == "END_FOREACH_LOOP":
+                        nesting_level -= 1
+                    
+                    temp_pointer += 1
+                
+                if nesting_level == 0:
+                    self._release_loop_frame(execution_stack.pop())  # 移除循环帧
+                    execution_pointer = temp_pointer
+                    self._emit(on_step_complete, execution_pointer, True, "跳过空字典的循环")
+                    return execution_pointer, step_success
+        
+        # 循环变量的赋值函数在进入循环时生成一次，迭代时直接调用
+        loop_frame.set_item = self._variable_manager.make_fast_setter(
+            item_variable, VariableScope.LOCAL
+        )
+        loop_frame.set_index = self._variable_manager.make_fast_setter(
+            index_variable, VariableScope.LOCAL
+        ) if index_variable else None
+        
+        execution_pointer += 1
+        self._emit_format(on_step_complete, execution_pointer, True, "开始遍历: %s", collection_variable)
+        
+        return execution_pointer, step_success
+    
+    def _handle_end_foreach_loop(self, execution_pointer: int, step: Dict[str, Any],
+                                 processed_parameters: Dict[str, Any], execution_stack: List[Dict[str, Any]],
+                                 on_step_complete: Optional[Callable]) -> Tuple[Optional[int], bool]:
+        """处理 END_FOREACH_LOOP：设置下一个元素，遍历完成时弹出栈帧"""
+        step_success = True
+        
+        # 检查栈顶是否为 FOREACH
+        if execution_stack and execution_stack[-1]["type"] == "foreach":
+            loop_frame = execution_stack[-1]
+            collection = loop_frame.collection
+            
+            # 增加索引
+            new_index = loop_frame.current_index + 1
+            
+            # 按集合的具体类型查表取得迭代函数，子类回退到 isinstance 判断
+            next_item = _FOREACH_DISPATCH.get(type(collection))
+            if next_item is None:
+                next_item = _resolve_foreach_handler(collection)
+            
+            if next_item is not None and next_item(loop_frame, new_index):
+                loop_frame.current_index = new_index
+                execution_pointer = loop_frame.loop_start + 1
+            else:
+                # 遍历完成，弹出栈帧并回收
+                self._release_loop_frame(execution_stack.pop())
+                execution_pointer += 1
+            
+            self._emit(on_step_complete, execution_pointer, True, "FOREACH 循环迭代")
+        else:
+            # 栈为空或栈顶不是 FOREACH
+            self._emit(on_step_complete, execution_pointer, False, "END_FOREACH_LOOP 没有匹配的 FOREACH_LOOP")
+            return None, False
+        
+        return execution_pointer, step_success
+    
+    # 控制流步骤处理函数，返回 (下一步骤索引, 步骤是否成功)，下一步骤索引为None时停止执行
+    _CONTROL_FLOW_HANDLERS = {
+        "IF_CONDITION": _handle_if_condition,
+        "ELSE_CONDITION": _handle_else_condition,
+        "END_IF_CONDITION": _handle_end_if_condition,
+        "TRY_BLOCK": _handle_try_block,
+        "CATCH_BLOCK": _handle_catch_block,
+        "FINALLY_BLOCK": _handle_finally_block,
+        "END_TRY_BLOCK": _handle_end_try_block,
+        "SET_VARIABLE": _handle_set_variable,
+        "DELETE_VARIABLE": _handle_delete_variable,
+        "DELETE_FLOW": _handle_delete_flow,
+        "CLEAR_VARIABLES": _handle_clear_variables,
+        "FOR_LOOP": _handle_for_loop,
+        "END_FOR_LOOP": _handle_end_for_loop,
+        "FOREACH_LOOP": _handle_foreach_loop,
+        "END_FOREACH_LOOP": _handle_end_foreach_loop
+    }
+    
+    def _release_loop_frame(self, loop_frame: _LoopFrame) -> None:
+        """
+        清空已出栈的 FOREACH 循环帧并放回复用池
+        
+        Args:
+            loop_frame: 循环帧
+        """
+        items = loop_frame.items
+        if items is not None:
+            items.clear()
+            self._item_list_pool.append(items)
+        # 释放对集合和变量管理器的引用，字段在下次入栈时重新赋值
+        loop_frame.collection = None
+        loop_frame.items = None
+        loop_frame.set_item = None
+        loop_frame.set_index = None
+        self._loop_frame_pool.append(loop_frame)
+    
+    def _emit(self, callback: Optional[Callable], *args) -> None:
+        """
+        同步调用一次步骤回调，按数量或时间间隔通知调用方批量转发
+        
+        Args:
+            callback: 回调函数，为None时忽略
+            *args: 回调参数
+        """
+        if callback is None:
+            return
+        
+        callback(*args)
+        if self._on_events_flushed is None:
+            return
+        
+        self._pending_event_count += 1
+        if (self._pending_event_count >= EVENT_FLUSH_SIZE or
+                time.monotonic() - self._last_event_flush >= EVENT_FLUSH_INTERVAL):
+            self._flush_events()
+    
+    def _emit_format(self, callback: Optional[Callable], step_index: int, success: bool,
+                     template: str, *values) -> None:
+        """
+        调用一次带格式化消息的步骤回调，没有回调时不格式化消息
+        
+        Args:
+            callback: 回调函数，为None时忽略
+            step_index: 步骤索引
+            success: 步骤是否成功
+            template: %格式的消息模板
+            *values: 模板参数
+        """
+        if callback is None:
+            return
+        
+        self._emit(callback, step_index, success, template % values)
+    
+    def _flush_events(self) -> None:
+        """通知调用方转发上次通知后调用过的步骤回调"""
+        dispatched = self._pending_event_count > 0
+        self._pending_event_count = 0
+        self._last_event_flush = time.monotonic()
+        
+        if dispatched and self._on_events_flushed is not None:
+            self._on_events_flushed()
+    
     def stop_execution(self) -> None:
         """停止执行"""
         self._engine.request_stop()
@@ -876,6 +2024,36 @@ class FlowController:
         """是否正在执行"""
         return self._is_executing
     
+    def finish_execution(self) -> None:
+        """重置执行状态，供执行线程在流程结束或异常退出后调用"""
+        with self._execution_lock:
+            self._is_executing = False
+    
+    def record_log(self, level: str, message: str) -> None:
+        """
+        记录执行过程中的日志，可在执行线程中调用
+        
+        日志写入固定容量的环形缓冲区，不直接输出，由界面线程通过 drain_logs 取出。
+        
+        Args:
+            level: 日志级别（INFO、WARNING、ERROR）
+            message: 日志内容
+        """
+        self._log_ring.append((level, time.time(), message))
+    
+    def drain_logs(self) -> List[Tuple[str, float, str]]:
+        """
+        取出并清空已记录的日志
+        
+        Returns:
+            按记录顺序排列的 (级别, 时间戳, 消息) 列表
+        """
+        log_ring = self._log_ring
+        logs = []
+        while log_ring:
+            logs.append(log_ring.popleft())
+        return logs
+    
     def get_current_step_index(self) -> int:
         """获取当前执行的步骤索引"""
         return self._current_step_index
@@ -920,16 +2098,109 @@ class FlowController:
         return self._error_handler.get_error_statistics()
     
     # 内部辅助方法
+    def _preresolve_parameters(self) -> Tuple[Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]], Dict[str, List[int]]]:
+        """
+        执行开始前一次性解析不依赖流程内可变变量的步骤参数
+        
+        静态扫描 SET_VARIABLE、循环变量等写入目标，模板只引用其余变量的步骤在此处解析一次，
+        执行时直接复用。动作通过 save_to_variable 写入的变量在运行期按名称使对应结果失效。
+        
+        Returns:
+            (步骤索引 -> (步骤, 解析后的参数), 变量名 -> 依赖它的步骤索引列表)
+        """
+        resolved = {}
+        dependents = {}
+        
+        # 收集流程内会被改写的变量名
+        written = set(_CATCH_BLOCK_VARIABLES)
+        for step in self._steps:
+            action_id = step.get("action_id")
+            if action_id in _VARIABLE_RESET_ACTIONS:
+                return resolved, dependents
+            writer_params = _VARIABLE_WRITER_PARAMS.get(action_id)
+            if not writer_params:
+                continue
+            parameters = step.get("parameters", {})
+            for param_name, default_name in writer_params:
+                name = parameters.get(param_name, default_name)
+                if isinstance(name, str) and "${" in name:
+                    # 写入目标本身是模板，无法静态确定
+                    return resolved, dependents
+                if name:
+                    written.add(name)
+        
+        variable_manager = self._variable_manager
+        for index, step in enumerate(self._steps):
+            if self._is_template_free(step):
+                continue
+            parameters = step.get("parameters", {})
+            template_paths = _collect_template_paths(parameters)
+            if not template_paths:
+                continue
+            
+            references = set()
+            for path in template_paths:
+                value = parameters
+                for key in path:
+                    value = value[key]
+                references.update(variable_manager.get_template_references(value))
+            if references & written:
+                continue
+            
+            resolved[index] = (step, self._process_parameters(parameters))
+            for name in references:
+                dependents.setdefault(name, []).append(index)
+        
+        return resolved, dependents
+    
     def _process_parameters(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """处理参数中的变量引用"""
-        processed = copy.deepcopy(parameters)
+        """
+        处理参数中的变量引用
+        
+        不含模板的参数直接返回原字典，调用方不得修改返回值。
+        """
+        template_paths = _collect_template_paths(parameters)
+        if not template_paths:
+            return parameters
         
-        for key, value in processed.items():
-            if isinstance(value, str) and "${" in value:
-                processed[key] = self._variable_manager.process_template(value)
+        # 参数只读部分与原字典共享，仅复制实际被改写的容器
+        processed = dict(parameters)
+        copied_paths = set()
+        
+        # 只对包含模板的字符串做替换，静态值原样保留
+        for path in template_paths:
+            container = processed
+            for depth in range(len(path) - 1):
+                key = path[depth]
+                if path[:depth + 1] not in copied_paths:
+                    child = container[key]
+                    container[key] = dict(child) if isinstance(child, dict) else list(child)
+                    copied_paths.add(path[:depth + 1])
+                container = container[key]
+            container[path[-1]] = self._variable_manager.process_template(container[path[-1]])
         
         return processed
     
+    def _bind_variable_value(self, action_id: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        把变量名参数指定的变量值原样传给动作，列表等值不经过模板替换转成文本
+        
+        Args:
+            action_id: 动作ID
+            parameters: 处理过变量引用的参数，不会被修改
+            
+        Returns:
+            绑定变量值后的参数副本；未指定变量名时返回原参数
+        """
+        name_param, value_param = _VARIABLE_VALUE_PARAMS[action_id]
+        variable_name = parameters.get(name_param)
+        if not variable_name:
+            return parameters
+        
+        bound = dict(parameters)
+        bound[value_param] = self._variable_manager.get_variable(variable_name)
+        return bound
+    
     def _evaluate_condition(self, condition_params: Dict[str, Any]) -> Tuple[bool, str]:
         """评估条件表达式"""
         condition_type = condition_params.get("condition_type")
@@ -965,10 +2236,13 @@ class FlowController:
             
             # 清空步骤
             self._steps = []
+            self._template_free_steps.clear()
+            self._compiled_queries.clear()
             self._current_step_index = -1
             
             # 清空活动的 try-catch 块
             self._active_try_blocks = []
+            self._innermost_open_try = None
             
             # 如果需要，清空变量
             if clear_variables:
@@ -996,14 +2270,11 @@ class FlowController:
         Returns:
             DrissionPage的浏览器配置字典，包含options键
         """
-        # 导入ChromiumOptions
-        from DrissionPage import ChromiumOptions
-        
         # 处理参数中的变量引用
         processed_parameters = self._process_parameters(parameters)
         
         # 创建ChromiumOptions对象
-        options = ChromiumOptions()
+        options = _get_chromium_options_cls()()
         
         # 设置浏览器类型
         browser_type = processed_parameters.get("browser_type", "Chrome")
@@ -1046,14 +2317,14 @@ class FlowController:
         # 设置扩展程序
         load_extension = processed_parameters.get("load_extension", "")
         if load_extension:
-            extensions = [path.strip() for path in load_extension.split(',')]
+            extensions = _ARG_SPLIT_RE.split(load_extension.strip())
             for ext in extensions:
                 options.add_extension(ext)
         
         # 设置自定义参数
         custom_args = processed_parameters.get("custom_args", "")
         if custom_args:
-            args = [arg.strip() for arg in custom_args.split(',')]
+            args = _ARG_SPLIT_RE.split(custom_args.strip())
             for arg in args:
                 if arg.startswith('--'):
                     options.set_argument(arg)
@@ -1087,97 +2358,8 @@ class FlowController:
             self.create_variable("screenshot_dir", "screenshots", "string", VariableScope.GLOBAL)
             self.create_variable("scroll_distance", 300, "integer", VariableScope.GLOBAL)
             
-            # 步骤1: 打开浏览器访问百度
-            self.add_step("OPEN_BROWSER", {
-                "url": "https://www.baidu.com",
-                "browser_type": "Chrome",
-                "headless": "否",
-                "window_size": "1280,720"
-            })
-            
-            # 步骤2: 输入搜索关键词（使用变量）
-            self.add_step("ELEMENT_INPUT", {
-                "locator_strategy": "ID",
-                "locator_value": "kw",
-                "text_to_input": "${search_term}",  # 使用变量
-                "timeout": 10
-            })
-            
-            # 步骤3: 点击搜索按钮
-            self.add_step("ELEMENT_CLICK", {
-                "locator_strategy": "ID",
-                "locator_value": "su",
-                "timeout": 10
-            })
-            
-            # 等待搜索加载
-            self.add_step("LOG_MESSAGE", {
-                "message": "等待搜索 '${search_term}' 的结果加载中..."
-            })
-            
-            # 步骤4: 等待搜索结果加载
-            self.add_step("WAIT_FOR_ELEMENT", {
-                "locator_strategy": "css",
-                "locator_value": "#content_left",
-                "timeout": 15
-            })
-            
-            # 添加短暂等待，确保页面渲染完成
-            self.add_step("LOG_MESSAGE", {
-                "message": "等待页面渲染完成..."
-            })
-            
-            # 步骤5: 滚动页面（使用变量）
-            self.add_step("SCROLL_PAGE", {
-                "direction": "down",
-                "distance": "${scroll_distance}"  # 使用变量
-            })
-            
-            # 步骤6: 截图保存搜索结果（使用变量构建路径）
-            self.add_step("TAKE_SCREENSHOT", {
-                "save_path": "${screenshot_dir}/search_results.png",  # 使用变量构建路径
-                "save_full_page": "是"
-            })
-            
-            # 步骤7: 滚动回顶部（使用变量）
-            self.add_step("SCROLL_PAGE", {
-                "direction": "up",
-                "distance": "${scroll_distance}"  # 使用变量
-            })
-            
-            # 步骤8: 鼠标悬停在百度Logo上
-            self.add_step("MOUSE_HOVER", {
-                "locator_strategy": "ID",
-                "locator_value": "s_lg_img",
-                "duration": 1.0
-            })
-            
-            # 创建一个临时变量来存储当前搜索词
-            self.add_step("SET_VARIABLE", {
-                "variable_name": "current_search",
-                "variable_value": "${search_term2}",
-                "variable_scope": VariableScope.TEMPORARY
-            })
-            
-            # 步骤9: 再次搜索不同关键词（使用临时变量）
-            self.add_step("ELEMENT_INPUT", {
-                "locator_strategy": "ID",
-                "locator_value": "kw",
-                "text_to_input": "${current_search}",  # 使用临时变量
-                "timeout": 10
-            })
-            
-            # 步骤10: 点击搜索按钮
-            self.add_step("ELEMENT_CLICK", {
-                "locator_strategy": "ID",
-                "locator_value": "su",
-                "timeout": 10
-            })
-            
-            # 记录搜索内容
-            self.add_step("LOG_MESSAGE", {
-                "message": "已完成两次搜索：'${search_term}' 和 '${current_search}'"
-            })
+            # 批量添加流程步骤
+            self.extend_steps(_ADVANCED_INTERACTIONS_DEMO_STEPS)
             
             # 流程创建成功
             self._flow_modified = True
@@ -1200,41 +2382,8 @@ class FlowController:
             self.delete_flow(False)
             self.clear_variables()
             
-            # 步骤1: 打开浏览器访问百度
-            self.add_step("OPEN_BROWSER", {
-                "url": "https://www.baidu.com",
-                "browser_type": "Chrome",
-                "headless": "否",
-                "window_size": "1280,720"
-            })
-            
-            # 步骤2: 输入搜索关键词
-            self.add_step("ELEMENT_INPUT", {
-                "locator_strategy": "ID",
-                "locator_value": "kw",
-                "text_to_input": "Python 编程"
-            })
-            
-            # 步骤3: 点击搜索按钮
-            self.add_step("ELEMENT_CLICK", {
-                "locator_strategy": "ID",
-                "locator_value": "su"
-            })
-            
-            # 步骤4: 等待结果加载
-            self.add_step("LOG_MESSAGE", {
-                "message": "等待搜索结果加载..."
-            })
-            
-            # 步骤5: 截图保存结果
-            self.add_step("TAKE_SCREENSHOT", {
-                "save_path": "screenshots/search_results.png"
-            })
-            
-            # 步骤6: 记录完成日志
-            self.add_step("LOG_MESSAGE", {
-                "message": "基础演示完成"
-            })
+            # 批量添加流程步骤
+            self.extend_steps(_BASIC_DEMO_STEPS)
             
             return True
             
@@ -1254,63 +2403,8 @@ class FlowController:
             self.delete_flow(False)
             self.clear_variables()
             
-            # 步骤1: 打开浏览器访问百度
-            self.add_step("OPEN_BROWSER", {
-                "url": "https://www.baidu.com",
-                "browser_type": "Chrome",
-                "headless": "否",
-                "window_size": "1280,720"
-            })
-            
-            # 步骤2: 执行JS修改页面标题
-            self.add_step("EXECUTE_JAVASCRIPT", {
-                "js_code": "document.title = 'DrissionPage自动化工具 - 修改的标题'; return document.title;"
-            })
-            
-            # 步骤3: 记录日志
-            self.add_step("LOG_MESSAGE", {
-                "message": "已通过JavaScript修改页面标题"
-            })
-            
-            # 步骤4: 使用JS输入搜索关键词
-            self.add_step("EXECUTE_JAVASCRIPT", {
-                "js_code": "document.getElementById('kw').value = 'DrissionPage JavaScript自动化'; return true;"
-            })
-            
-            # 步骤5: 使用JS点击搜索按钮
-            self.add_step("EXECUTE_JAVASCRIPT", {
-                "js_code": "document.getElementById('su').click(); return true;"
-            })
-            
-            # 步骤6: 等待搜索结果加载
-            self.add_step("WAIT_SECONDS", {
-                "seconds": "3"
-            })
-            
-            # 步骤7: 使用JS获取搜索结果数量
-            self.add_step("EXECUTE_JAVASCRIPT", {
-                "js_code": "let results = document.querySelectorAll('#content_left .c-container'); return `找到 ${results.length} 个搜索结果`;"
-            })
-            
-            # 步骤8: 截图保存结果
-            self.add_step("TAKE_SCREENSHOT", {
-                "save_path": "screenshots/js_modified_page.png"
-            })
-            
-            # 步骤9: 使用JS修改页面样式
-            self.add_step("EXECUTE_JAVASCRIPT", {
-                "js_code": "document.body.style.backgroundColor = '#f0f8ff'; document.querySelectorAll('#content_left .c-container').forEach(item => { item.style.border = '2px solid #4682b4'; item.style.margin = '10px'; item.style.padding = '10px'; item.style.borderRadius = '8px'; item.style.backgroundColor = 'white'; }); return 'CSS样式已修改';"
-            })
-            
-            # 步骤10: 记录完成日志
-            self.add_step("LOG_MESSAGE", {
-                "message": "JavaScript演示完成"
-            })
-            
-            # 步骤11: 截图保存修改后的页面
-            self.add_step("TAKE_SCREENSHOT", {
-                "save_path": "screenshots/js_styled_page.png"
-            })
+            # 批量添加流程步骤
+            self.extend_steps(_JAVASCRIPT_DEMO_STEPS)
             
             return True
             
@@ -1339,18 +2433,22 @@ class FlowController:
         action_id = step.get("action_id")
         parameters = step.get("parameters", {})
         
-        # 处理变量表达式（如果有）
-        processed_parameters = self._variable_manager.process_parameter_variables(parameters)
+        # 处理变量表达式（如果有），无模板的步骤直接使用原参数
+        processed_parameters = parameters if self._is_template_free(step) else self._variable_manager.process_parameter_variables(parameters)
+        
+        if action_id in _VARIABLE_VALUE_PARAMS:
+            processed_parameters = self._bind_variable_value(action_id, processed_parameters)
         
         try:
             # 执行动作
             success, message = self._engine.execute_action(action_id, processed_parameters)
             
             # 检查是否为信息获取操作，如果是则保存结果到变量
-            if success and isinstance(message, dict) and "save_to_variable" in message:
-                variable_name = message["save_to_variable"]
-                if "info" in message:
-                    self._variable_manager.set_variable(variable_name, message["info"])
+            if success and isinstance(message, dict):
+                variable_name = message.get("save_to_variable", _MISSING)
+                info = _MISSING if variable_name is _MISSING else message.get("info", _MISSING)
+                if info is not _MISSING:
+                    self._variable_manager.set_variable(variable_name, info)
                     # 更新消息为更友好的提示
                     message = message.get("message", f"信息已保存到变量: {variable_name}")
             
@@ -1388,88 +2486,8 @@ class FlowController:
             # 创建流程需要的变量
             self.create_variable("test_url", "https://www.w3schools.com/html/html5_draganddrop.asp", "string", VariableScope.GLOBAL)
             
-            # 步骤1: 打开浏览器访问拖放测试页面
-            self.add_step("OPEN_BROWSER", {
-                "url": "${test_url}",
-                "browser_type": "Chrome",
-                "headless": "否",
-                "window_size": "1280,720"
-            })
-            
-            # 步骤2: 等待元素加载
-            self.add_step("WAIT_FOR_ELEMENT", {
-                "locator_strategy": "id",
-                "locator_value": "div1",
-                "timeout": 10
-            })
-            
-            # 记录日志
-            self.add_step("LOG_MESSAGE", {
-                "message": "准备演示拖放操作..."
-            })
-            
-            # 步骤3: 拖放操作
-            self.add_step("MOUSE_DRAG_DROP", {
-                "source_locator_strategy": "id",
-                "source_locator_value": "drag1",
-                "target_locator_strategy": "id",
-                "target_locator_value": "div2",
-                "smooth": "是",
-                "duration": 1.0
-            })
-            
-            # 记录日志
-            self.add_step("LOG_MESSAGE", {
-                "message": "拖放操作完成，准备进行双击操作"
-            })
-            
-            # 等待一下
-            self.add_step("WAIT_SECONDS", {
-                "seconds": "2"
-            })
-            
-            # 步骤4: 右键点击操作
-            self.add_step("MOUSE_RIGHT_CLICK", {
-                "locator_strategy": "id",
-                "locator_value": "div1",
-                "timeout": 10
-            })
-            
-            # 记录日志
-            self.add_step("LOG_MESSAGE", {
-                "message": "右键点击完成，准备演示鼠标轨迹移动"
-            })
-            
-            # 步骤5: 鼠标轨迹移动
-            self.add_step("MOUSE_MOVE_PATH", {
-                "path_points": "50,50;200,100;100,150;300,50",
-                "duration": 1.5,
-                "relative_to_element": "是",
-                "locator_strategy": "id",
-                "locator_value": "div1"
-            })
-            
-            # 记录日志
-            self.add_step("LOG_MESSAGE", {
-                "message": "鼠标轨迹移动完成，演示双击操作"
-            })
-            
-            # 等待一下
-            self.add_step("WAIT_SECONDS", {
-                "seconds": "1"
-            })
-            
-            # 步骤6: 双击操作
-            self.add_step("MOUSE_DOUBLE_CLICK", {
-                "locator_strategy": "id",
-                "locator_value": "div2",
-                "timeout": 10
-            })
-            
-            # 记录日志
-            self.add_step("LOG_MESSAGE", {
-                "message": "高级鼠标操作演示完成！"
-            })
+            # 批量添加流程步骤
+            self.extend_steps(_ADVANCED_MOUSE_DEMO_STEPS)
             
             # 流程创建成功
             self._flow_modified = True
@@ -1495,83 +2513,8 @@ class FlowController:
             # 创建流程需要的变量
             self.create_variable("log_content", "这是来自DrissionPage GUI工具的测试日志", "string", VariableScope.GLOBAL)
             
-            # 步骤1: 打开浏览器访问百度
-            self.add_step("OPEN_BROWSER", {
-                "url": "https://www.baidu.com",
-                "browser_type": "Chrome",
-                "headless": "否",
-                "window_size": "1280,720"
-            })
-            
-            # 步骤2: 启动控制台监听
-            self.add_step("GET_CONSOLE_LOGS", {
-                "mode": "start",
-                "save_to_variable": "console_logs"
-            })
-            
-            # 步骤3: 执行JavaScript输出到控制台
-            self.add_step("EXECUTE_JAVASCRIPT", {
-                "js_code": """
-console.log('控制台日志测试');
-console.warn('这是一条警告信息');
-console.error('这是一条错误信息');
-console.log('${log_content}');  // 使用变量
-return "JavaScript执行完成";
-"""
-            })
-            
-            # 步骤4: 等待一下确保日志输出
-            self.add_step("WAIT_SECONDS", {
-                "seconds": "1"
-            })
-            
-            # 步骤5: 获取所有控制台日志
-            self.add_step("GET_CONSOLE_LOGS", {
-                "mode": "all",
-                "save_to_variable": "all_console_logs"
-            })
-            
-            # 步骤6: 记录获取到的日志
-            self.add_step("LOG_MESSAGE", {
-                "message": "成功获取控制台日志: ${all_console_logs}",
-                "level": "INFO"
-            })
-            
-            # 步骤7: 清空控制台缓存
-            self.add_step("CLEAR_CONSOLE", {})
-            
-            # 步骤8: 使用组合方法执行JS并获取控制台输出
-            self.add_step("EXECUTE_JS_WITH_CONSOLE", {
-                "js_code": """
-// 输出多种类型的信息
-console.log('普通日志');
-console.info('信息日志');
-console.warn('警告日志');
-console.error('错误日志');
-console.log('包含变量: ' + 'DrissionPage');
-console.log({name: 'DrissionPage', type: 'Browser Automation'});
-return "组合方法执行完成";
-""",
-                "wait_timeout": "3",
-                "save_to_variable": "combined_output"
-            })
-            
-            # 步骤9: 记录组合方法的结果
-            self.add_step("LOG_MESSAGE", {
-                "message": "JS执行结果: {combined_output.info.js_result}, 控制台日志数量: {combined_output.info.logs_count}",
-                "level": "INFO"
-            })
-            
-            # 步骤10: 停止控制台监听
-            self.add_step("GET_CONSOLE_LOGS", {
-                "mode": "stop"
-            })
-            
-            # 步骤11: 记录完成
-            self.add_step("LOG_MESSAGE", {
-                "message": "控制台监听演示完成",
-                "level": "SUCCESS"
-            })
+            # 批量添加流程步骤
+            self.extend_steps(_CONSOLE_DEMO_STEPS)
             
             return True
             
@@ -1598,101 +2541,8 @@ return "组合方法执行完成";
                 {"name": "王五", "age": "20 ", "email": "invalid-email", "active": "yes"}
             ], "json", VariableScope.GLOBAL)
             
-            # 步骤1: 记录原始数据
-            self.add_step("LOG_MESSAGE", {
-                "message": "原始数据: {sample_data}",
-                "level": "INFO"
-            })
-            
-            # 步骤2: 数据清洗
-            self.add_step("CLEAN_DATA", {
-                "data_variable": "sample_data",
-                "cleaning_rules": """
-                {
-                    "name": [
-                        {"type": "trim"}
-                    ],
-                    "age": [
-                        {"type": "trim"},
-                        {"type": "cast", "to": "int"}
-                    ],
-                    "email": [
-                        {"type": "trim"},
-                        {"type": "lowercase"}
-                    ],
-                    "active": [
-                        {"type": "cast", "to": "bool"}
-                    ]
-                }
-                """,
-                "save_to_variable": "cleaned_data"
-            })
-            
-            # 步骤3: 记录清洗后的数据
-            self.add_step("LOG_MESSAGE", {
-                "message": "清洗后的数据: {cleaned_data}",
-                "level": "INFO"
-            })
-            
-            # 步骤4: 验证数据
-            self.add_step("VALIDATE_DATA", {
-                "data_variable": "cleaned_data",
-                "validation_rules": """
-                {
-                    "name": [
-                        {"type": "required", "message": "姓名是必填项"}
-                    ],
-                    "age": [
-                        {"type": "required", "message": "年龄是必填项"},
-                        {"type": "range", "min": 18, "max": 100, "message": "年龄必须在18-100之间"}
-                    ],
-                    "email": [
-                        {"type": "required", "message": "邮箱是必填项"},
-                        {"type": "regex", "pattern": "^[\\w.-]+@[\\w.-]+\\.[a-zA-Z]{2,}$", "message": "邮箱格式不正确"}
-                    ]
-                }
-                """,
-                "save_result_to_variable": "validation_result"
-            })
-            
-            # 步骤5: 记录验证结果
-            self.add_step("LOG_MESSAGE", {
-                "message": "验证结果: {validation_result}",
-                "level": "INFO"
-            })
-            
-            # 步骤6: 应用模板
-            self.add_step("APPLY_DATA_TEMPLATE", {
-                "data_variable": "cleaned_data",
-                "template": "姓名:{name}, 年龄:{age}岁, 邮箱:{email}, 是否活跃:{active}",
-                "save_to_variable": "formatted_data"
-            })
-            
-            # 步骤7: 记录格式化后的数据
-            self.add_step("LOG_MESSAGE", {
-                "message": "格式化后的数据: {formatted_data}",
-                "level": "INFO"
-            })
-            
-            # 步骤8: 生成数据统计
-            self.add_step("GENERATE_DATA_STATS", {
-                "data_variable": "cleaned_data",
-                "fields": "name,age,email,active",
-                "save_to_variable": "data_stats"
-            })
-            
-            # 步骤9: 记录统计结果
-            self.add_step("LOG_MESSAGE", {
-                "message": "数据统计: {data_stats}",
-                "level": "INFO"
-            })
-            
-            # 步骤10: 导出CSV
-            self.add_step("EXPORT_TO_CSV", {
-                "data_variable": "cleaned_data",
-                "file_path": "data_export.csv",
-                "encoding": "utf-8"
-            })
+            # 批量添加流程步骤
+            self.extend_steps(_DATA_PROCESSING_DEMO_STEPS)
             
             return True
             
@@ -1717,158 +2567,10 @@ return "组合方法执行完成";
                 {"name": "张三", "age": 25, "email": "user1@example.com"},
                 {"name": "李四", "age": 30, "email": "user2@example.com"},
                 {"name": "王五", "age": 20, "email": "user3@example.com"}
-            ], "json", VariableScope.GLOBAL)
-            
-            # 步骤1: 连接SQLite数据库
-            self.add_step("DB_CONNECT", {
-                "connection_id": "sqlite_demo",
-                "db_type": "sqlite",
-                "database_path": "demo_database.db"
-            })
-            
-            # 步骤2: 创建表
-            self.add_step("DB_EXECUTE_UPDATE", {
-                "connection_id": "sqlite_demo",
-                "query": """
-                CREATE TABLE IF NOT EXISTS users (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    age INTEGER,
-                    email TEXT
-                )
-                """,
-                "save_to_variable": "create_table_result"
-            })
-            
-            # 步骤3: 记录创建表结果
-            self.add_step("LOG_MESSAGE", {
-                "message": "创建表结果: {create_table_result}",
-                "level": "INFO"
-            })
-            
-            # 步骤4: 清空表数据
-            self.add_step("DB_EXECUTE_UPDATE", {
-                "connection_id": "sqlite_demo",
-                "query": "DELETE FROM users",
-                "save_to_variable": "clear_table_result"
-            })
-            
-            # 步骤5: 构建插入查询
-            self.add_step("DB_BUILD_INSERT", {
-                "table": "users",
-                "data": "{\"name\": \"张三\", \"age\": 25, \"email\": \"user1@example.com\"}",
-                "save_to_variable": "insert_query"
-            })
+            ], "list", VariableScope.GLOBAL)
             
-            # 步骤6: 记录构建的插入查询
-            self.add_step("LOG_MESSAGE", {
-                "message": "构建的插入查询: {insert_query}",
-                "level": "INFO"
-            })
-            
-            # 步骤7: 批量插入数据
-            self.add_step("FOREACH", {
-                "collection_variable": "user_data",
-                "item_variable": "user",
-                "index_variable": "index"
-            })
-            
-            # 步骤8: 构建每条数据的插入语句
-            self.add_step("DB_EXECUTE_UPDATE", {
-                "connection_id": "sqlite_demo",
-                "query": "INSERT INTO users (name, age, email) VALUES (:name, :age, :email)",
-                "parameters": "{\"name\": \"{user.name}\", \"age\": {user.age}, \"email\": \"{user.email}\"}",
-                "save_to_variable": "insert_result"
-            })
-            
-            # 步骤9: 记录插入结果
-            self.add_step("LOG_MESSAGE", {
-                "message": "插入第 {index} 条数据结果: {insert_result}",
-                "level": "INFO"
-            })
-            
-            # 步骤10: 结束循环
-            self.add_step("END_FOREACH", {})
-            
-            # 步骤11: 构建查询
-            self.add_step("DB_BUILD_SELECT", {
-                "table": "users",
-                "fields": "id,name,age,email",
-                "where_condition": "{\"age\": 25}",
-                "save_to_variable": "select_query"
-            })
-            
-            # 步骤12: 记录构建的查询
-            self.add_step("LOG_MESSAGE", {
-                "message": "构建的查询: {select_query}",
-                "level": "INFO"
-            })
-            
-            # 步骤13: 执行查询
-            self.add_step("DB_EXECUTE_QUERY", {
-                "connection_id": "sqlite_demo",
-                "query": "SELECT * FROM users",
-                "save_to_variable": "query_results"
-            })
-            
-            # 步骤14: 记录查询结果
-            self.add_step("LOG_MESSAGE", {
-                "message": "查询结果: {query_results}",
-                "level": "INFO"
-            })
-            
-            # 步骤15: 构建更新查询
-            self.add_step("DB_BUILD_UPDATE", {
-                "table": "users",
-                "data": "{\"age\": 26}",
-                "where_condition": "{\"name\": \"张三\"}",
-                "save_to_variable": "update_query"
-            })
-            
-            # 步骤16: 记录构建的更新查询
-            self.add_step("LOG_MESSAGE", {
-                "message": "构建的更新查询: {update_query}",
-                "level": "INFO"
-            })
-            
-            # 步骤17: 执行更新
-            self.add_step("DB_EXECUTE_UPDATE", {
-                "connection_id": "sqlite_demo",
-                "query": "UPDATE users SET age = :age WHERE name = :name",
-                "parameters": "{\"age\": 26, \"name\": \"张三\"}",
-                "save_to_variable": "update_result"
-            })
-            
-            # 步骤18: 记录更新结果
-            self.add_step("LOG_MESSAGE", {
-                "message": "更新结果: {update_result}",
-                "level": "INFO"
-            })
-            
-            # 步骤19: 再次查询结果
-            self.add_step("DB_EXECUTE_QUERY", {
-                "connection_id": "sqlite_demo",
-                "query": "SELECT * FROM users",
-                "save_to_variable": "updated_results"
-            })
-            
-            # 步骤20: 记录更新后的查询结果
-            self.add_step("LOG_MESSAGE", {
-                "message": "更新后的数据: {updated_results}",
-                "level": "INFO"
-            })
-            
-            # 步骤21: 导出结果到CSV
-            self.add_step("EXPORT_TO_CSV", {
-                "data_variable": "updated_results",
-                "file_path": "database_export.csv",
-                "encoding": "utf-8"
-            })
-            
-            # 步骤22: 断开数据库连接
-            self.add_step("DB_DISCONNECT", {
-                "connection_id": "sqlite_demo"
-            })
+            # 批量添加流程步骤
+            self.extend_steps(_DATABASE_DEMO_STEPS)
             
             return True
             
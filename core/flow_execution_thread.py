@@ -6,15 +6,13 @@
 """
 
 from PyQt5.QtCore import QThread, pyqtSignal
-from typing import Dict, Any, Optional, Callable, List
 
 class FlowExecutionThread(QThread):
     """
     用于后台执行流程的线程类
     """
     # 信号定义，用于通知UI更新
-    step_started = pyqtSignal(int, dict)  # step_index, step_data
-    step_completed = pyqtSignal(int, bool, str)  # step_index, success, message
+    steps_batch = pyqtSignal(object)  # [("started", step_index, step_data) 或 ("completed", step_index, success, message)]
     flow_completed = pyqtSignal(bool)  # success
     
     def __init__(self, flow_controller):
@@ -27,6 +25,9 @@ class FlowExecutionThread(QThread):
         super().__init__()
         self._flow_controller = flow_controller
         self._is_stopped = False
+        
+        # 尚未发送的步骤事件，流程控制器每派发一批回调后合并为一次 steps_batch 信号
+        self._pending_events = []
     
     def run(self):
         """
@@ -37,15 +38,17 @@ class FlowExecutionThread(QThread):
             self._flow_controller.execute_flow(
                 on_step_start=self._on_step_start,
                 on_step_complete=self._on_step_complete,
-                on_flow_complete=self._on_flow_complete
+                on_flow_complete=self._on_flow_complete,
+                on_events_flushed=self._flush_pending_events
             )
         except Exception as e:
-            # 发送执行失败信号
+            # 记录异常并发送执行失败信号，界面收到信号后取出日志显示
+            self._flow_controller.record_log("ERROR", f"流程执行异常: {str(e)}")
+            self._flush_pending_events()
             self.flow_completed.emit(False)
-            print(f"流程执行异常: {str(e)}")
         finally:
             # 确保流程控制器的执行状态被重置，无论执行成功还是失败
-            self._flow_controller._is_executing = False
+            self._flow_controller.finish_execution()
 
     def stop(self):
         """
@@ -54,9 +57,16 @@ class FlowExecutionThread(QThread):
         self._is_stopped = True
         self._flow_controller.stop_execution()
     
+    def _flush_pending_events(self):
+        """将累积的步骤事件作为一个批次发送"""
+        if self._pending_events:
+            events = self._pending_events
+            self._pending_events = []
+            self.steps_batch.emit(events)
+    
     def _on_step_start(self, step_index, step_data):
         """步骤开始执行回调"""
-        self.step_started.emit(step_index, step_data)
+        self._pending_events.append(("started", step_index, step_data))
     
     def _on_step_complete(self, step_index, success, message):
         """步骤完成回调"""
@@ -66,8 +76,9 @@ class FlowExecutionThread(QThread):
         elif isinstance(message, dict):
             message = str(message)
         
-        self.step_completed.emit(step_index, success, message)
+        self._pending_events.append(("completed", step_index, success, message))
     
     def _on_flow_complete(self, success):
         """流程完成回调"""
+        self._flush_pending_events()
         self.flow_completed.emit(success) 
\ No newline at end of file
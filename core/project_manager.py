@@ -6,48 +6,310 @@
 """
 
 import os
+import sys
 import json
+import threading
 import time
+from collections import OrderedDict
 from typing import Dict, List, Tuple, Any, Optional, Union
 
 from drission_gui_tool.common.constants import FLOW_FILE_EXTENSION
 
+# 可选使用 orjson 解析流程文件，未安装时使用标准库
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 读写流程文件时的缓冲区大小，减少大流程文件的系统调用次数
+_FILE_BUFFER_SIZE = 1 << 16
+
+# 本工具保存的流程文件带有该标记，加载时只需检查这一个键
+_FLOW_MARKER_KEY = "__dg__"
+_FLOW_MARKER_VERSION = 1
+
+# 未安装 orjson 时复用的JSON解码器
+_DECODER = json.JSONDecoder()
+
+# 保存流程使用的紧凑JSON编码器
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+# 步骤数达到该值的流程增量编码写入，避免整个JSON文本同时驻留内存
+_INCREMENTAL_SAVE_MIN_STEPS = 2000
+
+# 最近加载的流程文件：文件路径 -> (修改时间, 文件大小, 流程数据)，按访问顺序淘汰
+_LOAD_CACHE_SIZE = 16
+_load_cache = OrderedDict()
+_load_cache_lock = threading.Lock()
+
+# 导出脚本时，流程中出现这些动作才需要对应的导入或工具函数
+_REGEX_ACTIONS = frozenset(["ELEMENT_TEXT_MATCHES", "EXTRACT_TEXT_WITH_REGEX"])
+_PANDAS_ACTIONS = frozenset(["EXPORT_TABLE", "IMPORT_CSV", "IMPORT_EXCEL"])
+_WAIT_HELPER_ACTIONS = frozenset(["WAIT_FOR_ELEMENT", "WAIT_FOR_ELEMENT_VISIBLE"])
+_EXTRACT_HELPER_ACTIONS = frozenset(["EXTRACT_TEXT", "EXTRACT_ATTRIBUTE"])
+
+# 日志级别 -> 导出脚本中 logger 的方法名
+_LOG_LEVEL_MAP = {
+    "DEBUG": "debug",
+    "INFO": "info",
+    "WARNING": "warning",
+    "ERROR": "error",
+    "CRITICAL": "critical"
+}
+
+# 步骤代码在 main() 的 try 块中的缩进
+_STEP_INDENT = "        "
+
+# 导出脚本中固定不变的代码块，模块加载时拼接一次，导出时整块写入
+
+# 基础导入
+_SCRIPT_IMPORTS_SOURCE = "\n".join([
+    "from typing import Dict, Any, List, Tuple, Optional",
+    "import time",
+    "import os",
+    "import sys",
+    "import logging",
+    "",
+    "# DrissionPage相关导入",
+    "from DrissionPage import WebPage, ChromiumPage"
+]) + "\n"
+
+# 等待元素的工具函数
+_WAIT_HELPER_SOURCE = "\n".join([
+    "def wait_for_element(page, selector: str, selector_type: str = 'css', timeout: int = 10, visible: bool = False) -> bool:",
+    "    \"\"\"",
+    "    等待元素出现或可见",
+    "    ",
+    "    Args:",
+    "        page: 页面对象",
+    "        selector: 选择器",
+    "        selector_type: 选择器类型",
+    "        timeout: 超时时间（秒）",
+    "        visible: 是否等待元素可见",
+    "    ",
+    "    Returns:",
+    "        是否等待成功",
+    "    \"\"\"",
+    "    start_time = time.time()",
+    "    while time.time() - start_time < timeout:",
+    "        try:",
+    "            # 动态构建参数字典",
+    "            selector_dict = {selector_type: selector}",
+    "            element = page.ele(**selector_dict)",
+    "            if element:",
+    "                if not visible or element.is_displayed():",
+    "                    return True",
+    "            time.sleep(0.5)",
+    "        except Exception:",
+    "            time.sleep(0.5)",
+    "    return False",
+    ""
+]) + "\n"
+
+# 提取元素数据的工具函数
+_EXTRACT_HELPER_SOURCE = "\n".join([
+    "def extract_data_from_elements(page, selector: str, selector_type: str = 'css', extract_type: str = 'text', attribute_name: str = '') -> List[str]:",
+    "    \"\"\"",
+    "    从元素中提取数据",
+    "    ",
+    "    Args:",
+    "        page: 页面对象",
+    "        selector: 选择器",
+    "        selector_type: 选择器类型",
+    "        extract_type: 提取类型，可选值: 'text', 'attribute'",
+    "        attribute_name: 属性名称，当extract_type为'attribute'时使用",
+    "    ",
+    "    Returns:",
+    "        提取的数据列表",
+    "    \"\"\"",
+    "    result = []",
+    "    try:",
+    "        # 动态构建参数字典",
+    "        selector_dict = {selector_type: selector}",
+    "        elements = page.eles(**selector_dict)",
+    "        for element in elements:",
+    "            if extract_type == 'text':",
+    "                result.append(element.text)",
+    "            elif extract_type == 'attribute' and attribute_name:",
+    "                result.append(element.attr(attribute_name))",
+    "    except Exception as e:",
+    "        logging.error(f'提取数据失败: {e}')",
+    "    return result",
+    ""
+]) + "\n"
+
+# main() 中的日志设置
+_LOGGING_SETUP_SOURCE = "\n".join([
+    "    # 设置日志",
+    "    logging.basicConfig(",
+    "        level=logging.INFO,",
+    "        format='[%(asctime)s] [%(levelname)s] %(message)s',",
+    "        datefmt='%Y-%m-%d %H:%M:%S'",
+    "    )",
+    "    logger = logging.getLogger(__name__)",
+    ""
+]) + "\n"
+
+# main() 中的浏览器创建及步骤 try 块开头
+_BROWSER_SETUP_SOURCE = "\n".join([
+    "",
+    "    # 创建浏览器实例",
+    "    try:",
+    "        page = WebPage(timeout=20)",
+    "        page.set.timeouts(10, 10, 10)",
+    "    except Exception as e:",
+    "        logger.error(f'浏览器初始化失败: {e}')",
+    "        return False",
+    "",
+    "    # 执行流程步骤",
+    "    try:"
+]) + "\n"
+
+# main() 的结尾和脚本入口
+_MAIN_EPILOGUE_SOURCE = "\n".join([
+    "        # 关闭浏览器",
+    "        page.quit()",
+    "        logger.info('流程执行完成')",
+    "        return True",
+    "    except Exception as e:",
+    "        logger.error(f'流程执行失败: {e}')",
+    "        try:",
+    "            page.quit()",
+    "        except:",
+    "            pass",
+    "        return False",
+    "",
+    "if __name__ == '__main__':",
+    "    success = main()",
+    "    sys.exit(0 if success else 1)"
+]) + "\n"
+
+
+def _intern_action_ids(steps: Any) -> None:
+    """
+    将步骤中的动作ID替换为驻留字符串
+    
+    JSON解析得到的动作ID都是新建的字符串，驻留后相同ID共用一个对象，
+    按动作ID查表时可直接按对象身份命中，不必逐字符比较。
+    
+    Args:
+        steps: 流程步骤列表
+    """
+    if type(steps) is not list:
+        return
+    intern = sys.intern
+    for step in steps:
+        if type(step) is dict:
+            action_id = step.get("action_id")
+            if type(action_id) is str:
+                step["action_id"] = intern(action_id)
+
+
+def _contains_random(obj: Any) -> bool:
+    """
+    判断参数中是否出现 "random"
+    
+    递归检查字符串、字典的键和值以及序列元素，找到即返回，不必把整个参数转换成字符串。
+    
+    Args:
+        obj: 步骤参数或其中的值
+        
+    Returns:
+        是否包含 "random"
+    """
+    if isinstance(obj, str):
+        return "random" in obj
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if _contains_random(key) or _contains_random(value):
+                return True
+        return False
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            if _contains_random(item):
+                return True
+        return False
+    if obj is None or isinstance(obj, (bool, int, float)):
+        return False
+    # 其他类型的对象按字符串形式判断
+    return "random" in str(obj)
+
+
+def _open_for_write(file_path: str, mode: str = 'w', **kwargs: Any):
+    """
+    打开要写入的文件，所在目录不存在时创建后重试
+    
+    目录通常已经存在，直接打开即可，不必每次保存前先检查目录。
+    
+    Args:
+        file_path: 文件路径
+        mode: 打开模式，默认以文本方式写入
+        **kwargs: 传给 open 的其他参数
+        
+    Returns:
+        文件对象
+    """
+    try:
+        return open(file_path, mode, **kwargs)
+    except FileNotFoundError:
+        directory = os.path.dirname(file_path)
+        if not directory:
+            raise
+        os.makedirs(directory, exist_ok=True)
+        return open(file_path, mode, **kwargs)
+
+
 class ProjectManager:
     """
     项目管理器类，提供项目保存、加载和管理功能。
     """
     
     @staticmethod
-    def save_flow(file_path: str, flow_name: str, steps: List[Dict[str, Any]]) -> Tuple[bool, str]:
+    def save_flow(file_path: str, flow_name: str, steps: List[Dict[str, Any]],
+                  pretty: bool = False) -> Tuple[bool, str]:
         """
         保存流程到文件
         
+        默认写入紧凑的JSON，可使用C实现的编码器，大流程保存更快；需要人工查看文件时可传入 pretty=True。
+        
         Args:
             file_path: 文件路径
             flow_name: 流程名称
             steps: 流程步骤列表
+            pretty: 是否缩进格式化输出
             
         Returns:
             (成功标志, 消息)
         """
         try:
-            # 创建保存数据
+            # 创建保存数据，创建和更新时间取同一时刻
+            now = time.time()
             flow_data = {
+                _FLOW_MARKER_KEY: _FLOW_MARKER_VERSION,
                 "flow_name": flow_name,
                 "steps": steps,
-                "created_at": time.time(),
-                "updated_at": time.time(),
+                "created_at": now,
+                "updated_at": now,
                 "version": "1.0.0"
             }
             
-            # 确保目录存在
-            directory = os.path.dirname(file_path)
-            if directory and not os.path.exists(directory):
-                os.makedirs(directory)
-            
-            # 写入文件
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(flow_data, f, ensure_ascii=False, indent=2)
+            # 文件内容即将改变，丢弃缓存的加载结果
+            with _load_cache_lock:
+                _load_cache.pop(file_path, None)
+            
+            # 写入文件，目录不存在时自动创建
+            with _open_for_write(file_path, encoding='utf-8', buffering=_FILE_BUFFER_SIZE) as f:
+                if pretty:
+                    json.dump(flow_data, f, ensure_ascii=False, indent=2)
+                elif len(steps) >= _INCREMENTAL_SAVE_MIN_STEPS:
+                    # 步骤很多时逐块编码写入，内存中只保留当前块
+                    write = f.write
+                    for chunk in _COMPACT_ENCODER.iterencode(flow_data):
+                        write(chunk)
+                else:
+                    # 一次性编码可使用C实现的编码器
+                    f.write(_COMPACT_ENCODER.encode(flow_data))
             
             return True, f"流程已成功保存到: {file_path}"
             
@@ -59,6 +321,8 @@ class ProjectManager:
         """
         从文件加载流程
         
+        文件修改时间和大小未变时直接返回上次解析的结果，多次调用可能返回同一个对象，调用方不得修改。
+        
         Args:
             file_path: 文件路径
             
@@ -66,17 +330,44 @@ class ProjectManager:
             (成功标志, 流程数据或错误消息)
         """
         try:
-            # 检查文件是否存在
-            if not os.path.exists(file_path):
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
                 return False, f"文件不存在: {file_path}"
             
-            # 读取文件
-            with open(file_path, 'r', encoding='utf-8') as f:
-                flow_data = json.load(f)
+            # 文件未变化时使用缓存的结果
+            with _load_cache_lock:
+                cached = _load_cache.get(file_path)
+                if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                    _load_cache.move_to_end(file_path)
+                    return True, cached[2]
+            
+            # 以二进制方式一次读入
+            try:
+                with open(file_path, 'rb', buffering=_FILE_BUFFER_SIZE) as f:
+                    content = f.read()
+            except FileNotFoundError:
+                return False, f"文件不存在: {file_path}"
+            
+            # orjson 直接解析UTF-8字节，解析失败时抛出的异常也是 json.JSONDecodeError
+            if ORJSON_AVAILABLE:
+                flow_data = orjson.loads(content)
+            else:
+                flow_data = _DECODER.decode(content.decode('utf-8-sig'))
+            
+            # 带标记的文件由本工具保存，无需逐个验证字段；旧文件没有标记，仍验证必要字段
+            if type(flow_data) is not dict or flow_data.get(_FLOW_MARKER_KEY) != _FLOW_MARKER_VERSION:
+                if "flow_name" not in flow_data or "steps" not in flow_data:
+                    return False, "无效的流程文件格式: 缺少必要字段"
+            
+            if type(flow_data) is dict:
+                _intern_action_ids(flow_data.get("steps"))
             
-            # 验证必要字段
-            if "flow_name" not in flow_data or "steps" not in flow_data:
-                return False, "无效的流程文件格式: 缺少必要字段"
+            with _load_cache_lock:
+                _load_cache[file_path] = (stat.st_mtime_ns, stat.st_size, flow_data)
+                _load_cache.move_to_end(file_path)
+                if len(_load_cache) > _LOAD_CACHE_SIZE:
+                    _load_cache.popitem(last=False)
             
             return True, flow_data
             
@@ -102,215 +393,140 @@ class ProjectManager:
             flow_name = flow_data.get("flow_name", "未命名流程")
             steps = flow_data.get("steps", [])
             description = flow_data.get("description", "")
-            
-            # 生成Python脚本
-            python_code = [
-                "#!/usr/bin/env python3",
-                "# -*- coding: utf-8 -*-",
-                "",
-                f"# 自动生成的DrissionPage自动化脚本: {flow_name}",
-                f"# 生成时间: {time.strftime('%Y-%m-%d %H:%M:%S')}",
-                "",
-            ]
-            
-            # 添加详细说明（如果是verbose模式）
-            if code_style == "verbose":
-                python_code.extend([
-                    "#",
-                    "# 本脚本由DrissionPage自动化GUI工具生成",
-                    f"# 流程名称: {flow_name}",
-                    f"# 步骤数量: {len(steps)}",
-                    "#",
-                ])
-                
-                # 添加流程描述
-                if description:
-                    python_code.append("# 流程描述:")
-                    for line in description.split("\n"):
-                        python_code.append(f"# {line}")
-                    python_code.append("#")
-                
-            python_code.append("")
-            
-            # 添加导入语句
-            python_code.extend([
-                "from typing import Dict, Any, List, Tuple, Optional",
-                "import time",
-                "import os",
-                "import sys",
-                "import logging",
-                "",
-                "# DrissionPage相关导入",
-                "from DrissionPage import WebPage, ChromiumPage",
-            ])
-            
-            # 分析步骤，确定需要导入的其他模块
-            needs_regex = any(step.get("action_id") in ["ELEMENT_TEXT_MATCHES", "EXTRACT_TEXT_WITH_REGEX"] for step in steps)
-            needs_pandas = any(step.get("action_id") in ["EXPORT_TABLE", "IMPORT_CSV", "IMPORT_EXCEL"] for step in steps)
-            needs_random = any("random" in str(step.get("parameters", {})) for step in steps)
-            
-            if needs_regex:
-                python_code.append("import re")
-            
-            if needs_pandas:
-                python_code.append("import pandas as pd")
-            
-            if needs_random:
-                python_code.append("import random")
-                
-            python_code.append("")
-            
-            # 添加工具函数
-            if any(step.get("action_id") in ["WAIT_FOR_ELEMENT", "WAIT_FOR_ELEMENT_VISIBLE"] for step in steps):
-                python_code.extend([
-                    "def wait_for_element(page, selector: str, selector_type: str = 'css', timeout: int = 10, visible: bool = False) -> bool:",
-                    "    \"\"\"",
-                    "    等待元素出现或可见",
-                    "    ",
-                    "    Args:",
-                    "        page: 页面对象",
-                    "        selector: 选择器",
-                    "        selector_type: 选择器类型",
-                    "        timeout: 超时时间（秒）",
-                    "        visible: 是否等待元素可见",
-                    "    ",
-                    "    Returns:",
-                    "        是否等待成功",
-                    "    \"\"\"",
-                    "    start_time = time.time()",
-                    "    while time.time() - start_time < timeout:",
-                    "        try:",
-                    "            # 动态构建参数字典",
-                    "            selector_dict = {selector_type: selector}",
-                    "            element = page.ele(**selector_dict)",
-                    "            if element:",
-                    "                if not visible or element.is_displayed():",
-                    "                    return True",
-                    "            time.sleep(0.5)",
-                    "        except Exception:",
-                    "            time.sleep(0.5)",
-                    "    return False",
-                    ""
-                ])
-            
-            # 检查是否需要元素提取函数
-            if any(step.get("action_id") in ["EXTRACT_TEXT", "EXTRACT_ATTRIBUTE"] for step in steps):
-                python_code.extend([
-                    "def extract_data_from_elements(page, selector: str, selector_type: str = 'css', extract_type: str = 'text', attribute_name: str = '') -> List[str]:",
-                    "    \"\"\"",
-                    "    从元素中提取数据",
-                    "    ",
-                    "    Args:",
-                    "        page: 页面对象",
-                    "        selector: 选择器",
-                    "        selector_type: 选择器类型",
-                    "        extract_type: 提取类型，可选值: 'text', 'attribute'",
-                    "        attribute_name: 属性名称，当extract_type为'attribute'时使用",
-                    "    ",
-                    "    Returns:",
-                    "        提取的数据列表",
-                    "    \"\"\"",
-                    "    result = []",
-                    "    try:",
-                    "        # 动态构建参数字典",
-                    "        selector_dict = {selector_type: selector}",
-                    "        elements = page.eles(**selector_dict)",
-                    "        for element in elements:",
-                    "            if extract_type == 'text':",
-                    "                result.append(element.text)",
-                    "            elif extract_type == 'attribute' and attribute_name:",
-                    "                result.append(element.attr(attribute_name))",
-                    "    except Exception as e:",
-                    "        logging.error(f'提取数据失败: {e}')",
-                    "    return result",
-                    ""
-                ])
-            
-            # 主函数开始
-            python_code.append("def main():")
-            
-            # 函数文档字符串
-            if code_style in ["standard", "verbose"]:
-                python_code.extend([
-                    "    \"\"\"",
-                    f"    执行 '{flow_name}' 自动化流程",
-                    "    "
-                ])
-                
-                if code_style == "verbose":
-                    python_code.append("    流程包含以下步骤:")
+            step_count = len(steps)
+            generated_at = time.strftime('%Y-%m-%d %H:%M:%S')
+            
+            # 生成Python脚本，边生成边写入文件，目录不存在时自动创建
+            f = _open_for_write(file_path, encoding='utf-8', buffering=_FILE_BUFFER_SIZE)
+            try:
+                with f:
+                    write = f.write
+                    
+                    def write_line(line: str) -> None:
+                        write(line)
+                        write("\n")
+                    
+                    def write_lines(lines: List[str]) -> None:
+                        for line in lines:
+                            write(line)
+                            write("\n")
+                    
+                    write_lines([
+                        "#!/usr/bin/env python3",
+                        "# -*- coding: utf-8 -*-",
+                        "",
+                        f"# 自动生成的DrissionPage自动化脚本: {flow_name}",
+                        f"# 生成时间: {generated_at}",
+                        "",
+                    ])
+                    
+                    # 添加详细说明（如果是verbose模式）
+                    if code_style == "verbose":
+                        write_lines([
+                            "#",
+                            "# 本脚本由DrissionPage自动化GUI工具生成",
+                            f"# 流程名称: {flow_name}",
+                            f"# 步骤数量: {step_count}",
+                            "#",
+                        ])
+                        
+                        # 添加流程描述
+                        if description:
+                            write_line("# 流程描述:")
+                            for line in description.split("\n"):
+                                write_line(f"# {line}")
+                            write_line("#")
+                        
+                    write_line("")
+                    
+                    # 添加导入语句
+                    write(_SCRIPT_IMPORTS_SOURCE)
+                    
+                    # 分析步骤，一次遍历收集用到的动作，确定需要导入的其他模块和工具函数
+                    action_ids = set()
+                    needs_random = False
+                    for step in steps:
+                        action_ids.add(step.get("action_id"))
+                        if not needs_random and _contains_random(step.get("parameters")):
+                            needs_random = True
+                    
+                    needs_regex = not action_ids.isdisjoint(_REGEX_ACTIONS)
+                    needs_pandas = not action_ids.isdisjoint(_PANDAS_ACTIONS)
+                    
+                    if needs_regex:
+                        write_line("import re")
+                    
+                    if needs_pandas:
+                        write_line("import pandas as pd")
+                    
+                    if needs_random:
+                        write_line("import random")
+                        
+                    write_line("")
+                    
+                    # 添加工具函数
+                    if not action_ids.isdisjoint(_WAIT_HELPER_ACTIONS):
+                        write(_WAIT_HELPER_SOURCE)
+                    
+                    # 检查是否需要元素提取函数
+                    if not action_ids.isdisjoint(_EXTRACT_HELPER_ACTIONS):
+                        write(_EXTRACT_HELPER_SOURCE)
+                    
+                    # 主函数开始
+                    write_line("def main():")
+                    
+                    # 函数文档字符串
+                    if code_style in ["standard", "verbose"]:
+                        write_lines([
+                            "    \"\"\"",
+                            f"    执行 '{flow_name}' 自动化流程",
+                            "    "
+                        ])
+                        
+                        if code_style == "verbose":
+                            write_line("    流程包含以下步骤:")
+                            for i, step in enumerate(steps):
+                                action_id = step.get("action_id", "")
+                                parameters = step.get("parameters", {})
+                                step_name = parameters.get("__custom_step_name__", action_id)
+                                write_line(f"    - 步骤 {i+1}: {step_name}")
+                        
+                        write_lines([
+                            "    \"\"\"",
+                            ""
+                        ])
+                    
+                    # 设置日志
+                    write(_LOGGING_SETUP_SOURCE)
+                    write_line(f"    logger.info('开始执行流程: {flow_name}')")
+                    write(_BROWSER_SETUP_SOURCE)
+                    
+                    # 添加每个步骤的代码
                     for i, step in enumerate(steps):
                         action_id = step.get("action_id", "")
                         parameters = step.get("parameters", {})
+                        
+                        # 生成步骤注释
                         step_name = parameters.get("__custom_step_name__", action_id)
-                        python_code.append(f"    - 步骤 {i+1}: {step_name}")
-                
-                python_code.extend([
-                    "    \"\"\"",
-                    ""
-                ])
-            
-            # 设置日志
-            python_code.extend([
-                "    # 设置日志",
-                "    logging.basicConfig(",
-                "        level=logging.INFO,",
-                "        format='[%(asctime)s] [%(levelname)s] %(message)s',",
-                "        datefmt='%Y-%m-%d %H:%M:%S'",
-                "    )",
-                "    logger = logging.getLogger(__name__)",
-                "",
-                f"    logger.info('开始执行流程: {flow_name}')",
-                "",
-                "    # 创建浏览器实例",
-                "    try:",
-                "        page = WebPage(timeout=20)",
-                "        page.set.timeouts(10, 10, 10)",
-                "    except Exception as e:",
-                "        logger.error(f'浏览器初始化失败: {e}')",
-                "        return False",
-                "",
-                "    # 执行流程步骤",
-                "    try:",
-            ])
-            
-            # 添加每个步骤的代码
-            for i, step in enumerate(steps):
-                action_id = step.get("action_id", "")
-                parameters = step.get("parameters", {})
-                
-                # 生成步骤注释
-                step_name = parameters.get("__custom_step_name__", action_id)
-                python_code.append(f"        # 步骤 {i+1}: {step_name}")
-                
-                # 根据不同操作类型生成代码
-                code_lines = ProjectManager._generate_step_code(action_id, parameters, i, code_style)
-                python_code.extend([f"        {line}" for line in code_lines])
-                python_code.append("")
-            
-            # 结束代码
-            python_code.extend([
-                "        # 关闭浏览器",
-                "        page.quit()",
-                "        logger.info('流程执行完成')",
-                "        return True",
-                "    except Exception as e:",
-                "        logger.error(f'流程执行失败: {e}')",
-                "        try:",
-                "            page.quit()",
-                "        except:",
-                "            pass",
-                "        return False",
-                "",
-                "if __name__ == '__main__':",
-                "    success = main()",
-                "    sys.exit(0 if success else 1)",
-                ""
-            ])
-            
-            # 写入文件
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write("\n".join(python_code))
+                        write_line(f"        # 步骤 {i+1}: {step_name}")
+                        
+                        # 根据不同操作类型生成代码
+                        code_lines = ProjectManager._generate_step_code(action_id, parameters, i, code_style)
+                        for line in code_lines:
+                            write(_STEP_INDENT)
+                            write(line)
+                            write("\n")
+                        write_line("")
+                    
+                    # 结束代码
+                    write(_MAIN_EPILOGUE_SOURCE)
+            except Exception:
+                # 生成中途出错时删除写了一半的文件
+                try:
+                    os.remove(file_path)
+                except OSError:
+                    pass
+                raise
             
             return True, f"流程已成功导出为Python脚本: {file_path}"
             
@@ -331,223 +547,313 @@ class ProjectManager:
         Returns:
             代码行列表
         """
-        code_lines = []
-        
-        # 根据不同操作类型生成代码
-        if action_id == "PAGE_GET":
-            url = parameters.get("url", "")
-            code_lines.append(f"url = \"{url}\"")
-            code_lines.append("logger.info(f\"正在访问: {url}\")")
-            code_lines.append("page.get(url)")
-            
-        elif action_id == "OPEN_BROWSER":
-            url = parameters.get("url", "")
-            browser_type = parameters.get("browser_type", "Chrome")
-            headless = parameters.get("headless", False)
-            
-            if code_style == "verbose":
-                code_lines.append(f"# 打开浏览器访问: {url}")
-                
-            code_lines.append(f"url = \"{url}\"")
-            code_lines.append("logger.info(f\"正在打开浏览器访问: {url}\")")
-            
-            # 根据浏览器类型生成不同的初始化代码
-            if browser_type.lower() == "chrome":
-                code_lines.append(f"page = ChromiumPage(headless={str(headless).lower()})")
-            else:
-                code_lines.append(f"page = WebPage(headless={str(headless).lower()})")
-                
-            if url:
-                code_lines.append("page.get(url)")
-        
-        elif action_id == "ELEMENT_CLICK":
-            locator_strategy = parameters.get("locator_strategy", "css")
-            locator_value = parameters.get("locator_value", "")
-            
-            if code_style == "verbose":
-                code_lines.append(f"# 点击元素: {locator_strategy}='{locator_value}'")
-            
-            code_lines.append(f"# 构建选择器参数字典")
-            code_lines.append(f"selector_dict = {{'{locator_strategy}': '{locator_value}'}}")
-            code_lines.append(f"element = page.ele(**selector_dict)")
-            code_lines.append("element.click()")
-        
-        elif action_id == "ELEMENT_INPUT":
-            locator_strategy = parameters.get("locator_strategy", "css")
-            locator_value = parameters.get("locator_value", "")
-            text = parameters.get("text_to_input", "")
-            
-            if code_style == "verbose":
-                code_lines.append(f"# 输入文本: {locator_strategy}='{locator_value}'")
-            
-            code_lines.append(f"# 构建选择器参数字典")
-            code_lines.append(f"selector_dict = {{'{locator_strategy}': '{locator_value}'}}")
-            code_lines.append(f"element = page.ele(**selector_dict)")
-            code_lines.append(f"element.input(\"{text}\")")
-        
-        elif action_id == "WAIT" or action_id == "WAIT_SECONDS":
-            wait_time = parameters.get("wait_time", 1)
-            
-            if code_style == "verbose":
-                code_lines.append(f"# 等待 {wait_time} 秒")
-            
-            code_lines.append(f"time.sleep({wait_time})")
+        generator = _STEP_CODE_GENERATORS.get(action_id)
+        if generator is None:
+            # 默认代码
+            return [f"# 未实现的操作: {action_id}", "pass"]
         
-        elif action_id == "LOG_MESSAGE":
-            message = parameters.get("message", "")
-            level = parameters.get("level", "INFO").upper()
-            
-            log_level = {
-                "DEBUG": "debug",
-                "INFO": "info",
-                "WARNING": "warning",
-                "ERROR": "error",
-                "CRITICAL": "critical"
-            }.get(level, "info")
-            
-            code_lines.append(f"logger.{log_level}(\"{message}\")")
-            
-        elif action_id == "EXECUTE_JAVASCRIPT":
-            js_code = parameters.get("js_code", "")
-            variable_name = parameters.get("save_to_variable", "")
-            
-            if code_style == "verbose":
-                code_lines.append("# 执行JavaScript代码")
-                code_lines.append(f"# 代码: {js_code}")
-            
-            # 处理多行JavaScript代码
-            if "\n" in js_code:
-                code_lines.append(f"js_code = \"\"\"")
-                code_lines.append(f"{js_code}")
-                code_lines.append(f"\"\"\"")
-                
-                if variable_name:
-                    code_lines.append(f"{variable_name} = page.run_js(js_code)")
-                    code_lines.append(f"logger.info(f\"JavaScript执行结果已保存到变量: {variable_name}\")")
-                else:
-                    code_lines.append(f"page.run_js(js_code)")
-                    code_lines.append(f"logger.info(\"JavaScript代码已执行\")")
-            else:
-                # 单行JavaScript代码
-                if variable_name:
-                    code_lines.append(f"{variable_name} = page.run_js(\"{js_code}\")")
-                    code_lines.append(f"logger.info(f\"JavaScript执行结果已保存到变量: {variable_name}\")")
-                else:
-                    code_lines.append(f"page.run_js(\"{js_code}\")")
-                    code_lines.append(f"logger.info(\"JavaScript代码已执行\")")
+        return generator(action_id, parameters, step_index, code_style)
+
+
+def _get_locator(parameters: Dict[str, Any], strategy_key: str = "locator_strategy",
+                 value_key: str = "locator_value") -> Tuple[str, str]:
+    """
+    读取步骤参数中的元素定位方式和定位值
+    
+    Args:
+        parameters: 动作参数
+        strategy_key: 定位方式的参数名
+        value_key: 定位值的参数名
         
-        elif action_id == "TAKE_SCREENSHOT":
-            screenshot_path = parameters.get("screenshot_path", f"screenshot_{step_index}.png")
-            element_only = parameters.get("element_only", False)
-            
-            if element_only:
-                locator_strategy = parameters.get("locator_strategy", "css")
-                locator_value = parameters.get("locator_value", "")
-                
-                if code_style == "verbose":
-                    code_lines.append(f"# 对元素截图: {locator_strategy}='{locator_value}'")
-                
-                code_lines.append(f"# 构建选择器参数字典并定位元素")
-                code_lines.append(f"selector_dict = {{'{locator_strategy}': '{locator_value}'}}")
-                code_lines.append(f"element = page.ele(**selector_dict)")
-                code_lines.append(f"element.screenshot(path='{screenshot_path}')")
-            else:
-                if code_style == "verbose":
-                    code_lines.append("# 对页面截图")
-                
-                code_lines.append(f"page.get_screenshot(path='{screenshot_path}')")
-            
-            code_lines.append(f"logger.info(f\"截图已保存到: {screenshot_path}\")")
+    Returns:
+        (定位方式, 定位值)，默认为 ("css", "")
+    """
+    get = parameters.get
+    return get(strategy_key, "css"), get(value_key, "")
+
+
+# 各动作的代码生成函数，签名为 (动作ID, 动作参数, 步骤索引, 代码风格) -> 代码行列表
+#
+# 注意：不要用 numba.jit 等方式编译 export_to_script 和这些代码生成函数。它们几乎全是字符串
+# 拼接，只能运行在 Numba 的 object 模式下，反而比解释器慢（见 numba/numba#2585）。
+# 导出性能应从分派和文件写入入手。
+
+def _generate_page_get_code(action_id: str, parameters: Dict[str, Any], step_index: int, code_style: str) -> List[str]:
+    """PAGE_GET：访问网址"""
+    url = parameters.get("url", "")
+    return [
+        f"url = \"{url}\"",
+        "logger.info(f\"正在访问: {url}\")",
+        "page.get(url)"
+    ]
+
+
+def _generate_open_browser_code(action_id: str, parameters: Dict[str, Any], step_index: int, code_style: str) -> List[str]:
+    """OPEN_BROWSER：打开浏览器并访问网址"""
+    code_lines = []
+    url = parameters.get("url", "")
+    browser_type = parameters.get("browser_type", "Chrome")
+    headless = parameters.get("headless", False)
+    
+    if code_style == "verbose":
+        code_lines.append(f"# 打开浏览器访问: {url}")
         
-        elif action_id == "CLOSE_BROWSER":
-            if code_style == "verbose":
-                code_lines.append("# 关闭浏览器")
-            
-            code_lines.append("page.quit()")
-            code_lines.append("logger.info(\"浏览器已关闭\")")
+    code_lines.append(f"url = \"{url}\"")
+    code_lines.append("logger.info(f\"正在打开浏览器访问: {url}\")")
+    
+    # 根据浏览器类型生成不同的初始化代码
+    if browser_type.lower() == "chrome":
+        code_lines.append(f"page = ChromiumPage(headless={str(headless).lower()})")
+    else:
+        code_lines.append(f"page = WebPage(headless={str(headless).lower()})")
         
-        elif action_id in ["IF_CONDITION", "ELSE_CONDITION", "END_IF_CONDITION"]:
-            # 处理条件语句
-            if action_id == "IF_CONDITION":
-                condition_type = parameters.get("condition_type", "")
-                if condition_type == "element_exists":
-                    locator_strategy = parameters.get("if_locator_strategy", "css")
-                    locator_value = parameters.get("if_locator_value", "")
-                    code_lines.append(f"# 检查元素是否存在: {locator_strategy}='{locator_value}'")
-                    code_lines.append(f"selector_dict = {{'{locator_strategy}': '{locator_value}', 'timeout': 0.5}}")
-                    code_lines.append(f"if page.ele(**selector_dict):")
-                elif condition_type == "element_visible":
-                    locator_strategy = parameters.get("if_locator_strategy", "css")
-                    locator_value = parameters.get("if_locator_value", "")
-                    code_lines.append(f"# 检查元素是否可见: {locator_strategy}='{locator_value}'")
-                    code_lines.append(f"selector_dict = {{'{locator_strategy}': '{locator_value}', 'timeout': 0.5}}")
-                    code_lines.append(f"element = page.ele(**selector_dict)")
-                    code_lines.append("if element and element.is_displayed():")
-                else:
-                    code_lines.append("# 条件判断")
-                    code_lines.append("if True:  # 请根据实际条件修改")
-            elif action_id == "ELSE_CONDITION":
-                code_lines.append("else:")
-            elif action_id == "END_IF_CONDITION":
-                code_lines.append("# 条件判断结束")
+    if url:
+        code_lines.append("page.get(url)")
+    
+    return code_lines
+
+
+def _generate_element_click_code(action_id: str, parameters: Dict[str, Any], step_index: int, code_style: str) -> List[str]:
+    """ELEMENT_CLICK：点击元素"""
+    code_lines = []
+    locator_strategy, locator_value = _get_locator(parameters)
+    
+    if code_style == "verbose":
+        code_lines.append(f"# 点击元素: {locator_strategy}='{locator_value}'")
+    
+    code_lines.append(f"# 构建选择器参数字典")
+    code_lines.append(f"selector_dict = {{'{locator_strategy}': '{locator_value}'}}")
+    code_lines.append(f"element = page.ele(**selector_dict)")
+    code_lines.append("element.click()")
+    return code_lines
+
+
+def _generate_element_input_code(action_id: str, parameters: Dict[str, Any], step_index: int, code_style: str) -> List[str]:
+    """ELEMENT_INPUT：向元素输入文本"""
+    code_lines = []
+    locator_strategy, locator_value = _get_locator(parameters)
+    text = parameters.get("text_to_input", "")
+    
+    if code_style == "verbose":
+        code_lines.append(f"# 输入文本: {locator_strategy}='{locator_value}'")
+    
+    code_lines.append(f"# 构建选择器参数字典")
+    code_lines.append(f"selector_dict = {{'{locator_strategy}': '{locator_value}'}}")
+    code_lines.append(f"element = page.ele(**selector_dict)")
+    code_lines.append(f"element.input(\"{text}\")")
+    return code_lines
+
+
+def _generate_wait_code(action_id: str, parameters: Dict[str, Any], step_index: int, code_style: str) -> List[str]:
+    """WAIT / WAIT_SECONDS：固定等待"""
+    code_lines = []
+    wait_time = parameters.get("wait_time", 1)
+    
+    if code_style == "verbose":
+        code_lines.append(f"# 等待 {wait_time} 秒")
+    
+    code_lines.append(f"time.sleep({wait_time})")
+    return code_lines
+
+
+def _generate_log_message_code(action_id: str, parameters: Dict[str, Any], step_index: int, code_style: str) -> List[str]:
+    """LOG_MESSAGE：输出日志"""
+    message = parameters.get("message", "")
+    level = parameters.get("level", "INFO").upper()
+    
+    log_level = _LOG_LEVEL_MAP.get(level, "info")
+    
+    return [f"logger.{log_level}(\"{message}\")"]
+
+
+def _generate_execute_javascript_code(action_id: str, parameters: Dict[str, Any], step_index: int, code_style: str) -> List[str]:
+    """EXECUTE_JAVASCRIPT：执行JavaScript代码"""
+    code_lines = []
+    js_code = parameters.get("js_code", "")
+    variable_name = parameters.get("save_to_variable", "")
+    
+    if code_style == "verbose":
+        code_lines.append("# 执行JavaScript代码")
+        code_lines.append(f"# 代码: {js_code}")
+    
+    # 处理多行JavaScript代码
+    if "\n" in js_code:
+        code_lines.append(f"js_code = \"\"\"")
+        code_lines.append(f"{js_code}")
+        code_lines.append(f"\"\"\"")
         
-        elif action_id in ["START_LOOP", "END_LOOP"]:
-            # 处理循环
-            if action_id == "START_LOOP":
-                loop_count = parameters.get("loop_count", 1)
-                code_lines.append(f"# 开始循环 {loop_count} 次")
-                code_lines.append(f"for iteration in range({loop_count}):")
-            elif action_id == "END_LOOP":
-                code_lines.append("# 循环结束")
+        if variable_name:
+            code_lines.append(f"{variable_name} = page.run_js(js_code)")
+            code_lines.append(f"logger.info(f\"JavaScript执行结果已保存到变量: {variable_name}\")")
+        else:
+            code_lines.append(f"page.run_js(js_code)")
+            code_lines.append(f"logger.info(\"JavaScript代码已执行\")")
+    else:
+        # 单行JavaScript代码
+        if variable_name:
+            code_lines.append(f"{variable_name} = page.run_js(\"{js_code}\")")
+            code_lines.append(f"logger.info(f\"JavaScript执行结果已保存到变量: {variable_name}\")")
+        else:
+            code_lines.append(f"page.run_js(\"{js_code}\")")
+            code_lines.append(f"logger.info(\"JavaScript代码已执行\")")
+    
+    return code_lines
+
+
+def _generate_take_screenshot_code(action_id: str, parameters: Dict[str, Any], step_index: int, code_style: str) -> List[str]:
+    """TAKE_SCREENSHOT：页面或元素截图"""
+    code_lines = []
+    screenshot_path = parameters.get("screenshot_path", f"screenshot_{step_index}.png")
+    element_only = parameters.get("element_only", False)
+    
+    if element_only:
+        locator_strategy, locator_value = _get_locator(parameters)
         
-        elif action_id == "SET_VARIABLE":
-            var_name = parameters.get("variable_name", "")
-            var_value = parameters.get("variable_value", "")
-            if isinstance(var_value, str):
-                var_value = f'"{var_value}"'
-            code_lines.append(f"# 设置变量 {var_name}")
-            code_lines.append(f"{var_name} = {var_value}")
+        if code_style == "verbose":
+            code_lines.append(f"# 对元素截图: {locator_strategy}='{locator_value}'")
         
-        elif action_id == "PAGE_REFRESH":
-            if code_style == "verbose":
-                code_lines.append("# 刷新页面")
-            
-            code_lines.append("page.refresh()")
-            code_lines.append("logger.info(\"页面已刷新\")")
-            
-        elif action_id == "WAIT_FOR_ELEMENT" or action_id == "WAIT_FOR_ELEMENT_VISIBLE":
-            locator_strategy = parameters.get("locator_strategy", "css")
-            locator_value = parameters.get("locator_value", "")
-            timeout = parameters.get("timeout", 10)
-            visible = action_id == "WAIT_FOR_ELEMENT_VISIBLE"
-            
-            code_lines.append(f"# 等待元素{'可见' if visible else '存在'}: {locator_strategy}='{locator_value}'")
-            code_lines.append(f"wait_success = wait_for_element(page, '{locator_value}', '{locator_strategy}', {timeout}, {str(visible).lower()})")
-            code_lines.append(f"if wait_success:")
-            code_lines.append(f"    logger.info(\"元素{'可见' if visible else '存在'}\")")
-            code_lines.append(f"else:")
-            code_lines.append(f"    logger.warning(\"等待元素{'可见' if visible else '存在'}超时\")")
-            
-        elif action_id == "EXTRACT_TEXT" or action_id == "EXTRACT_ATTRIBUTE":
-            locator_strategy = parameters.get("locator_strategy", "css")
-            locator_value = parameters.get("locator_value", "")
-            variable_name = parameters.get("save_to_variable", "result_data")
-            
-            if action_id == "EXTRACT_TEXT":
-                extract_type = "text"
-                attribute_name = ""
-                code_lines.append(f"# 提取元素文本: {locator_strategy}='{locator_value}'")
-            else:
-                extract_type = "attribute"
-                attribute_name = parameters.get("attribute_name", "")
-                code_lines.append(f"# 提取元素属性 {attribute_name}: {locator_strategy}='{locator_value}'")
-                
-            code_lines.append(f"{variable_name} = extract_data_from_elements(page, '{locator_value}', '{locator_strategy}', '{extract_type}', '{attribute_name}')")
-            code_lines.append(f"logger.info(f\"提取的数据数量: {{len({variable_name})}}\")")
+        code_lines.append(f"# 构建选择器参数字典并定位元素")
+        code_lines.append(f"selector_dict = {{'{locator_strategy}': '{locator_value}'}}")
+        code_lines.append(f"element = page.ele(**selector_dict)")
+        code_lines.append(f"element.screenshot(path='{screenshot_path}')")
+    else:
+        if code_style == "verbose":
+            code_lines.append("# 对页面截图")
         
+        code_lines.append(f"page.get_screenshot(path='{screenshot_path}')")
+    
+    code_lines.append(f"logger.info(f\"截图已保存到: {screenshot_path}\")")
+    return code_lines
+
+
+def _generate_close_browser_code(action_id: str, parameters: Dict[str, Any], step_index: int, code_style: str) -> List[str]:
+    """CLOSE_BROWSER：关闭浏览器"""
+    code_lines = []
+    if code_style == "verbose":
+        code_lines.append("# 关闭浏览器")
+    
+    code_lines.append("page.quit()")
+    code_lines.append("logger.info(\"浏览器已关闭\")")
+    return code_lines
+
+
+def _generate_condition_code(action_id: str, parameters: Dict[str, Any], step_index: int, code_style: str) -> List[str]:
+    """IF_CONDITION / ELSE_CONDITION / END_IF_CONDITION：条件语句"""
+    code_lines = []
+    if action_id == "IF_CONDITION":
+        condition_type = parameters.get("condition_type", "")
+        if condition_type == "element_exists":
+            locator_strategy, locator_value = _get_locator(parameters, "if_locator_strategy", "if_locator_value")
+            code_lines.append(f"# 检查元素是否存在: {locator_strategy}='{locator_value}'")
+            code_lines.append(f"selector_dict = {{'{locator_strategy}': '{locator_value}', 'timeout': 0.5}}")
+            code_lines.append(f"if page.ele(**selector_dict):")
+        elif condition_type == "element_visible":
+            locator_strategy, locator_value = _get_locator(parameters, "if_locator_strategy", "if_locator_value")
+            code_lines.append(f"# 检查元素是否可见: {locator_strategy}='{locator_value}'")
+            code_lines.append(f"selector_dict = {{'{locator_strategy}': '{locator_value}', 'timeout': 0.5}}")
+            code_lines.append(f"element = page.ele(**selector_dict)")
+            code_lines.append("if element and element.is_displayed():")
         else:
-            # 默认代码
-            code_lines.append(f"# 未实现的操作: {action_id}")
-            code_lines.append("pass")
+            code_lines.append("# 条件判断")
+            code_lines.append("if True:  # 请根据实际条件修改")
+    elif action_id == "ELSE_CONDITION":
+        code_lines.append("else:")
+    else:
+        code_lines.append("# 条件判断结束")
+    return code_lines
+
+
+def _generate_loop_code(action_id: str, parameters: Dict[str, Any], step_index: int, code_style: str) -> List[str]:
+    """START_LOOP / END_LOOP：固定次数循环"""
+    if action_id == "START_LOOP":
+        loop_count = parameters.get("loop_count", 1)
+        return [
+            f"# 开始循环 {loop_count} 次",
+            f"for iteration in range({loop_count}):"
+        ]
+    return ["# 循环结束"]
+
+
+def _generate_set_variable_code(action_id: str, parameters: Dict[str, Any], step_index: int, code_style: str) -> List[str]:
+    """SET_VARIABLE：设置变量"""
+    var_name = parameters.get("variable_name", "")
+    var_value = parameters.get("variable_value", "")
+    if isinstance(var_value, str):
+        var_value = f'"{var_value}"'
+    return [
+        f"# 设置变量 {var_name}",
+        f"{var_name} = {var_value}"
+    ]
+
+
+def _generate_page_refresh_code(action_id: str, parameters: Dict[str, Any], step_index: int, code_style: str) -> List[str]:
+    """PAGE_REFRESH：刷新页面"""
+    code_lines = []
+    if code_style == "verbose":
+        code_lines.append("# 刷新页面")
+    
+    code_lines.append("page.refresh()")
+    code_lines.append("logger.info(\"页面已刷新\")")
+    return code_lines
+
+
+def _generate_wait_for_element_code(action_id: str, parameters: Dict[str, Any], step_index: int, code_style: str) -> List[str]:
+    """WAIT_FOR_ELEMENT / WAIT_FOR_ELEMENT_VISIBLE：等待元素出现或可见"""
+    locator_strategy, locator_value = _get_locator(parameters)
+    timeout = parameters.get("timeout", 10)
+    visible = action_id == "WAIT_FOR_ELEMENT_VISIBLE"
+    
+    return [
+        f"# 等待元素{'可见' if visible else '存在'}: {locator_strategy}='{locator_value}'",
+        f"wait_success = wait_for_element(page, '{locator_value}', '{locator_strategy}', {timeout}, {str(visible).lower()})",
+        f"if wait_success:",
+        f"    logger.info(\"元素{'可见' if visible else '存在'}\")",
+        f"else:",
+        f"    logger.warning(\"等待元素{'可见' if visible else '存在'}超时\")"
+    ]
+
+
+def _generate_extract_code(action_id: str, parameters: Dict[str, Any], step_index: int, code_style: str) -> List[str]:
+    """EXTRACT_TEXT / EXTRACT_ATTRIBUTE：提取元素文本或属性"""
+    code_lines = []
+    locator_strategy, locator_value = _get_locator(parameters)
+    variable_name = parameters.get("save_to_variable", "result_data")
+    
+    if action_id == "EXTRACT_TEXT":
+        extract_type = "text"
+        attribute_name = ""
+        code_lines.append(f"# 提取元素文本: {locator_strategy}='{locator_value}'")
+    else:
+        extract_type = "attribute"
+        attribute_name = parameters.get("attribute_name", "")
+        code_lines.append(f"# 提取元素属性 {attribute_name}: {locator_strategy}='{locator_value}'")
         
-        return code_lines
+    code_lines.append(f"{variable_name} = extract_data_from_elements(page, '{locator_value}', '{locator_strategy}', '{extract_type}', '{attribute_name}')")
+    code_lines.append(f"logger.info(f\"提取的数据数量: {{len({variable_name})}}\")")
+    return code_lines
+
+
+# 动作ID -> 代码生成函数
+_STEP_CODE_GENERATORS = {
+    "PAGE_GET": _generate_page_get_code,
+    "OPEN_BROWSER": _generate_open_browser_code,
+    "ELEMENT_CLICK": _generate_element_click_code,
+    "ELEMENT_INPUT": _generate_element_input_code,
+    "WAIT": _generate_wait_code,
+    "WAIT_SECONDS": _generate_wait_code,
+    "LOG_MESSAGE": _generate_log_message_code,
+    "EXECUTE_JAVASCRIPT": _generate_execute_javascript_code,
+    "TAKE_SCREENSHOT": _generate_take_screenshot_code,
+    "CLOSE_BROWSER": _generate_close_browser_code,
+    "IF_CONDITION": _generate_condition_code,
+    "ELSE_CONDITION": _generate_condition_code,
+    "END_IF_CONDITION": _generate_condition_code,
+    "START_LOOP": _generate_loop_code,
+    "END_LOOP": _generate_loop_code,
+    "SET_VARIABLE": _generate_set_variable_code,
+    "PAGE_REFRESH": _generate_page_refresh_code,
+    "WAIT_FOR_ELEMENT": _generate_wait_for_element_code,
+    "WAIT_FOR_ELEMENT_VISIBLE": _generate_wait_for_element_code,
+    "EXTRACT_TEXT": _generate_extract_code,
+    "EXTRACT_ATTRIBUTE": _generate_extract_code,
+}
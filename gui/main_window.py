@@ -669,8 +669,9 @@ class MainWindow(QMainWindow):
         
         # 更新控制器
         self._flow_controller.create_new_flow(result["flow_name"])
-        for step in result["steps"]:
-            self._flow_controller.add_step(step["action_id"], step["parameters"])
+        self._flow_controller.extend_steps(
+            (step["action_id"], step["parameters"]) for step in result["steps"]
+        )
         
         # 更新UI状态
         self._current_file_path = file_path
@@ -846,8 +847,7 @@ class MainWindow(QMainWindow):
         self._execution_thread = FlowExecutionThread(self._flow_controller)
         
         # 连接线程信号到槽函数
-        self._execution_thread.step_started.connect(self._on_step_execution_start)
-        self._execution_thread.step_completed.connect(self._on_step_execution_complete)
+        self._execution_thread.steps_batch.connect(self._on_step_execution_batch)
         self._execution_thread.flow_completed.connect(self._on_flow_execution_complete)
         
         # 启动线程
@@ -872,6 +872,20 @@ class MainWindow(QMainWindow):
         # 如果没有执行线程在运行，提示用户
         self.log_display_widget.add_message("当前没有正在执行的流程")
     
+    def _on_step_execution_batch(self, events):
+        """批量处理执行线程合并发送的步骤事件，整批处理完后再刷新界面"""
+        self.flow_view_widget.setUpdatesEnabled(False)
+        self.log_display_widget.setUpdatesEnabled(False)
+        try:
+            for event in events:
+                if event[0] == "started":
+                    self._on_step_execution_start(event[1], event[2])
+                else:
+                    self._on_step_execution_complete(event[1], event[2], event[3])
+        finally:
+            self.log_display_widget.setUpdatesEnabled(True)
+            self.flow_view_widget.setUpdatesEnabled(True)
+    
     def _on_step_execution_start(self, step_index, step_data):
         """步骤开始执行回调"""
         action_id = step_data.get("action_id", "")
@@ -917,6 +931,10 @@ class MainWindow(QMainWindow):
         self.parameter_panel.setEnabled(True)
         self.flow_view_widget.setEnabled(True)
         
+        # 显示执行线程记录的日志
+        for level, _, message in self._flow_controller.drain_logs():
+            self.log_display_widget.add_message(message, level=level)
+        
         # 显示执行结果
         if success:
             self.log_display_widget.add_success("流程执行完成")
@@ -944,6 +944,82 @@ ACTION_DEFINITIONS = {
                     }
                 ]
             },
+            "DB_EXECUTE_MANY": {
+                "display_text": "批量执行数据库更新",
+                "parameter_schema": [
+                    {
+                        "name": "connection_id",
+                        "label": "连接标识:",
+                        "type": "string",
+                        "default_value": "default",
+                        "tooltip": "数据库连接标识"
+                    },
+                    {
+                        "name": "query",
+                        "label": "SQL更新:",
+                        "type": "multiline",
+                        "default_value": "INSERT INTO users (name, age) VALUES (:name, :age)",
+                        "tooltip": "SQL更新语句，每行参数绑定到同一条语句"
+                    },
+                    {
+                        "name": "rows_variable",
+                        "label": "行参数变量名:",
+                        "type": "string",
+                        "default_value": "user_data",
+                        "tooltip": "保存行参数列表的变量名，填写后忽略下方的批量参数"
+                    },
+                    {
+                        "name": "parameters",
+                        "label": "批量参数(JSON数组):",
+                        "type": "multiline",
+                        "default_value": "",
+                        "tooltip": "JSON数组格式的行参数，未指定行参数变量时使用"
+                    },
+                    {
+                        "name": "save_to_variable",
+                        "label": "结果变量名:",
+                        "type": "string",
+                        "default_value": "affected_rows",
+                        "tooltip": "保存受影响行数的变量名"
+                    }
+                ]
+            },
+            "DB_BEGIN_TRANSACTION": {
+                "display_text": "开始事务",
+                "parameter_schema": [
+                    {
+                        "name": "connection_id",
+                        "label": "连接标识:",
+                        "type": "string",
+                        "default_value": "default",
+                        "tooltip": "数据库连接标识"
+                    }
+                ]
+            },
+            "DB_COMMIT": {
+                "display_text": "提交事务",
+                "parameter_schema": [
+                    {
+                        "name": "connection_id",
+                        "label": "连接标识:",
+                        "type": "string",
+                        "default_value": "default",
+                        "tooltip": "数据库连接标识"
+                    }
+                ]
+            },
+            "DB_ROLLBACK": {
+                "display_text": "回滚事务",
+                "parameter_schema": [
+                    {
+                        "name": "connection_id",
+                        "label": "连接标识:",
+                        "type": "string",
+                        "default_value": "default",
+                        "tooltip": "数据库连接标识"
+                    }
+                ]
+            },
             "DB_BUILD_SELECT": {
                 "display_text": "构建SELECT查询",
                 "parameter_schema": [
@@ -324,6 +324,7 @@ class FlowViewWidget(QTableWidget):
             "DB_EXECUTE": "执行SQL",
             "DB_EXECUTE_QUERY": "执行数据库查询",
             "DB_EXECUTE_UPDATE": "执行数据库更新",
+            "DB_EXECUTE_MANY": "批量执行数据库更新",
             "DB_QUERY": "查询数据库",
             "DB_INSERT": "插入数据",
             "DB_UPDATE": "更新数据",